@@ -0,0 +1,413 @@
+"""In-process API benchmark.
+
+Loads a synthetic dataset into the app's in-memory store, drives every
+endpoint through the ASGI app with httpx (no network) and writes throughput
+and latency percentiles as JSON. The live workout WebSocket, which httpx
+cannot open, is driven over ASGI messages directly; each measured call is
+one set event's round trip to its acknowledgement.
+
+    cd backend
+    python -m benchmarks.run --scale 1k --output results.json
+    python -m benchmarks.run --scale 1k --compare results.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+
+import httpx
+
+# Make the app package importable when run from the backend directory
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from app import store  # noqa: E402
+from app.main import app  # noqa: E402
+from app.mock_data import MOCK_EXERCISES, WORKOUT_TEMPLATES  # noqa: E402
+
+from .synthetic import SCALES, Scale, generate_workouts  # noqa: E402
+
+# Default relative slowdown in p95 latency reported as a regression
+REGRESSION_THRESHOLD = 0.10
+
+# Result name of the live workout WebSocket, measured by run_live_scenario
+LIVE_SCENARIO = "WS /api/workouts/{id}/live"
+
+
+@dataclass
+class Scenario:
+    """One endpoint call; ``request`` builds (method, url, body) per iteration.
+
+    A dict body is sent as JSON, bytes are sent as they are.
+    """
+
+    name: str
+    request: Callable[[int], tuple[str, str, dict | bytes | None]]
+    # Destructive scenarios skip warm-up so every measured call hits a live record
+    warmup: bool = True
+
+
+def build_scenarios(workout_ids: list[str]) -> list[Scenario]:
+    """A scenario for every HTTP route in ``routes.py``"""
+
+    def get(url: str) -> Callable[[int], tuple[str, str, None]]:
+        return lambda _: ("GET", url, None)
+
+    def workout_url(index: int) -> str:
+        return f"/api/workouts/{workout_ids[index % len(workout_ids)]}"
+
+    return [
+        Scenario("GET /api/users/me", get("/api/users/me")),
+        Scenario("GET /api/users/me/stats", get("/api/users/me/stats")),
+        Scenario("GET /api/users/me/volume", get("/api/users/me/volume")),
+        Scenario(
+            "GET /api/users/me/progress",
+            get("/api/users/me/progress?granularity=month&muscle_group=chest"),
+        ),
+        Scenario(
+            "GET /api/users/me/plan",
+            get("/api/users/me/plan?template_id=template_001&weeks=8"),
+        ),
+        Scenario("GET /api/exercises", get("/api/exercises")),
+        Scenario(
+            "GET /api/exercises?filtered",
+            get("/api/exercises?category=strength&muscle_group=glutes&search=squat"),
+        ),
+        Scenario("GET /api/exercises/search", get("/api/exercises/search?q=sqaut")),
+        Scenario(
+            "GET /api/exercises/autocomplete",
+            get("/api/exercises/autocomplete?prefix=b"),
+        ),
+        Scenario("GET /api/exercises/{id}", get("/api/exercises/ex_001")),
+        Scenario("GET /api/workouts", get("/api/workouts?limit=50")),
+        Scenario(
+            "GET /api/workouts?status",
+            get("/api/workouts?limit=50&status=completed&include_templates=true"),
+        ),
+        Scenario("GET /api/workouts/{id}", lambda i: ("GET", workout_url(i), None)),
+        Scenario("GET /api/workout-templates", get("/api/workout-templates")),
+        Scenario("GET /api/sync", get("/api/sync")),
+        Scenario("GET /api/users/me/export", get("/api/users/me/export?format=csv")),
+        Scenario(
+            "POST /api/users/me/import",
+            lambda i: ("POST", "/api/users/me/import", _import_body(i)),
+        ),
+        Scenario(
+            "POST /api/workouts",
+            lambda i: (
+                "POST",
+                "/api/workouts",
+                {"name": f"Bench {i}", "template_id": "template_001"},
+            ),
+        ),
+        Scenario(
+            "POST /api/workouts/batch",
+            lambda i: (
+                "POST",
+                "/api/workouts/batch",
+                {
+                    "operations": [
+                        {"op": "create", "id": f"batch_{i}", "name": f"Batch {i}"},
+                        {"op": "update", "id": f"batch_{i}", "notes": "replayed"},
+                        {"op": "complete", "id": f"batch_{i}"},
+                    ]
+                },
+            ),
+        ),
+        Scenario(
+            "PUT /api/workouts/{id}",
+            lambda i: ("PUT", workout_url(i), {"name": f"Renamed {i}"}),
+        ),
+        Scenario(
+            "POST /api/workouts/{id}/complete",
+            lambda i: ("POST", f"{workout_url(i)}/complete", None),
+        ),
+        Scenario(
+            "POST /api/exercises",
+            lambda i: (
+                "POST",
+                "/api/exercises",
+                {"name": f"Custom {i}", "category": "strength"},
+            ),
+        ),
+        # Last, since each iteration removes a distinct workout
+        Scenario(
+            "DELETE /api/workouts/{id}",
+            lambda i: ("DELETE", workout_url(i), None),
+            warmup=False,
+        ),
+    ]
+
+
+def _import_body(index: int) -> bytes:
+    """An NDJSON upload of one completed three-set workout"""
+    rows = [
+        {
+            "workout_id": f"import_{index}",
+            "workout_name": f"Imported {index}",
+            "started_at": "2024-01-02T07:00:00",
+            "completed_at": "2024-01-02T08:00:00",
+            "exercise_position": 0,
+            "exercise_id": "ex_001",
+            "set_number": set_number,
+            "reps": 5,
+            "weight": 100 + set_number,
+            "completed": True,
+        }
+        for set_number in (1, 2, 3)
+    ]
+    return "\n".join(json.dumps(row) for row in rows).encode()
+
+
+class LiveConnection:
+    """A WebSocket connection to the app, exchanged as ASGI messages"""
+
+    def __init__(self, path: str):
+        self._inbound: asyncio.Queue[dict] = asyncio.Queue()
+        self._outbound: asyncio.Queue[dict] = asyncio.Queue()
+        scope = {
+            "type": "websocket",
+            "asgi": {"version": "3.0"},
+            "scheme": "ws",
+            "server": ("bench", 80),
+            "client": ("bench", 50000),
+            "path": path,
+            "raw_path": path.encode(),
+            "root_path": "",
+            "query_string": b"",
+            "headers": [(b"host", b"bench")],
+            "subprotocols": [],
+        }
+        self._task = asyncio.create_task(
+            app(scope, self._inbound.get, self._outbound.put)
+        )
+
+    async def open(self) -> dict:
+        """Connect, returning the snapshot the server sends first"""
+        await self._inbound.put({"type": "websocket.connect"})
+        accepted = await self._outbound.get()
+        if accepted["type"] != "websocket.accept":
+            raise RuntimeError(f"live connection refused: {accepted}")
+        return await self.receive()
+
+    async def send(self, message: dict) -> None:
+        await self._inbound.put(
+            {"type": "websocket.receive", "text": json.dumps(message)}
+        )
+
+    async def receive(self) -> dict:
+        message = await self._outbound.get()
+        if message["type"] != "websocket.send":
+            raise RuntimeError(f"live connection closed: {message}")
+        return json.loads(message["text"])
+
+    async def close(self) -> None:
+        await self._inbound.put({"type": "websocket.disconnect", "code": 1000})
+        await self._task
+
+
+async def run_live_scenario(client: httpx.AsyncClient, requests: int) -> dict:
+    """Set events sent one after another on a live session, as a device does"""
+    created = await client.post(
+        "/api/workouts", json={"name": "Live", "template_id": "template_001"}
+    )
+    connection = LiveConnection(f"/api/workouts/{created.json()['id']}/live")
+    await connection.open()
+
+    async def one(index: int) -> bool:
+        await connection.send(
+            {
+                "type": "set",
+                "exercise_index": 0,
+                "set_number": index % 10 + 1,
+                "reps": 5,
+                "weight": 100 + index % 50,
+                "completed": True,
+            }
+        )
+        return "ack" in await connection.receive()
+
+    latencies: list[float] = []
+    errors = 0
+    try:
+        for index in range(requests, requests + min(10, requests)):
+            await one(index)
+        started = time.perf_counter()
+        for index in range(requests):
+            sent = time.perf_counter()
+            errors += not await one(index)
+            latencies.append(time.perf_counter() - sent)
+        elapsed = time.perf_counter() - started
+    finally:
+        await connection.close()
+    return summarize(latencies, elapsed, errors)
+
+
+def load_dataset(scale: Scale, seed: int) -> list[str]:
+    """Replace the app's in-memory state with a synthetic dataset"""
+    workouts = generate_workouts(scale, seed)
+    store.restore(MOCK_EXERCISES, workouts + WORKOUT_TEMPLATES)
+    return [w.id for w in workouts]
+
+
+def summarize(latencies: list[float], elapsed: float, errors: int) -> dict:
+    """Throughput and latency percentiles in milliseconds"""
+    ordered = sorted(latencies)
+    cuts = statistics.quantiles(ordered, n=100, method="inclusive")
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 4),
+        "p50_ms": round(cuts[49] * 1000, 4),
+        "p95_ms": round(cuts[94] * 1000, 4),
+        "p99_ms": round(cuts[98] * 1000, 4),
+    }
+
+
+async def _send(
+    client: httpx.AsyncClient, method: str, url: str, body: dict | bytes | None
+) -> httpx.Response:
+    if isinstance(body, bytes):
+        return await client.request(method, url, content=body)
+    return await client.request(method, url, json=body)
+
+
+async def run_scenario(
+    client: httpx.AsyncClient, scenario: Scenario, requests: int, concurrency: int
+) -> dict:
+    latencies: list[float] = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(index: int) -> None:
+        nonlocal errors
+        method, url, body = scenario.request(index)
+        async with semaphore:
+            started = time.perf_counter()
+            response = await _send(client, method, url, body)
+            latencies.append(time.perf_counter() - started)
+        if response.status_code >= 400:
+            errors += 1
+
+    # Warm caches and lazily built structures before measuring, using
+    # iteration indices the measured run will not reuse
+    warmup = min(10, requests) if scenario.warmup else 0
+    for index in range(requests, requests + warmup):
+        method, url, body = scenario.request(index)
+        await _send(client, method, url, body)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(index) for index in range(requests)))
+    return summarize(latencies, time.perf_counter() - started, errors)
+
+
+async def run(scale_name: str, requests: int, concurrency: int, seed: int) -> dict:
+    scale = SCALES[scale_name]
+    load_started = time.perf_counter()
+    workout_ids = load_dataset(scale, seed)
+    load_seconds = time.perf_counter() - load_started
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        for scenario in build_scenarios(workout_ids):
+            results[scenario.name] = await run_scenario(
+                client, scenario, requests, concurrency
+            )
+        results[LIVE_SCENARIO] = await run_live_scenario(client, requests)
+
+    return {
+        "metadata": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "scale": scale_name,
+            "users": scale.users,
+            "workouts": scale.users * scale.workouts_per_user,
+            "sets": scale.total_sets,
+            "seed": seed,
+            "requests_per_endpoint": requests,
+            "concurrency": concurrency,
+            "load_seconds": round(load_seconds, 3),
+        },
+        "results": results,
+    }
+
+
+def compare(
+    baseline: dict, current: dict, threshold: float = REGRESSION_THRESHOLD
+) -> list[str]:
+    """Endpoints whose p95 latency regressed beyond the threshold"""
+    regressions = []
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if not before or not before["p95_ms"]:
+            continue
+        change = result["p95_ms"] / before["p95_ms"] - 1
+        if change > threshold:
+            regressions.append(
+                f"{name}: p95 {before['p95_ms']}ms -> {result['p95_ms']}ms "
+                f"(+{change:.0%})"
+            )
+    return regressions
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", choices=sorted(SCALES), default="1k")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write results JSON to this path")
+    parser.add_argument("--compare", help="Baseline results JSON to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=REGRESSION_THRESHOLD,
+        help="Relative p95 slowdown treated as a regression (default 0.10)",
+    )
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run(args.scale, args.requests, args.concurrency, args.seed))
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+
+    if args.compare:
+        with open(args.compare) as file:
+            regressions = compare(json.load(file), report, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""Deterministic synthetic workout history shaped like ``mock_data``."""
+
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from app.mock_data import MOCK_EXERCISES, MOCK_USER
+from app.schemas import (
+    Exercise,
+    WorkoutExercise,
+    WorkoutExerciseSet,
+    WorkoutResponse,
+)
+
+# Fixed reference time so the same seed always yields identical data
+EPOCH = datetime(2024, 1, 1, 7, 0)
+
+
+@dataclass(frozen=True)
+class Scale:
+    """Dataset size as users x workouts per user x sets per workout"""
+
+    users: int
+    workouts_per_user: int
+    sets_per_workout: int
+
+    @property
+    def total_sets(self) -> int:
+        return self.users * self.workouts_per_user * self.sets_per_workout
+
+
+SCALES = {
+    "1k": Scale(users=2, workouts_per_user=50, sets_per_workout=10),
+    "100k": Scale(users=20, workouts_per_user=500, sets_per_workout=10),
+    "1m": Scale(users=100, workouts_per_user=1000, sets_per_workout=10),
+}
+
+# Sets are spread over this many exercises per workout
+EXERCISES_PER_WORKOUT = 4
+
+
+def user_ids(scale: Scale) -> list[str]:
+    """User IDs for a scale; the first is the mock current user"""
+    return [MOCK_USER.id] + [f"user_{index:05d}" for index in range(1, scale.users)]
+
+
+def _set_for(
+    exercise: Exercise, set_number: int, rng: random.Random
+) -> WorkoutExerciseSet:
+    """A completed set with the fields mock data uses for this category"""
+    category = exercise.category
+    fields: dict = {"set_number": set_number, "completed": True}
+    if category == "strength":
+        fields.update(
+            reps=rng.randint(3, 12),
+            weight=float(rng.randrange(45, 405, 5)),
+            rest_seconds=rng.choice((90, 120, 180)),
+        )
+    elif category == "speed":
+        fields.update(time_seconds=round(rng.uniform(4.0, 5.5), 2), rest_seconds=180)
+    elif category == "cardio":
+        fields.update(
+            distance=round(rng.uniform(0.4, 10.0), 1),
+            time_seconds=round(rng.uniform(60, 3600), 1),
+        )
+    else:
+        fields.update(reps=rng.randint(3, 10), rest_seconds=rng.choice((60, 90)))
+        if exercise.id == "ex_009":  # Broad Jumps
+            fields["distance"] = round(rng.uniform(7.0, 9.5), 1)
+    return WorkoutExerciseSet.model_construct(**fields)
+
+
+def generate_workouts(scale: Scale, seed: int = 42) -> list[WorkoutResponse]:
+    """Completed workouts for every user, oldest first per user.
+
+    Models are built with ``model_construct`` because the data is valid by
+    construction and validation would dominate generation at large scales.
+    """
+    rng = random.Random(seed)
+    workouts = []
+    for user_id in user_ids(scale):
+        for index in range(scale.workouts_per_user):
+            started_at = EPOCH + timedelta(days=index, minutes=rng.randrange(0, 720))
+            exercises = rng.sample(MOCK_EXERCISES, EXERCISES_PER_WORKOUT)
+            workout_exercises = []
+            for slot, exercise in enumerate(exercises):
+                # Distribute sets across slots, earlier slots taking any remainder
+                count = scale.sets_per_workout // EXERCISES_PER_WORKOUT
+                if slot < scale.sets_per_workout % EXERCISES_PER_WORKOUT:
+                    count += 1
+                sets = [_set_for(exercise, n, rng) for n in range(1, count + 1)]
+                workout_exercises.append(
+                    WorkoutExercise.model_construct(
+                        exercise=exercise, sets=sets, notes=None
+                    )
+                )
+            duration = rng.randrange(1800, 5400)
+            workouts.append(
+                WorkoutResponse.model_construct(
+                    id=f"syn_{user_id}_{index:06d}",
+                    user_id=user_id,
+                    name=f"Session {index + 1}",
+                    notes=None,
+                    started_at=started_at,
+                    completed_at=started_at + timedelta(seconds=duration),
+                    duration_seconds=duration,
+                    exercises=workout_exercises,
+                    is_template=False,
+                    status="completed",
+                )
+            )
+    return workouts
@@ -0,0 +1,195 @@
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from .exercise_index import ExerciseIndex
+from .schemas import (
+    BatchItemResult,
+    WorkoutCompleteOperation,
+    WorkoutCreateOperation,
+    WorkoutDeleteOperation,
+    WorkoutExercise,
+    WorkoutExerciseWrite,
+    WorkoutOperation,
+    WorkoutResponse,
+    WorkoutUpdateOperation,
+)
+from .workout_repository import WorkoutRepository, instantiate_template
+
+
+class OperationError(Exception):
+    """A batch operation that cannot be applied"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass
+class BatchPlan:
+    """Validated outcome of a batch, not yet applied.
+
+    ``changes`` holds the final state of every workout the batch touches, in
+    first-touched order, with None for workouts the batch deletes.
+    """
+
+    results: list[BatchItemResult] = field(default_factory=list)
+    changes: dict[str, WorkoutResponse | None] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return all(result.error is None for result in self.results)
+
+    @property
+    def saved(self) -> list[WorkoutResponse]:
+        return [workout for workout in self.changes.values() if workout is not None]
+
+    @property
+    def deleted(self) -> list[str]:
+        return [
+            workout_id
+            for workout_id, workout in self.changes.items()
+            if workout is None
+        ]
+
+
+class BatchPlanner:
+    """Validates workout operations in one pass against staged copies.
+
+    Operations see the effects of earlier operations in the same batch, so a
+    workout created offline can be edited, completed or deleted later in the
+    batch. Stored workouts are never mutated; each change stages a copy.
+    """
+
+    def __init__(
+        self,
+        user_id: str,
+        workouts: WorkoutRepository,
+        templates: WorkoutRepository,
+        catalog: ExerciseIndex,
+    ):
+        self.user_id = user_id
+        self.workouts = workouts
+        self.templates = templates
+        self.catalog = catalog
+
+    def plan(self, operations: list[WorkoutOperation]) -> BatchPlan:
+        plan = BatchPlan()
+        for index, operation in enumerate(operations):
+            try:
+                workout_id = self._stage(plan, operation)
+            except OperationError as exc:
+                plan.results.append(
+                    BatchItemResult(
+                        index=index,
+                        op=operation.op,
+                        id=getattr(operation, "id", None),
+                        status=exc.status,
+                        error=str(exc),
+                    )
+                )
+                continue
+            status = 201 if operation.op == "create" else 200
+            plan.results.append(
+                BatchItemResult(
+                    index=index, op=operation.op, id=workout_id, status=status
+                )
+            )
+        return plan
+
+    def _stage(self, plan: BatchPlan, operation: WorkoutOperation) -> str:
+        if isinstance(operation, WorkoutCreateOperation):
+            workout = self._create(plan, operation)
+        else:
+            current = self._current(plan, operation.id)
+            if isinstance(operation, WorkoutDeleteOperation):
+                plan.changes[operation.id] = None
+                return operation.id
+            if isinstance(operation, WorkoutUpdateOperation):
+                workout = self._update(current, operation)
+            else:
+                workout = self._complete(current, operation)
+        plan.changes[workout.id] = workout
+        return workout.id
+
+    def _current(self, plan: BatchPlan, workout_id: str) -> WorkoutResponse:
+        """Latest state of a workout, counting earlier operations in the batch"""
+        if workout_id in plan.changes:
+            workout = plan.changes[workout_id]
+        else:
+            workout = self.workouts.get(workout_id)
+        if workout is None or workout.user_id != self.user_id:
+            raise OperationError(404, "Workout not found")
+        return workout
+
+    def _exists(self, plan: BatchPlan, workout_id: str) -> bool:
+        if workout_id in plan.changes:
+            return plan.changes[workout_id] is not None
+        return workout_id in self.workouts or workout_id in self.templates
+
+    def _create(
+        self, plan: BatchPlan, operation: WorkoutCreateOperation
+    ) -> WorkoutResponse:
+        workout_id = operation.id or f"workout_{uuid.uuid4().hex[:8]}"
+        if self._exists(plan, workout_id):
+            raise OperationError(409, f"Workout '{workout_id}' already exists")
+
+        exercises = []
+        if operation.exercises is not None:
+            exercises = self._exercises(operation.exercises)
+        elif operation.template_id:
+            template = self.templates.get(operation.template_id)
+            if template is None:
+                raise OperationError(404, "Template not found")
+            exercises = instantiate_template(template)
+
+        return WorkoutResponse(
+            id=workout_id,
+            user_id=self.user_id,
+            name=operation.name,
+            notes=operation.notes,
+            started_at=operation.started_at or datetime.now(),
+            status="planned",
+            exercises=exercises,
+        )
+
+    def _update(
+        self, workout: WorkoutResponse, operation: WorkoutUpdateOperation
+    ) -> WorkoutResponse:
+        changes = operation.model_dump(include={"name", "notes"}, exclude_unset=True)
+        if changes.get("name", ...) is None:
+            raise OperationError(422, "Workout name cannot be null")
+        if operation.exercises is not None:
+            changes["exercises"] = self._exercises(operation.exercises)
+        return workout.model_copy(update=changes)
+
+    def _complete(
+        self, workout: WorkoutResponse, operation: WorkoutCompleteOperation
+    ) -> WorkoutResponse:
+        if workout.status == "completed":
+            return workout
+
+        completed_at = operation.completed_at or datetime.now()
+        if completed_at < workout.started_at:
+            raise OperationError(422, "Workout cannot complete before it started")
+        return workout.model_copy(
+            update={
+                "completed_at": completed_at,
+                "duration_seconds": int(
+                    (completed_at - workout.started_at).total_seconds()
+                ),
+                "status": "completed",
+            }
+        )
+
+    def _exercises(self, slots: list[WorkoutExerciseWrite]) -> list[WorkoutExercise]:
+        """Resolve exercise IDs against the catalog"""
+        exercises = []
+        for slot in slots:
+            exercise = self.catalog.get(slot.exercise_id)
+            if exercise is None:
+                raise OperationError(422, f"Unknown exercise '{slot.exercise_id}'")
+            exercises.append(
+                WorkoutExercise(exercise=exercise, sets=slot.sets, notes=slot.notes)
+            )
+        return exercises
@@ -0,0 +1,113 @@
+import asyncio
+import os
+import secrets
+from collections.abc import Iterable
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from . import models
+from .change_log import Change
+
+
+def _new_origin() -> str:
+    return f"{os.getpid()}-{secrets.token_hex(4)}"
+
+
+# Tags this process's rows in the change table; forked workers draw their own
+origin = _new_origin()
+
+
+def _reset_origin() -> None:
+    global origin
+    origin = _new_origin()
+
+
+os.register_at_fork(after_in_child=_reset_origin)
+
+# Whether writes are published to the change table. Only workers sharing a
+# SQLite database follow it, and sequences are numbered from the table's
+# head, which is only safe under SQLite's single-writer lock; elsewhere,
+# concurrent writes could claim the same sequence
+publishing = False
+
+
+async def head(session: AsyncSession) -> int:
+    """Sequence of the newest change in the table"""
+    return await session.scalar(
+        select(func.coalesce(func.max(models.RecordChange.seq), 0))
+    )
+
+
+async def publish(
+    session: AsyncSession, kind: str, record_ids: Iterable[str], deleted: bool = False
+) -> None:
+    """Record changed records in the writing transaction.
+
+    Call after the transaction's first write: SQLite then holds its write
+    lock, so the head read here cannot move before the commit and sequences
+    become visible to other workers in order. Does nothing unless
+    ``publishing`` is set.
+    """
+    record_ids = list(record_ids)
+    if not publishing or not record_ids:
+        return
+    first = await head(session) + 1
+    await session.execute(
+        delete(models.RecordChange).where(
+            models.RecordChange.kind == kind,
+            models.RecordChange.record_id.in_(record_ids),
+        )
+    )
+    await session.execute(
+        insert(models.RecordChange),
+        [
+            {
+                "kind": kind,
+                "record_id": record_id,
+                "seq": first + offset,
+                "deleted": deleted,
+                "origin": origin,
+            }
+            for offset, record_id in enumerate(record_ids)
+        ],
+    )
+
+
+class ChangeFeed:
+    """Follows the shared change table to pick up other workers' writes.
+
+    Each worker process keeps its own in-memory state; with several of them
+    serving one database, every write is published to the change table and
+    every worker reads the table past its cursor before handling a request.
+    The table keeps only the latest change per record, so a worker that has
+    been idle for a while reads each changed record once.
+    """
+
+    def __init__(self):
+        self.active = False
+        self.cursor = 0
+        self.lock = asyncio.Lock()
+
+    async def start(self, session: AsyncSession) -> int:
+        """Begin following from the current head"""
+        self.cursor = await head(session)
+        return self.cursor
+
+    async def poll(self, session: AsyncSession) -> list[tuple[Change, bool]]:
+        """Changes past the cursor, oldest first, each flagged if made here"""
+        rows = await session.scalars(
+            select(models.RecordChange)
+            .where(models.RecordChange.seq > self.cursor)
+            .order_by(models.RecordChange.seq)
+        )
+        changes = [
+            (
+                Change(row.kind, row.record_id, row.seq, row.deleted),
+                row.origin == origin,
+            )
+            for row in rows
+        ]
+        if changes:
+            self.cursor = changes[-1][0].seq
+        return changes
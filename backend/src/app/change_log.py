@@ -0,0 +1,105 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+# Kinds of record tracked by the change log
+WORKOUT = "workout"
+EXERCISE = "exercise"
+
+
+@dataclass(frozen=True)
+class Change:
+    kind: str
+    id: str
+    seq: int
+    deleted: bool = False
+
+
+class ChangeLog:
+    """Append-only log of record changes for delta sync, compacted by key.
+
+    Only the latest change to each record is kept, in sequence order, so a
+    record edited many times costs one entry and a sync reads back just the
+    entries newer than the client's sequence number. Tombstones for deleted
+    records are dropped oldest first once there are more than
+    ``max_tombstones``; the ``floor`` then rises past them, and a client whose
+    sequence is below the floor must resync from a full snapshot.
+
+    Sequences start from the wall clock in microseconds on every reset, so
+    numbers handed out before a restart fall below the new floor instead of
+    being mistaken for current ones.
+
+    With several worker processes, ``shared`` is set and sequences come from
+    the database's change table instead: local ``record`` calls are ignored
+    and every worker's changes arrive through ``replay``, so a client's
+    sequence means the same on whichever worker serves it.
+    """
+
+    def __init__(self, max_tombstones: int = 10_000):
+        self.max_tombstones = max_tombstones
+        self.shared = False
+        self.reset()
+
+    def reset(self, head: int | None = None) -> None:
+        """Forget every change; outstanding sequences all fall below the floor"""
+        self._entries: OrderedDict[tuple[str, str], Change] = OrderedDict()
+        self._tombstones = 0
+        self.floor = self.head = time.time_ns() // 1000 if head is None else head
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def record(self, kind: str, record_id: str) -> int:
+        """Log that a record was created or changed"""
+        if self.shared:
+            return self.head
+        return self._append(Change(kind, record_id, self.head + 1))
+
+    def record_deletion(self, kind: str, record_id: str) -> int:
+        """Log a tombstone for a deleted record"""
+        if self.shared:
+            return self.head
+        return self.replay(Change(kind, record_id, self.head + 1, deleted=True))
+
+    def replay(self, change: Change) -> int:
+        """Log a change numbered elsewhere, above the current head"""
+        seq = self._append(change)
+        if change.deleted:
+            self._tombstones += 1
+            if self._tombstones > self.max_tombstones:
+                self.compact()
+        return seq
+
+    def needs_reset(self, since: int) -> bool:
+        """Whether changes after ``since`` may have been compacted away"""
+        return since < self.floor or since > self.head
+
+    def since(self, seq: int) -> list[Change]:
+        """Latest change to each record changed after ``seq``, oldest first"""
+        changes = []
+        for change in reversed(self._entries.values()):
+            if change.seq <= seq:
+                break
+            changes.append(change)
+        changes.reverse()
+        return changes
+
+    def compact(self) -> None:
+        """Drop the oldest tombstones until at most half the limit remain"""
+        target = self.max_tombstones // 2
+        for key, change in list(self._entries.items()):
+            if self._tombstones <= target:
+                break
+            if change.deleted:
+                del self._entries[key]
+                self._tombstones -= 1
+                self.floor = max(self.floor, change.seq)
+
+    def _append(self, change: Change) -> int:
+        key = (change.kind, change.id)
+        previous = self._entries.pop(key, None)
+        if previous is not None and previous.deleted:
+            self._tombstones -= 1
+        self._entries[key] = change
+        self.head = change.seq
+        return change.seq
@@ -0,0 +1,204 @@
+"""Compile the exercise catalog into a memory-mapped binary file.
+
+    cd backend
+    python -m src.app.compiled_catalog --output exercises.vcx
+    EXERCISE_CATALOG_PATH=exercises.vcx uvicorn src.app.main:app
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+
+from . import mock_data
+from .exercise_search import ExerciseSearch
+from .schemas import Exercise
+
+MAGIC = b"VCXC"
+VERSION = 2
+
+# magic, version, entry count, offset and length of the index blob
+_HEADER = struct.Struct("<4sHIQI")
+# Per entry, in catalog order: ID offset and length, entry offset and length
+_RECORD = struct.Struct("<QHQI")
+# Entry ordinals sorted by ID, for binary search
+_ORDINAL = struct.Struct("<I")
+
+# Attribute postings stored in the index blob, keyed like ExerciseIndex's
+POSTINGS = ("category", "muscle_group", "equipment", "owner")
+
+
+def write_catalog(exercises: Iterable[Exercise], path: str) -> None:
+    """Compile exercises, in catalog order, into a file at ``path``.
+
+    Each entry is stored as JSON and decoded only when looked up. The index
+    blob holds everything the exercise indexes need, keyed by entry ordinal:
+    lowercased attribute postings, lowercased names, name fragment postings
+    and weighted search term postings. Indexing the catalog therefore never
+    touches the entries themselves.
+    """
+    exercises = list(exercises)
+    postings: dict[str, dict[str, list[int]]] = {name: {} for name in POSTINGS}
+    custom = []
+    fragments: dict[str, list[int]] = {}
+    terms: dict[str, dict[int, float]] = {}
+    for ordinal, exercise in enumerate(exercises):
+        for name, key in attribute_keys(exercise):
+            postings[name].setdefault(key, []).append(ordinal)
+        if exercise.is_custom:
+            custom.append(ordinal)
+        for fragment in name_fragments(exercise.name):
+            fragments.setdefault(fragment, []).append(ordinal)
+        for term, weight in ExerciseSearch.terms(exercise):
+            weights = terms.setdefault(term, {})
+            weights[ordinal] = max(weight, weights.get(ordinal, 0))
+    index = json.dumps(
+        {
+            **postings,
+            "custom": custom,
+            "names": [exercise.name.lower() for exercise in exercises],
+            "fragments": fragments,
+            "terms": {term: list(weights.items()) for term, weights in terms.items()},
+        }
+    ).encode()
+
+    ids = [exercise.id.encode() for exercise in exercises]
+    entries = [exercise.model_dump_json().encode() for exercise in exercises]
+    sorted_ordinals = sorted(range(len(exercises)), key=ids.__getitem__)
+
+    data_start = (
+        _HEADER.size + _RECORD.size * len(exercises) + _ORDINAL.size * len(exercises)
+    )
+    records = []
+    offset = data_start
+    for exercise_id, entry in zip(ids, entries, strict=True):
+        records.append(
+            _RECORD.pack(
+                offset, len(exercise_id), offset + len(exercise_id), len(entry)
+            )
+        )
+        offset += len(exercise_id) + len(entry)
+
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as file:
+        file.write(_HEADER.pack(MAGIC, VERSION, len(exercises), offset, len(index)))
+        file.writelines(records)
+        file.writelines(_ORDINAL.pack(ordinal) for ordinal in sorted_ordinals)
+        for exercise_id, entry in zip(ids, entries, strict=True):
+            file.write(exercise_id)
+            file.write(entry)
+        file.write(index)
+    # Readers that already mapped the old file keep their consistent copy
+    os.replace(temporary, path)
+
+
+def attribute_keys(exercise: Exercise) -> Iterator[tuple[str, str]]:
+    """``(posting, key)`` pairs filing an exercise under its attributes"""
+    yield "category", exercise.category.lower()
+    for muscle_group in exercise.muscle_groups:
+        yield "muscle_group", muscle_group.lower()
+    if exercise.equipment:
+        yield "equipment", exercise.equipment.lower()
+    if exercise.created_by:
+        yield "owner", exercise.created_by
+
+
+def name_fragments(name: str) -> set[str]:
+    """Every non-empty substring of each lowercased word of a name"""
+    return {
+        token[start:end]
+        for token in name.lower().split()
+        for start in range(len(token))
+        for end in range(start + 1, len(token) + 1)
+    }
+
+
+class CompiledCatalog:
+    """Read-only exercise catalog backed by a memory-mapped compiled file.
+
+    Opening reads only the header, so it costs the same for any catalog
+    size, and every process mapping the file shares one page-cache copy.
+    Entries are decoded into ``Exercise`` models on each access and not
+    kept, so a process holds only the exercises it is currently using.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count, index_offset, index_length = _HEADER.unpack_from(
+            self._map
+        )
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} exercise catalog")
+        self._count = count
+        self._sorted_start = _HEADER.size + _RECORD.size * count
+        self._index_span = (index_offset, index_offset + index_length)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, exercise_id: object) -> bool:
+        return isinstance(exercise_id, str) and self.ordinal(exercise_id) is not None
+
+    def __iter__(self) -> Iterator[Exercise]:
+        """Every exercise in catalog order"""
+        for ordinal in range(self._count):
+            yield self.entry(ordinal)
+
+    def get(self, exercise_id: str) -> Exercise | None:
+        ordinal = self.ordinal(exercise_id)
+        return None if ordinal is None else self.entry(ordinal)
+
+    def entry(self, ordinal: int) -> Exercise:
+        """The exercise at a catalog position, decoded from the file"""
+        _, _, offset, length = self._record(ordinal)
+        return Exercise.model_validate_json(self._map[offset : offset + length])
+
+    def id_at(self, ordinal: int) -> str:
+        offset, length, _, _ = self._record(ordinal)
+        return self._map[offset : offset + length].decode()
+
+    def ordinal(self, exercise_id: str) -> int | None:
+        """Catalog position of an exercise, by binary search over the IDs"""
+        key = exercise_id.encode()
+        position = bisect_left(
+            range(self._count), key, key=lambda index: self._sorted_id(index)
+        )
+        if position < self._count and self._sorted_id(position) == key:
+            return self._sorted_ordinal(position)
+        return None
+
+    def index(self) -> dict:
+        """Postings, names and custom ordinals, as written by write_catalog"""
+        start, end = self._index_span
+        return json.loads(self._map[start:end])
+
+    def _record(self, ordinal: int) -> tuple[int, int, int, int]:
+        return _RECORD.unpack_from(self._map, _HEADER.size + _RECORD.size * ordinal)
+
+    def _sorted_ordinal(self, position: int) -> int:
+        offset = self._sorted_start + _ORDINAL.size * position
+        return _ORDINAL.unpack_from(self._map, offset)[0]
+
+    def _sorted_id(self, position: int) -> bytes:
+        offset, length, _, _ = self._record(self._sorted_ordinal(position))
+        return self._map[offset : offset + length]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", required=True, help="Compiled catalog path")
+    args = parser.parse_args(argv)
+
+    exercises = mock_data.MOCK_EXERCISES
+    write_catalog(exercises, args.output)
+    print(f"Wrote {len(exercises)} exercises to {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
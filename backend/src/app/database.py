@@ -0,0 +1,80 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from .config import settings
+from .models import Base
+
+# How long a SQLite writer waits for another process's write lock
+SQLITE_BUSY_TIMEOUT_MS = 5000
+
+_engine: AsyncEngine | None = None
+_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+
+def create_engine(database_url: str) -> AsyncEngine:
+    """Pooled async engine for a database URL"""
+    options: dict = {"pool_pre_ping": True}
+    if database_url.startswith("sqlite"):
+        engine = create_async_engine(database_url, **options)
+        event.listen(engine.sync_engine, "connect", _configure_sqlite)
+        return engine
+
+    options.update(
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+    )
+    return create_async_engine(database_url, **options)
+
+
+def _configure_sqlite(dbapi_connection, _connection_record) -> None:
+    """Enforce foreign keys, and let worker processes share the file.
+
+    In WAL mode readers never block the single writer or each other, and
+    the busy timeout makes a writer wait its turn instead of failing.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.close()
+
+
+async def init_database(database_url: str) -> None:
+    """Open the connection pool and create any missing tables"""
+    global _engine, _session_factory
+
+    _engine = create_engine(database_url)
+    _session_factory = async_sessionmaker(_engine, expire_on_commit=False)
+    async with _engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+
+async def close_database() -> None:
+    """Dispose of the connection pool, if one is open"""
+    global _engine, _session_factory
+
+    if _engine is not None:
+        await _engine.dispose()
+    _engine = None
+    _session_factory = None
+
+
+def database_enabled() -> bool:
+    return _session_factory is not None
+
+
+@asynccontextmanager
+async def session_scope() -> AsyncIterator[AsyncSession]:
+    """Session wrapped in a transaction that commits on success"""
+    if _session_factory is None:
+        raise RuntimeError("Database is not initialized")
+    async with _session_factory() as session, session.begin():
+        yield session
@@ -0,0 +1,260 @@
+from collections import defaultdict
+from collections.abc import Iterable
+
+from .compiled_catalog import CompiledCatalog, attribute_keys, name_fragments
+from .exercise_search import ExerciseSearch
+from .schemas import Exercise
+
+
+class ExerciseIndex:
+    """Exercise catalog with inverted indexes for filtered lookups.
+
+    Every filterable attribute maps to the set of exercise IDs carrying it, so a
+    query intersects a handful of sets instead of scanning the whole catalog.
+    Name search uses an index of name-token substrings to find candidates and
+    then confirms the full substring match on those candidates only. Ranked,
+    typo-tolerant search and autocomplete are kept in an ``ExerciseSearch``
+    that is updated alongside the other indexes.
+
+    The catalog may sit on a compiled ``base`` file. Its exercises are looked
+    up straight from the file, and the indexes over them are built from the
+    file's precomputed postings without decoding any entry; exercises added
+    later are layered on top.
+    """
+
+    def __init__(
+        self, exercises: Iterable[Exercise] = (), base: CompiledCatalog | None = None
+    ):
+        self.base = base
+        self.clear()
+        for exercise in exercises:
+            self.add(exercise)
+
+    def clear(self) -> None:
+        """Remove every exercise added on top of the compiled base, if any"""
+        # Exercises added in this process; base entries stay in the file
+        self._by_id: dict[str, Exercise] = {}
+        # Base entries removed or replaced by an added exercise
+        self._hidden: set[str] = set()
+        # Insertion position, used to return results in catalog order
+        self._position: dict[str, int] = {}
+        self._names: dict[str, str] = {}
+        self._indexes: dict[str, defaultdict[str, set[str]]] = {
+            "category": defaultdict(set),
+            "muscle_group": defaultdict(set),
+            "equipment": defaultdict(set),
+            "owner": defaultdict(set),
+        }
+        self._by_name_fragment: defaultdict[str, set[str]] = defaultdict(set)
+        self._custom: set[str] = set()
+        self._next_position = len(self.base) if self.base else 0
+        self._search = ExerciseSearch()
+        self._base_indexed = self.base is None
+
+    def __len__(self) -> int:
+        base = len(self.base) - len(self._hidden) if self.base else 0
+        return base + len(self._by_id)
+
+    def __contains__(self, exercise_id: object) -> bool:
+        return exercise_id in self._by_id or self._in_base(exercise_id)
+
+    def all(self) -> list[Exercise]:
+        """All exercises in catalog order"""
+        exercises = []
+        if self.base:
+            exercises = [
+                exercise for exercise in self.base if exercise.id not in self._hidden
+            ]
+        return exercises + list(self._by_id.values())
+
+    def get(self, exercise_id: str) -> Exercise | None:
+        """Look up an exercise by ID"""
+        exercise = self._by_id.get(exercise_id)
+        if exercise is None and self._in_base(exercise_id):
+            exercise = self.base.get(exercise_id)
+        return exercise
+
+    def add(self, exercise: Exercise) -> None:
+        """Add an exercise, replacing any existing entry with the same ID"""
+        if exercise.id in self:
+            self.remove(exercise.id)
+
+        self._by_id[exercise.id] = exercise
+        self._index(exercise, self._next_position)
+        self._next_position += 1
+
+    def remove(self, exercise_id: str) -> Exercise | None:
+        """Remove an exercise from the catalog and all of its indexes"""
+        exercise = self._by_id.pop(exercise_id, None)
+        if exercise is None:
+            if not self._in_base(exercise_id):
+                return None
+            exercise = self.base.get(exercise_id)
+            self._hidden.add(exercise_id)
+            if not self._base_indexed:
+                # Never indexed yet; hiding it keeps it out when it would be
+                return exercise
+
+        del self._position[exercise_id]
+        del self._names[exercise_id]
+        for name, key in attribute_keys(exercise):
+            _discard(self._indexes[name], key, exercise_id)
+        self._custom.discard(exercise_id)
+        for fragment in name_fragments(exercise.name):
+            _discard(self._by_name_fragment, fragment, exercise_id)
+        self._search.remove(exercise)
+
+        return exercise
+
+    def filter(
+        self,
+        category: str | None = None,
+        muscle_group: str | None = None,
+        equipment: str | None = None,
+        search: str | None = None,
+        include_custom: bool = True,
+        created_by: str | None = None,
+    ) -> list[Exercise]:
+        """Return exercises matching every given filter, in catalog order"""
+        self.index_base()
+        candidate_sets: list[set[str]] = []
+
+        if category:
+            candidate_sets.append(
+                self._indexes["category"].get(category.lower(), set())
+            )
+        if muscle_group:
+            candidate_sets.append(
+                self._indexes["muscle_group"].get(muscle_group.lower(), set())
+            )
+        if equipment:
+            candidate_sets.append(
+                self._indexes["equipment"].get(equipment.lower(), set())
+            )
+        if created_by:
+            candidate_sets.append(self._indexes["owner"].get(created_by, set()))
+
+        query = search.lower() if search else None
+        if query:
+            fragments = query.split()
+            if not fragments:
+                # Whitespace-only search: only names containing it can match
+                candidate_sets.append(set(self._names))
+            for fragment in fragments:
+                candidate_sets.append(self._by_name_fragment.get(fragment, set()))
+
+        if not candidate_sets:
+            if include_custom:
+                return self.all()
+            return [ex for ex in self.all() if ex.id not in self._custom]
+
+        # Intersect starting from the smallest set to keep the work minimal
+        candidate_sets.sort(key=len)
+        matches = set(candidate_sets[0])
+        for ids in candidate_sets[1:]:
+            if not matches:
+                break
+            matches &= ids
+
+        if not include_custom:
+            matches -= self._custom
+        if query:
+            matches = {ex_id for ex_id in matches if query in self._names[ex_id]}
+
+        return [self.get(ex_id) for ex_id in sorted(matches, key=self._position.get)]
+
+    def search(
+        self, query: str, limit: int, include_custom: bool = True
+    ) -> list[Exercise]:
+        """Exercises matching a free-text query, best match first"""
+        self.index_base()
+        results = []
+        for exercise_id, _, _ in self._search.search(query):
+            if include_custom or exercise_id not in self._custom:
+                results.append(self.get(exercise_id))
+                if len(results) == limit:
+                    break
+        return results
+
+    def autocomplete(self, prefix: str, limit: int) -> list[Exercise]:
+        """Exercises with a name word starting with ``prefix``"""
+        self.index_base()
+        return [
+            self.get(exercise_id)
+            for exercise_id in self._search.autocomplete(prefix, limit)
+        ]
+
+    def _in_base(self, exercise_id: object) -> bool:
+        return (
+            self.base is not None
+            and exercise_id not in self._hidden
+            and exercise_id in self.base
+        )
+
+    def _index(self, exercise: Exercise, position: int) -> None:
+        """File an exercise in every index"""
+        exercise_id = exercise.id
+        self._position[exercise_id] = position
+        self._names[exercise_id] = exercise.name.lower()
+        for name, key in attribute_keys(exercise):
+            self._indexes[name][key].add(exercise_id)
+        if exercise.is_custom:
+            self._custom.add(exercise_id)
+        for fragment in name_fragments(exercise.name):
+            self._by_name_fragment[fragment].add(exercise_id)
+        self._search.add(exercise)
+
+    def index_base(self) -> None:
+        """Index the compiled base, unless that is already done.
+
+        Every index is built from the file's precomputed postings, so no
+        entry is decoded. ``store.restore`` calls this before any worker
+        forks, so workers share the result; queries call it in case nothing
+        did yet.
+        """
+        if self._base_indexed:
+            return
+        self._base_indexed = True
+        base = self.base
+        index = base.index()
+        ids = [base.id_at(ordinal) for ordinal in range(len(base))]
+        hidden = self._hidden
+
+        def visible(ordinals: Iterable[int]) -> set[str]:
+            return {ids[ordinal] for ordinal in ordinals} - hidden
+
+        for name, postings in self._indexes.items():
+            for key, ordinals in index[name].items():
+                postings[key].update(visible(ordinals))
+        self._custom.update(visible(index["custom"]))
+        for fragment, ordinals in index["fragments"].items():
+            self._by_name_fragment[fragment].update(visible(ordinals))
+        names = {}
+        for ordinal, (exercise_id, name) in enumerate(
+            zip(ids, index["names"], strict=True)
+        ):
+            if exercise_id not in hidden:
+                self._position[exercise_id] = ordinal
+                names[exercise_id] = name
+        self._names.update(names)
+        self._search.add_postings(
+            names,
+            {
+                term: {
+                    ids[ordinal]: weight
+                    for ordinal, weight in weights
+                    if ids[ordinal] not in hidden
+                }
+                for term, weights in index["terms"].items()
+            },
+        )
+
+
+def _discard(index: defaultdict[str, set[str]], key: str, exercise_id: str) -> None:
+    """Remove an ID from an index bucket, dropping the bucket once empty"""
+    ids = index.get(key)
+    if ids is None:
+        return
+    ids.discard(exercise_id)
+    if not ids:
+        del index[key]
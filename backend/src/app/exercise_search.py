@@ -0,0 +1,265 @@
+from bisect import bisect_left, insort
+from collections import defaultdict
+from dataclasses import dataclass
+
+from .schemas import Exercise
+
+# Match tiers, best first
+EXACT = 0
+PREFIX = 1
+CONTAINS = 2
+FUZZY = 3
+
+# Fields a query token can match, with their weight in the score
+NAME = 1.0
+ATTRIBUTE = 0.5
+
+
+def _tokens(text: str) -> list[str]:
+    return text.lower().split()
+
+
+def _trigrams(term: str) -> set[str]:
+    """Padded trigrams, so short terms and word edges still produce some"""
+    padded = f"  {term} "
+    return {padded[index : index + 3] for index in range(len(padded) - 2)}
+
+
+def _max_edits(term: str) -> int:
+    """Typos tolerated in a query token of this length"""
+    if len(term) < 4:
+        return 0
+    return 1 if len(term) < 8 else 2
+
+
+def _edit_distance(a: str, b: str, limit: int) -> int:
+    """Damerau-Levenshtein distance, giving up once it must exceed ``limit``"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2: list[int] = []
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i] + [0] * len(b)
+        for j, char_b in enumerate(b, 1):
+            cost = char_a != char_b
+            current[j] = min(
+                previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost
+            )
+            if i > 1 and j > 1 and char_a == b[j - 2] and a[i - 2] == char_b:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+@dataclass
+class _Match:
+    tier: int
+    score: float
+
+
+class ExerciseSearch:
+    """Ranked, typo-tolerant search and prefix autocomplete over exercises.
+
+    Name words, muscle groups and equipment are indexed as terms. A trigram
+    index over the terms finds candidates for misspelled query tokens, which
+    are then confirmed by bounded edit distance. Results rank exact name
+    matches first, then name prefixes, then substring and attribute matches,
+    then typo matches.
+
+    Autocomplete uses a sorted list of every word-boundary suffix of each
+    name (``"barbell back squat"``, ``"back squat"``, ``"squat"``), so a
+    prefix lookup is a binary search followed by a scan of just the matches.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self) -> None:
+        self._names: dict[str, str] = {}
+        # term -> exercise ID -> best field weight for that term
+        self._by_term: defaultdict[str, dict[str, float]] = defaultdict(dict)
+        self._by_trigram: defaultdict[str, set[str]] = defaultdict(set)
+        self._prefixes: list[tuple[str, str]] = []
+
+    def add(self, exercise: Exercise) -> None:
+        exercise_id = exercise.id
+        name = exercise.name.lower()
+        self._names[exercise_id] = name
+        for term, weight in self.terms(exercise):
+            postings = self._by_term[term]
+            if not postings:
+                for trigram in _trigrams(term):
+                    self._by_trigram[trigram].add(term)
+            postings[exercise_id] = max(weight, postings.get(exercise_id, 0))
+        for suffix in self._suffixes(name):
+            insort(self._prefixes, (suffix, exercise_id))
+
+    def add_postings(
+        self, names: dict[str, str], terms: dict[str, dict[str, float]]
+    ) -> None:
+        """Add many exercises from lowercased names and precomputed term postings"""
+        self._names.update(names)
+        for term, weights in terms.items():
+            if not weights:
+                continue
+            postings = self._by_term[term]
+            if not postings:
+                for trigram in _trigrams(term):
+                    self._by_trigram[trigram].add(term)
+            for exercise_id, weight in weights.items():
+                postings[exercise_id] = max(weight, postings.get(exercise_id, 0))
+        # One sort instead of an insertion per suffix
+        self._prefixes.extend(
+            (suffix, exercise_id)
+            for exercise_id, name in names.items()
+            for suffix in self._suffixes(name)
+        )
+        self._prefixes.sort()
+
+    def remove(self, exercise: Exercise) -> None:
+        exercise_id = exercise.id
+        name = self._names.pop(exercise_id, None)
+        if name is None:
+            return
+        for term, _ in self.terms(exercise):
+            postings = self._by_term.get(term)
+            if postings is None:
+                continue
+            postings.pop(exercise_id, None)
+            if not postings:
+                del self._by_term[term]
+                for trigram in _trigrams(term):
+                    terms = self._by_trigram[trigram]
+                    terms.discard(term)
+                    if not terms:
+                        del self._by_trigram[trigram]
+        for suffix in self._suffixes(name):
+            index = bisect_left(self._prefixes, (suffix, exercise_id))
+            if self._prefixes[index : index + 1] == [(suffix, exercise_id)]:
+                del self._prefixes[index]
+
+    def search(self, query: str) -> list[tuple[str, int, float]]:
+        """``(exercise ID, tier, score)`` for every match, best first.
+
+        Every query token must match a term; the last one may be an
+        unfinished word, so it also matches as a prefix.
+        """
+        tokens = _tokens(query)
+        if not tokens:
+            return []
+
+        matches: dict[str, _Match] | None = None
+        for position, token in enumerate(tokens):
+            token_matches = self._match_token(token, prefix=position == len(tokens) - 1)
+            if matches is None:
+                matches = token_matches
+                continue
+            combined = {}
+            for exercise_id, match in matches.items():
+                other = token_matches.get(exercise_id)
+                if other is not None:
+                    combined[exercise_id] = _Match(
+                        max(match.tier, other.tier), match.score + other.score
+                    )
+            matches = combined
+            if not matches:
+                return []
+
+        phrase = " ".join(tokens)
+        ranked = []
+        for exercise_id, match in matches.items():
+            name = self._names[exercise_id]
+            tier = match.tier
+            if name == phrase:
+                tier = EXACT
+            elif name.startswith(phrase):
+                tier = min(tier, PREFIX)
+            elif match.tier != FUZZY:
+                tier = max(tier, CONTAINS)
+            ranked.append((exercise_id, tier, match.score))
+        ranked.sort(key=lambda item: (item[1], -item[2], self._names[item[0]]))
+        return ranked
+
+    def autocomplete(self, prefix: str, limit: int) -> list[str]:
+        """IDs of exercises whose name has a word starting with ``prefix``.
+
+        Names that start with the prefix come first; each group is in
+        alphabetical order.
+        """
+        prefix = " ".join(_tokens(prefix))
+        if not prefix:
+            return []
+        leading: list[str] = []
+        inner: list[str] = []
+        for index in range(bisect_left(self._prefixes, (prefix,)), len(self._prefixes)):
+            suffix, exercise_id = self._prefixes[index]
+            if not suffix.startswith(prefix):
+                break
+            if self._names[exercise_id] == suffix:
+                leading.append(exercise_id)
+            else:
+                inner.append(exercise_id)
+
+        results = []
+        seen = set()
+        for exercise_id in sorted(leading, key=self._names.get) + sorted(
+            inner, key=self._names.get
+        ):
+            if exercise_id not in seen:
+                seen.add(exercise_id)
+                results.append(exercise_id)
+                if len(results) == limit:
+                    break
+        return results
+
+    def _match_token(self, token: str, prefix: bool) -> dict[str, _Match]:
+        """Best match of one query token against each exercise's terms"""
+        matches: dict[str, _Match] = {}
+
+        def offer(term: str, tier: int, quality: float) -> None:
+            for exercise_id, weight in self._by_term[term].items():
+                score = weight * quality
+                current = matches.get(exercise_id)
+                if current is None or (tier, -score) < (current.tier, -current.score):
+                    matches[exercise_id] = _Match(tier, score)
+
+        # Any term sharing a trigram is a candidate; a typo within the edit
+        # limit always leaves at least one trigram intact
+        candidates: set[str] = set()
+        for trigram in _trigrams(token):
+            candidates |= self._by_trigram.get(trigram, set())
+
+        limit = _max_edits(token)
+        for term in candidates:
+            if term == token:
+                offer(term, EXACT, 3.0)
+            elif prefix and term.startswith(token):
+                offer(term, PREFIX, 2.0)
+            elif token in term:
+                offer(term, CONTAINS, 1.5)
+            elif limit:
+                distance = _edit_distance(token, term, limit)
+                if prefix:
+                    # An unfinished word is compared with the term's start
+                    head = term[: len(token)]
+                    distance = min(distance, _edit_distance(token, head, limit))
+                if distance <= limit:
+                    offer(term, FUZZY, 1.0 - distance / (len(token) + 1))
+        return matches
+
+    @staticmethod
+    def terms(exercise: Exercise) -> list[tuple[str, float]]:
+        """``(term, weight)`` pairs an exercise is found by"""
+        terms = [(token, NAME) for token in _tokens(exercise.name)]
+        for muscle_group in exercise.muscle_groups:
+            terms.extend((token, ATTRIBUTE) for token in _tokens(muscle_group))
+        if exercise.equipment:
+            terms.extend((token, ATTRIBUTE) for token in _tokens(exercise.equipment))
+        return terms
+
+    @staticmethod
+    def _suffixes(name: str) -> list[str]:
+        words = name.split()
+        return [" ".join(words[index:]) for index in range(len(words))]
@@ -0,0 +1,113 @@
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Iterator
+
+from .schemas import WorkoutResponse
+from .workout_repository import WorkoutRepository, started_at_key
+
+NDJSON = "ndjson"
+CSV = "csv"
+
+MEDIA_TYPES = {NDJSON: "application/x-ndjson", CSV: "text/csv"}
+
+# One exported row per set, with the workout and exercise it belongs to
+FIELDS = (
+    "workout_id",
+    "workout_name",
+    "started_at",
+    "completed_at",
+    "status",
+    "exercise_position",
+    "exercise_id",
+    "exercise_name",
+    "set_number",
+    "reps",
+    "weight",
+    "time_seconds",
+    "distance",
+    "rest_seconds",
+    "completed",
+    "notes",
+)
+
+
+def set_rows(workout: WorkoutResponse) -> Iterator[dict]:
+    """Export rows for every set of a workout"""
+    completed_at = workout.completed_at and workout.completed_at.isoformat()
+    for position, slot in enumerate(workout.exercises):
+        for workout_set in slot.sets:
+            yield {
+                "workout_id": workout.id,
+                "workout_name": workout.name,
+                "started_at": workout.started_at.isoformat(),
+                "completed_at": completed_at,
+                "status": workout.status,
+                "exercise_position": position,
+                "exercise_id": slot.exercise.id,
+                "exercise_name": slot.exercise.name,
+                "set_number": workout_set.set_number,
+                "reps": workout_set.reps,
+                "weight": workout_set.weight,
+                "time_seconds": workout_set.time_seconds,
+                "distance": workout_set.distance,
+                "rest_seconds": workout_set.rest_seconds,
+                "completed": workout_set.completed,
+                "notes": workout_set.notes,
+            }
+
+
+def workout_chunks(
+    repository: WorkoutRepository, user_id: str, chunk_size: int
+) -> Iterator[list[WorkoutResponse]]:
+    """A user's workouts, oldest first, at most ``chunk_size`` at a time.
+
+    Each chunk resumes strictly after the last workout of the previous one,
+    so workouts saved or deleted while an export is paused between chunks
+    never shift or repeat the walk.
+    """
+    after = None
+    while True:
+        chunk = []
+        for workout in repository.iter_by_started_at(after=after):
+            if workout.user_id == user_id:
+                chunk.append(workout)
+                if len(chunk) == chunk_size:
+                    break
+        if not chunk:
+            return
+        yield chunk
+        if len(chunk) < chunk_size:
+            return
+        after = started_at_key(chunk[-1])
+
+
+async def export_workouts(
+    repository: WorkoutRepository,
+    user_id: str,
+    export_format: str,
+    chunk_size: int,
+) -> AsyncIterator[bytes]:
+    """Encoded export body, one piece per chunk of workouts.
+
+    Only the current chunk's workouts and text are held at once, so memory
+    stays flat however long the history is.
+    """
+    encode = _csv_chunk if export_format == CSV else _ndjson_chunk
+    if export_format == CSV:
+        yield _csv_chunk([dict(zip(FIELDS, FIELDS, strict=False))])
+    for chunk in workout_chunks(repository, user_id, chunk_size):
+        body = encode([row for workout in chunk for row in set_rows(workout)])
+        if body:
+            yield body
+
+
+def _ndjson_chunk(rows: list[dict]) -> bytes:
+    return "".join(json.dumps(row) + "\n" for row in rows).encode()
+
+
+def _csv_chunk(rows: list[dict]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=FIELDS, lineterminator="\n")
+    writer.writerows(rows)
+    return buffer.getvalue().encode()
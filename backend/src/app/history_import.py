@@ -0,0 +1,268 @@
+import codecs
+import csv
+import json
+import uuid
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+
+from pydantic import ValidationError
+
+from .exercise_index import ExerciseIndex
+from .export import CSV
+from .schemas import (
+    Exercise,
+    ImportRowError,
+    WorkoutExercise,
+    WorkoutExerciseSet,
+    WorkoutResponse,
+)
+
+SET_FIELDS = tuple(WorkoutExerciseSet.model_fields)
+
+# Skipped rows reported in detail; later ones are only counted
+MAX_REPORTED_ERRORS = 100
+
+# A parsed row, or why it could not be parsed
+Record = dict | str
+
+
+@dataclass
+class ImportChunk:
+    """Workouts parsed from one bounded run of rows, ready to store"""
+
+    rows: int = 0
+    workouts: list[WorkoutResponse] = field(default_factory=list)
+    error_count: int = 0
+    errors: list[ImportRowError] = field(default_factory=list)
+
+
+@dataclass
+class _Row:
+    line: int
+    workout_id: str
+    header: dict
+    position: str
+    exercise: Exercise
+    set: WorkoutExerciseSet
+
+
+class _WorkoutBuilder:
+    """Consecutive rows of one source workout"""
+
+    def __init__(self, row: _Row):
+        self.workout_id = row.workout_id
+        self.line = row.line
+        self.header = row.header
+        self.slots: list[tuple[Exercise, list[WorkoutExerciseSet]]] = []
+        self._slot: tuple[str, str] | None = None
+
+    def add(self, row: _Row) -> None:
+        slot = (row.position, row.exercise.id)
+        if slot != self._slot:
+            self._slot = slot
+            self.slots.append((row.exercise, []))
+        self.slots[-1][1].append(row.set)
+
+    def build(self, user_id: str) -> WorkoutResponse:
+        fields = {
+            "name": "Imported workout",
+            "status": "completed" if "completed_at" in self.header else "planned",
+            **self.header,
+        }
+        workout = WorkoutResponse(
+            id=f"workout_{uuid.uuid4().hex[:8]}",
+            user_id=user_id,
+            exercises=[
+                WorkoutExercise(exercise=exercise, sets=sets)
+                for exercise, sets in self.slots
+            ],
+            **fields,
+        )
+        if workout.completed_at is not None:
+            elapsed = workout.completed_at - workout.started_at
+            workout.duration_seconds = max(0, int(elapsed.total_seconds()))
+        return workout
+
+
+class HistoryImporter:
+    """Parses NDJSON or CSV history uploads in bounded chunks.
+
+    Rows use the export's columns, one set per row. Rows of a workout must
+    be consecutive; each run of rows sharing a ``workout_id`` becomes one
+    new workout. Exercises are matched by ID, falling back to exact name.
+    Invalid rows are reported and skipped, and the rest of their workout is
+    still imported. The upload is consumed as it arrives, and at most
+    ``chunk_size`` workouts are held before they are handed back to store.
+    """
+
+    def __init__(self, user_id: str, catalog: ExerciseIndex, chunk_size: int):
+        self.user_id = user_id
+        self.catalog = catalog
+        self.chunk_size = chunk_size
+        self.reported_errors = 0
+        self._by_name: dict[str, Exercise] | None = None
+
+    async def chunks(
+        self, body: AsyncIterator[bytes], import_format: str
+    ) -> AsyncIterator[ImportChunk]:
+        records = _csv_records if import_format == CSV else _ndjson_records
+        chunk = ImportChunk()
+        current: _WorkoutBuilder | None = None
+        async for line, record in records(_lines(body)):
+            chunk.rows += 1
+            try:
+                row = self._row(line, record)
+            except (ValueError, ValidationError) as exc:
+                self._error(chunk, line, exc)
+                continue
+
+            if current is not None and current.workout_id == row.workout_id:
+                current.add(row)
+                continue
+            if current is not None:
+                self._finish(chunk, current)
+                if len(chunk.workouts) == self.chunk_size:
+                    yield chunk
+                    chunk = ImportChunk()
+            current = _WorkoutBuilder(row)
+            current.add(row)
+
+        if current is not None:
+            self._finish(chunk, current)
+        if chunk.rows or chunk.workouts:
+            yield chunk
+
+    def _finish(self, chunk: ImportChunk, builder: _WorkoutBuilder) -> None:
+        try:
+            chunk.workouts.append(builder.build(self.user_id))
+        except (ValueError, ValidationError) as exc:
+            self._error(chunk, builder.line, exc)
+
+    def _error(self, chunk: ImportChunk, line: int, exc: Exception) -> None:
+        chunk.error_count += 1
+        if self.reported_errors < MAX_REPORTED_ERRORS:
+            self.reported_errors += 1
+            chunk.errors.append(ImportRowError(line=line, error=_message(exc)))
+
+    def _row(self, line: int, record: Record) -> _Row:
+        if isinstance(record, str):
+            raise ValueError(record)
+        record = {
+            key: value for key, value in record.items() if value not in ("", None)
+        }
+        workout_id = record.get("workout_id")
+        if workout_id is None:
+            raise ValueError("workout_id is required")
+
+        header = {}
+        for source, target in (
+            ("started_at", "started_at"),
+            ("workout_name", "name"),
+            ("completed_at", "completed_at"),
+            ("status", "status"),
+        ):
+            if source in record:
+                header[target] = record[source]
+        return _Row(
+            line=line,
+            workout_id=str(workout_id),
+            header=header,
+            position=str(record.get("exercise_position", "")),
+            exercise=self._exercise(record),
+            set=WorkoutExerciseSet.model_validate(
+                {key: record[key] for key in SET_FIELDS if key in record}
+            ),
+        )
+
+    def _exercise(self, record: dict) -> Exercise:
+        exercise_id = record.get("exercise_id")
+        if exercise_id is not None:
+            exercise = self.catalog.get(str(exercise_id))
+            if exercise is None:
+                raise ValueError(f"Unknown exercise: {exercise_id}")
+            return exercise
+
+        name = record.get("exercise_name")
+        if name is None:
+            raise ValueError("exercise_id or exercise_name is required")
+        if self._by_name is None:
+            self._by_name = {
+                exercise.name.lower(): exercise for exercise in self.catalog.all()
+            }
+        exercise = self._by_name.get(str(name).lower())
+        if exercise is None:
+            raise ValueError(f"Unknown exercise: {name}")
+        return exercise
+
+
+async def _lines(body: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Text lines of an upload, decoded incrementally as pieces arrive"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    pending = ""
+    async for piece in body:
+        pending += decoder.decode(piece)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+async def _ndjson_records(
+    lines: AsyncIterator[str],
+) -> AsyncIterator[tuple[int, Record]]:
+    number = 0
+    async for line in lines:
+        number += 1
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield number, f"Invalid JSON: {exc.msg}"
+            continue
+        if not isinstance(record, dict):
+            record = "Each line must be a JSON object"
+        yield number, record
+
+
+async def _csv_records(lines: AsyncIterator[str]) -> AsyncIterator[tuple[int, Record]]:
+    """Rows keyed by the header's columns.
+
+    Quoted values may span lines, so lines are gathered until their quotes
+    balance before being parsed as one record.
+    """
+    header: list[str] | None = None
+    number = 0
+    start = 0
+    gathered: list[str] = []
+    async for line in lines:
+        number += 1
+        if not gathered:
+            start = number
+        gathered.append(line.rstrip("\r"))
+        if sum(part.count('"') for part in gathered) % 2:
+            continue
+        text = "\n".join(gathered)
+        gathered = []
+        if not text.strip():
+            continue
+        values = next(csv.reader([text]))
+        if header is None:
+            header = [column.strip() for column in values]
+            continue
+        if len(values) != len(header):
+            yield start, f"Expected {len(header)} columns, found {len(values)}"
+            continue
+        yield start, dict(zip(header, values, strict=True))
+    if gathered:
+        yield start, "Unterminated quoted value"
+
+
+def _message(exc: Exception) -> str:
+    if isinstance(exc, ValidationError):
+        error = exc.errors()[0]
+        location = ".".join(str(part) for part in error["loc"])
+        return f"{location}: {error['msg']}" if location else error["msg"]
+    return str(exc)
@@ -0,0 +1,110 @@
+import asyncio
+from collections import defaultdict
+
+from fastapi import WebSocket, WebSocketDisconnect
+
+from .schemas import (
+    LiveEvent,
+    SetRemoveEvent,
+    SetUpdateEvent,
+    WorkoutExerciseSet,
+    WorkoutResponse,
+)
+
+
+def apply_event(workout: WorkoutResponse, event: LiveEvent) -> WorkoutResponse:
+    """Copy of a workout with one set-level event applied.
+
+    Only the touched exercise slot and its set list are copied; every other
+    slot and set is shared with the original workout.
+    """
+    if event.exercise_index >= len(workout.exercises):
+        raise ValueError(f"Workout has no exercise {event.exercise_index}")
+
+    slot = workout.exercises[event.exercise_index]
+    sets = [s for s in slot.sets if s.set_number != event.set_number]
+    if isinstance(event, SetRemoveEvent):
+        if len(sets) == len(slot.sets):
+            raise ValueError(f"Exercise has no set {event.set_number}")
+    else:
+        current = next((s for s in slot.sets if s.set_number == event.set_number), None)
+        changes = event.model_dump(
+            exclude={"type", "exercise_index"}, exclude_unset=True
+        )
+        # Validated like a new set, so explicit nulls cannot reach bool fields
+        base = {} if current is None else current.model_dump()
+        updated = WorkoutExerciseSet.model_validate({**base, **changes})
+        sets.append(updated)
+        sets.sort(key=lambda s: s.set_number)
+
+    exercises = list(workout.exercises)
+    exercises[event.exercise_index] = slot.model_copy(update={"sets": sets})
+    update: dict = {"exercises": exercises}
+    if workout.status == "planned":
+        update["status"] = "in_progress"
+    return workout.model_copy(update=update)
+
+
+def newly_completed(
+    before: WorkoutResponse, after: WorkoutResponse, event: LiveEvent
+) -> WorkoutExerciseSet | None:
+    """The set an applied event marked completed, if it was not already"""
+    if not isinstance(event, SetUpdateEvent):
+        return None
+    previous = _find_set(before, event.exercise_index, event.set_number)
+    current = _find_set(after, event.exercise_index, event.set_number)
+    if current is None or not current.completed:
+        return None
+    if previous is not None and previous.completed:
+        return None
+    return current
+
+
+def _find_set(
+    workout: WorkoutResponse, exercise_index: int, set_number: int
+) -> WorkoutExerciseSet | None:
+    sets = workout.exercises[exercise_index].sets
+    return next((s for s in sets if s.set_number == set_number), None)
+
+
+class LiveSessionHub:
+    """WebSocket connections per workout, for fanning out set updates.
+
+    Each workout also gets a lock, held while an event is applied and
+    persisted, so concurrent devices cannot interleave their writes.
+    """
+
+    def __init__(self):
+        self._connections: defaultdict[str, set[WebSocket]] = defaultdict(set)
+        self._locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    def connect(self, workout_id: str, websocket: WebSocket) -> None:
+        self._connections[workout_id].add(websocket)
+
+    def disconnect(self, workout_id: str, websocket: WebSocket) -> None:
+        connections = self._connections.get(workout_id)
+        if connections is None:
+            return
+        connections.discard(websocket)
+        if not connections:
+            del self._connections[workout_id]
+            self._locks.pop(workout_id, None)
+
+    def connection_count(self, workout_id: str) -> int:
+        return len(self._connections.get(workout_id, ()))
+
+    def lock(self, workout_id: str) -> asyncio.Lock:
+        return self._locks[workout_id]
+
+    async def broadcast(
+        self, workout_id: str, message: dict, exclude: WebSocket | None = None
+    ) -> None:
+        """Send a message to every other device watching a workout"""
+        for websocket in list(self._connections.get(workout_id, ())):
+            if websocket is exclude:
+                continue
+            try:
+                await websocket.send_json(message)
+            except (WebSocketDisconnect, RuntimeError):
+                # The device dropped without a close handshake
+                self.disconnect(workout_id, websocket)
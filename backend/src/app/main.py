@@ -1,12 +1,60 @@
 import os
+from contextlib import asynccontextmanager
 from datetime import datetime
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
+from . import mock_data, persistence, store
+from .config import settings
+from .database import close_database, init_database, session_scope
+from .metrics import (
+    PROMETHEUS_CONTENT_TYPE,
+    MetricsMiddleware,
+    metrics_registry,
+    render_cache_stats,
+)
 from .routes import api_router
 
+
+async def load_state() -> None:
+    """Seed an empty database, then rebuild in-memory state from it"""
+    async with session_scope() as session:
+        await persistence.seed(
+            session,
+            mock_data.MOCK_EXERCISES,
+            mock_data.MOCK_WORKOUTS + mock_data.WORKOUT_TEMPLATES,
+        )
+        # Read the head first, so writes racing the load are replayed after it
+        head = await store.change_feed.start(session)
+        # Built-in exercises are served from a compiled base if there is one
+        exercises = await persistence.load_exercises(
+            session, custom_only=store.exercise_catalog.base is not None
+        )
+        workouts = await persistence.load_workouts(session)
+    store.restore(exercises, workouts)
+    if store.change_log.shared:
+        store.change_log.reset(head)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load persisted state on startup, or the demo data without a database.
+
+    Workers forked by ``app.serve`` inherit state loaded before the fork,
+    so they only open their own connection pool.
+    """
+    if settings.database_url:
+        await init_database(settings.database_url)
+        if not getattr(app.state, "preloaded", False):
+            await load_state()
+    else:
+        store.ensure_loaded()
+    yield
+    await close_database()
+
+
 # Create FastAPI app with enhanced configuration
 app = FastAPI(
     title="VeloCollab API",
@@ -17,6 +65,7 @@ app = FastAPI(
     ),
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # CORS middleware for development
@@ -30,8 +79,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor"],
 )
 
+# Request latency, size and concurrency metrics (outermost, so it times everything)
+app.add_middleware(MetricsMiddleware, registry=metrics_registry)
+
 # Include API routes
 app.include_router(api_router)
 
@@ -83,6 +136,13 @@ async def ready():
     }
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus scrape endpoint"""
+    body = metrics_registry.render() + render_cache_stats(store.response_cache.stats())
+    return Response(body, media_type=PROMETHEUS_CONTENT_TYPE)
+
+
 # Legacy status endpoint (for backward compatibility)
 @app.get("/api/status")
 async def api_status():
@@ -0,0 +1,203 @@
+import time
+from bisect import bisect_left
+from collections import defaultdict
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Upper bounds in seconds; the final +Inf bucket is implicit
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+)
+# Upper bounds in bytes
+SIZE_BUCKETS = (128, 512, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+# Route label for requests that matched no route, keeping label cardinality bounded
+UNMATCHED_ROUTE = "<unmatched>"
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Labels = tuple[tuple[str, str], ...]
+
+
+class Histogram:
+    """Prometheus-style histogram keyed by a label tuple"""
+
+    def __init__(self, name: str, help_text: str, buckets: tuple[float, ...]):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = buckets
+        # Per-bucket (not cumulative) counts; the extra slot is +Inf
+        self._counts: defaultdict[Labels, list[int]] = defaultdict(
+            lambda: [0] * (len(buckets) + 1)
+        )
+        self._sums: defaultdict[Labels, float] = defaultdict(float)
+
+    def observe(self, labels: Labels, value: float) -> None:
+        self._counts[labels][bisect_left(self.buckets, value)] += 1
+        self._sums[labels] += value
+
+    def count(self, labels: Labels) -> int:
+        return sum(self._counts.get(labels, ()))
+
+    def render(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} histogram",
+        ]
+        for labels, counts in sorted(self._counts.items()):
+            cumulative = 0
+            for bound, count in zip(
+                (*map(_format_bound, self.buckets), "+Inf"), counts, strict=True
+            ):
+                cumulative += count
+                bucket_labels = _render_labels((*labels, ("le", bound)))
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            rendered = _render_labels(labels)
+            lines.append(f"{self.name}_sum{rendered} {self._sums[labels]}")
+            lines.append(f"{self.name}_count{rendered} {cumulative}")
+        return lines
+
+
+class Gauge:
+    """Prometheus-style gauge keyed by a label tuple"""
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help_text = help_text
+        self._values: defaultdict[Labels, float] = defaultdict(float)
+
+    def inc(self, labels: Labels, amount: float = 1) -> None:
+        self._values[labels] += amount
+
+    def dec(self, labels: Labels, amount: float = 1) -> None:
+        self._values[labels] -= amount
+
+    def value(self, labels: Labels) -> float:
+        return self._values.get(labels, 0)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} gauge"]
+        for labels, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_render_labels(labels)} {value:g}")
+        return lines
+
+
+class MetricsRegistry:
+    """HTTP request metrics recorded by ``MetricsMiddleware``"""
+
+    def __init__(self):
+        self.request_duration = Histogram(
+            "velocollab_http_request_duration_seconds",
+            "HTTP request latency by method, route template and status",
+            LATENCY_BUCKETS,
+        )
+        self.response_size = Histogram(
+            "velocollab_http_response_size_bytes",
+            "HTTP response body size by method, route template and status",
+            SIZE_BUCKETS,
+        )
+        self.in_flight = Gauge(
+            "velocollab_http_requests_in_flight",
+            "HTTP requests currently being handled, by method",
+        )
+
+    def render(self) -> str:
+        lines = [
+            *self.request_duration.render(),
+            *self.response_size.render(),
+            *self.in_flight.render(),
+        ]
+        return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware timing every HTTP request.
+
+    The route label is the matched route's path template (e.g.
+    ``/api/workouts/{workout_id}``), which the router records in the shared
+    scope, so per-ID URLs do not explode label cardinality.
+    """
+
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        in_flight_labels = (("method", method),)
+        self.registry.in_flight.inc(in_flight_labels)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.registry.in_flight.dec(in_flight_labels)
+            route = scope.get("route")
+            labels = (
+                ("method", method),
+                ("route", getattr(route, "path", UNMATCHED_ROUTE)),
+                ("status", str(status)),
+            )
+            self.registry.request_duration.observe(labels, elapsed)
+            self.registry.response_size.observe(labels, size)
+
+
+def render_cache_stats(stats: dict) -> str:
+    """Response cache counters and gauges from ``ResponseCache.stats()``"""
+    lines = []
+    for name in ("hits", "misses", "evictions"):
+        metric = f"velocollab_response_cache_{name}_total"
+        lines.append(f"# HELP {metric} Response cache {name}")
+        lines.append(f"# TYPE {metric} counter")
+        lines.append(f"{metric} {stats[name]}")
+    for name in ("entries", "bytes"):
+        metric = f"velocollab_response_cache_{name}"
+        lines.append(f"# HELP {metric} Response cache {name} currently held")
+        lines.append(f"# TYPE {metric} gauge")
+        lines.append(f"{metric} {stats[name]}")
+    return "\n".join(lines) + "\n"
+
+
+def _format_bound(bound: float) -> str:
+    return f"{bound:g}"
+
+
+def _render_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    rendered = ",".join(f'{key}="{_escape(value)}"' for key, value in labels)
+    return "{" + rendered + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+# Process-wide registry served on /metrics
+metrics_registry = MetricsRegistry()
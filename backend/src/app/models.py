@@ -0,0 +1,115 @@
+from datetime import datetime
+
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    DateTime,
+    Float,
+    ForeignKey,
+    ForeignKeyConstraint,
+    Index,
+    Integer,
+    String,
+    Text,
+)
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+
+
+class Base(DeclarativeBase):
+    """Declarative base for all database tables"""
+
+
+class Exercise(Base):
+    __tablename__ = "exercises"
+
+    id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    name: Mapped[str] = mapped_column(String(100))
+    category: Mapped[str] = mapped_column(String(32), index=True)
+    muscle_groups: Mapped[list[str]] = mapped_column(JSON, default=list)
+    equipment: Mapped[str | None] = mapped_column(String(64))
+    instructions: Mapped[str | None] = mapped_column(Text)
+    is_custom: Mapped[bool] = mapped_column(Boolean, default=False)
+    created_by: Mapped[str | None] = mapped_column(String(64), index=True)
+
+
+class Workout(Base):
+    __tablename__ = "workouts"
+    __table_args__ = (Index("ix_workouts_user_started", "user_id", "started_at"),)
+
+    id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    user_id: Mapped[str] = mapped_column(String(64))
+    name: Mapped[str] = mapped_column(String(100))
+    notes: Mapped[str | None] = mapped_column(Text)
+    started_at: Mapped[datetime] = mapped_column(DateTime)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime)
+    duration_seconds: Mapped[int | None] = mapped_column(Integer)
+    is_template: Mapped[bool] = mapped_column(Boolean, default=False)
+    status: Mapped[str] = mapped_column(String(16), default="planned")
+
+    exercises: Mapped[list["WorkoutExercise"]] = relationship(
+        order_by="WorkoutExercise.position",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+
+class WorkoutExercise(Base):
+    """An exercise slot in a workout, keyed by its position in the workout"""
+
+    __tablename__ = "workout_exercises"
+
+    workout_id: Mapped[str] = mapped_column(
+        ForeignKey("workouts.id", ondelete="CASCADE"), primary_key=True
+    )
+    position: Mapped[int] = mapped_column(Integer, primary_key=True)
+    exercise_id: Mapped[str] = mapped_column(ForeignKey("exercises.id"))
+    notes: Mapped[str | None] = mapped_column(Text)
+
+    exercise: Mapped[Exercise] = relationship()
+    sets: Mapped[list["WorkoutSet"]] = relationship(
+        order_by="WorkoutSet.set_index",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+
+class WorkoutSet(Base):
+    """A set within a workout exercise, keyed by its position in the slot"""
+
+    __tablename__ = "workout_sets"
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["workout_id", "exercise_position"],
+            ["workout_exercises.workout_id", "workout_exercises.position"],
+            ondelete="CASCADE",
+        ),
+    )
+
+    workout_id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    exercise_position: Mapped[int] = mapped_column(Integer, primary_key=True)
+    set_index: Mapped[int] = mapped_column(Integer, primary_key=True)
+    set_number: Mapped[int] = mapped_column(Integer)
+    reps: Mapped[int | None] = mapped_column(Integer)
+    weight: Mapped[float | None] = mapped_column(Float)
+    time_seconds: Mapped[float | None] = mapped_column(Float)
+    distance: Mapped[float | None] = mapped_column(Float)
+    rest_seconds: Mapped[int | None] = mapped_column(Integer)
+    notes: Mapped[str | None] = mapped_column(Text)
+    completed: Mapped[bool] = mapped_column(Boolean, default=False)
+
+
+class RecordChange(Base):
+    """Latest change to each record, shared by every worker process.
+
+    One row per record, renumbered from a global sequence on every write, so
+    a worker reads back just the records changed since its last sequence.
+    """
+
+    __tablename__ = "record_changes"
+
+    kind: Mapped[str] = mapped_column(String(16), primary_key=True)
+    record_id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    seq: Mapped[int] = mapped_column(Integer, unique=True)
+    deleted: Mapped[bool] = mapped_column(Boolean, default=False)
+    # Process that made the change, so it can skip its own writes
+    origin: Mapped[str] = mapped_column(String(32))
@@ -0,0 +1,24 @@
+import base64
+import binascii
+from datetime import datetime
+
+from .schemas import naive_local
+from .workout_repository import WorkoutKey
+
+
+def encode_cursor(key: WorkoutKey) -> str:
+    """Opaque cursor for resuming a listing after ``key``"""
+    started_at, workout_id = key
+    raw = f"{started_at.isoformat()}|{workout_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> WorkoutKey:
+    """Recover the key encoded in a cursor, raising ValueError if malformed"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        started_at, workout_id = raw.split("|", 1)
+        return naive_local(datetime.fromisoformat(started_at)), workout_id
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
@@ -0,0 +1,283 @@
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+
+import numpy as np
+
+from .pr_engine import ESTIMATED_1RM, MAX_REPS
+from .schemas import WorkoutExercise, WorkoutResponse
+from .set_history import SetHistory
+
+# History behind an exercise's current estimate
+BASELINE_WINDOW = timedelta(weeks=8)
+# Suggested loads are rounded to this plate increment
+LOAD_INCREMENT = 2.5
+# Plans move from higher to lower reps over this many phases
+PHASES = 3
+REP_STEP = 2
+MIN_REPS = 3
+# Reps assumed for a loaded set the template leaves open
+DEFAULT_REPS = 5
+# Planned sessions start at this time of day
+SESSION_TIME = time(7, 0)
+
+MAX_CACHED_PLANS = 256
+
+
+@dataclass(frozen=True)
+class PlanParameters:
+    template_id: str
+    goal_percent: float
+    weeks: int
+    sessions_per_week: int
+    start: date
+
+
+@dataclass
+class Plan:
+    """A generated plan and what it was generated from.
+
+    ``baselines`` and ``targets`` map exercise IDs to an estimated 1RM (loaded
+    exercises) or max reps (unloaded ones). Targets are fixed when the plan is
+    created; later weeks are re-planned from fresh estimates towards them.
+    """
+
+    user_id: str
+    parameters: PlanParameters
+    template: WorkoutResponse
+    loaded: list[str]
+    unloaded: list[str]
+    baselines: dict[str, float]
+    targets: dict[str, float]
+    weeks: list[list[WorkoutResponse]] = field(default_factory=list)
+    # First week that new history has made out of date
+    stale_from: int | None = None
+
+    @property
+    def workouts(self) -> list[WorkoutResponse]:
+        return [workout for week in self.weeks for workout in week]
+
+    def week_of(self, moment: datetime) -> int:
+        """Index of the plan week containing a moment, clamped to the plan"""
+        week = (moment.date() - self.parameters.start).days // 7
+        return min(max(week, 0), self.parameters.weeks)
+
+
+class PeriodizationPlanner:
+    """Goal-based multi-week plans built on a template and set history.
+
+    Each exercise progresses linearly from its current estimate to the goal
+    while reps step down through the phases, and loads come from inverting
+    the Epley formula; the whole weeks x exercises grid is computed as array
+    operations. Plans are cached per user and parameters. Newly completed or
+    deleted sets only mark the plan stale from the week they fall in, and the
+    next request regenerates just those weeks from fresh estimates.
+    """
+
+    def __init__(
+        self,
+        history: SetHistory,
+        clock: Callable[[], datetime] = datetime.now,
+        max_plans: int = MAX_CACHED_PLANS,
+    ):
+        self.history = history
+        self.clock = clock
+        self.max_plans = max_plans
+        self.clear()
+
+    def clear(self) -> None:
+        self._plans: OrderedDict[tuple[str, PlanParameters], Plan] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+    def plan(
+        self, user_id: str, template: WorkoutResponse, parameters: PlanParameters
+    ) -> Plan:
+        """The cached plan for these parameters, brought up to date"""
+        key = (user_id, parameters)
+        plan = self._plans.get(key)
+        if plan is None:
+            plan = self._create(user_id, template, parameters)
+            self._plans[key] = plan
+            while len(self._plans) > self.max_plans:
+                self._plans.popitem(last=False)
+        else:
+            self._plans.move_to_end(key)
+            if plan.stale_from is not None:
+                self._regenerate(plan, plan.stale_from)
+        return plan
+
+    def record_workout(self, workout: WorkoutResponse) -> None:
+        """Mark plans affected by a completed workout's sets as stale"""
+        if workout.status != "completed":
+            return
+        exercise_ids = {slot.exercise.id for slot in workout.exercises}
+        moment = workout.completed_at or workout.started_at
+        for (user_id, _), plan in self._plans.items():
+            if user_id != workout.user_id:
+                continue
+            if exercise_ids.isdisjoint(plan.loaded) and exercise_ids.isdisjoint(
+                plan.unloaded
+            ):
+                continue
+            week = plan.week_of(moment)
+            if week >= plan.parameters.weeks:
+                continue
+            if plan.stale_from is None or week < plan.stale_from:
+                plan.stale_from = week
+
+    def _create(
+        self, user_id: str, template: WorkoutResponse, parameters: PlanParameters
+    ) -> Plan:
+        loads = self._estimates(user_id, ESTIMATED_1RM)
+        reps = self._estimates(user_id, MAX_REPS)
+        loaded: list[str] = []
+        unloaded: list[str] = []
+        baselines: dict[str, float] = {}
+        for slot in template.exercises:
+            exercise_id = slot.exercise.id
+            if exercise_id in baselines:
+                continue
+            if exercise_id in loads:
+                loaded.append(exercise_id)
+                baselines[exercise_id] = loads[exercise_id]
+            elif slot.sets and all(s.reps for s in slot.sets):
+                unloaded.append(exercise_id)
+                baselines[exercise_id] = reps.get(
+                    exercise_id, float(max(s.reps for s in slot.sets))
+                )
+
+        gain = 1 + parameters.goal_percent / 100
+        plan = Plan(
+            user_id=user_id,
+            parameters=parameters,
+            template=template,
+            loaded=loaded,
+            unloaded=unloaded,
+            baselines=baselines,
+            targets={key: value * gain for key, value in baselines.items()},
+        )
+        self._regenerate(plan, 0, baselines)
+        return plan
+
+    def _regenerate(
+        self, plan: Plan, first_week: int, current: dict[str, float] | None = None
+    ) -> None:
+        """Rebuild weeks from ``first_week`` on, progressing from ``current``"""
+        parameters = plan.parameters
+        if current is None:
+            loads = self._estimates(plan.user_id, ESTIMATED_1RM)
+            reps = self._estimates(plan.user_id, MAX_REPS)
+            current = {
+                **{key: reps.get(key, plan.baselines[key]) for key in plan.unloaded},
+                **{key: loads.get(key, plan.baselines[key]) for key in plan.loaded},
+            }
+
+        weeks = np.arange(first_week, parameters.weeks)
+        phases = weeks * PHASES // parameters.weeks
+
+        training_max = _progression(plan, plan.loaded, current, first_week)
+        rep_targets = np.ceil(_progression(plan, plan.unloaded, current, first_week))
+        slot_reps = np.array(
+            [_slot_reps(plan.template, exercise_id) for exercise_id in plan.loaded],
+            dtype=np.float64,
+        ).reshape(len(plan.loaded), 1)
+        reps = np.maximum(MIN_REPS, slot_reps - REP_STEP * phases)
+        # Epley inverted: the load that many reps would estimate at the max
+        loads = training_max / (1 + reps / 30)
+        loads = np.round(loads / LOAD_INCREMENT) * LOAD_INCREMENT
+
+        suggestions = {
+            exercise_id: [
+                {"reps": int(reps[row, column]), "weight": float(loads[row, column])}
+                for column in range(len(weeks))
+            ]
+            for row, exercise_id in enumerate(plan.loaded)
+        }
+        for row, exercise_id in enumerate(plan.unloaded):
+            suggestions[exercise_id] = [
+                {"reps": int(value)} for value in rep_targets[row]
+            ]
+
+        del plan.weeks[first_week:]
+        for column, week in enumerate(weeks):
+            plan.weeks.append(
+                [
+                    self._session(plan, int(week), session, suggestions, column)
+                    for session in range(parameters.sessions_per_week)
+                ]
+            )
+        plan.stale_from = None
+
+    def _session(
+        self,
+        plan: Plan,
+        week: int,
+        session: int,
+        suggestions: dict[str, list[dict]],
+        column: int,
+    ) -> WorkoutResponse:
+        parameters = plan.parameters
+        offset = 7 * week + 7 * session // parameters.sessions_per_week
+        started_at = datetime.combine(
+            parameters.start + timedelta(days=offset), SESSION_TIME
+        )
+        exercises = []
+        for slot in plan.template.exercises:
+            update = suggestions.get(slot.exercise.id)
+            if update is None:
+                exercises.append(slot)
+                continue
+            sets = [s.model_copy(update=update[column]) for s in slot.sets]
+            exercises.append(WorkoutExercise(exercise=slot.exercise, sets=sets))
+
+        return WorkoutResponse(
+            id=f"plan_{parameters.template_id}_w{week + 1}_s{session + 1}",
+            user_id=plan.user_id,
+            name=f"{plan.template.name} - Week {week + 1}, Session {session + 1}",
+            notes=plan.template.notes,
+            started_at=started_at,
+            exercises=exercises,
+            is_template=True,
+            status="template",
+        )
+
+    def _estimates(self, user_id: str, metric: str) -> dict[str, float]:
+        """Current per-exercise bests over the baseline window"""
+        start = self.clock() - BASELINE_WINDOW
+        return self.history.best_by_exercise(user_id, metric, start=start)
+
+
+def _progression(
+    plan: Plan, exercise_ids: list[str], current: dict[str, float], first_week: int
+) -> np.ndarray:
+    """Exercises x weeks grid from ``first_week`` moving linearly to the targets.
+
+    Progress restarts from the current estimate, but never from below where
+    the original plan expected the exercise to be by ``first_week``; so an
+    exercise whose estimate has not moved is re-planned exactly as before.
+    """
+    total = plan.parameters.weeks
+    baseline = np.array([plan.baselines[key] for key in exercise_ids], dtype=float)
+    goal = np.array([plan.targets[key] for key in exercise_ids], dtype=float)
+    start = np.array([current[key] for key in exercise_ids], dtype=float)
+    start = np.maximum(start, baseline + (goal - baseline) * first_week / total)
+    # Never plan backwards for an exercise already past its target
+    goal = np.maximum(goal, start)
+    # Fraction of the remaining distance to the goal covered by each week
+    progress = np.arange(1, total - first_week + 1) / (total - first_week)
+    return start[:, None] + (goal - start)[:, None] * progress[None, :]
+
+
+def _slot_reps(template: WorkoutResponse, exercise_id: str) -> int:
+    """Highest rep count the template prescribes for an exercise"""
+    reps = [
+        s.reps
+        for slot in template.exercises
+        if slot.exercise.id == exercise_id
+        for s in slot.sets
+        if s.reps
+    ]
+    return max(reps, default=DEFAULT_REPS)
@@ -0,0 +1,185 @@
+from collections.abc import Iterable
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+
+from . import change_feed, models
+from .change_log import EXERCISE, WORKOUT
+from .schemas import Exercise, WorkoutResponse
+
+# Loads a workout tree in three queries regardless of its size: workouts,
+# their exercise slots joined to the exercise, and all of their sets
+_WORKOUT_TREE = selectinload(models.Workout.exercises).options(
+    joinedload(models.WorkoutExercise.exercise),
+    selectinload(models.WorkoutExercise.sets),
+)
+
+
+def _exercise_row(exercise: Exercise) -> dict:
+    return exercise.model_dump()
+
+
+def _workout_rows(workout: WorkoutResponse) -> tuple[dict, list[dict], list[dict]]:
+    """Flatten a workout into workout, exercise slot and set rows"""
+    workout_row = workout.model_dump(exclude={"exercises"})
+    exercise_rows = []
+    set_rows = []
+    for position, workout_exercise in enumerate(workout.exercises):
+        exercise_rows.append(
+            {
+                "workout_id": workout.id,
+                "position": position,
+                "exercise_id": workout_exercise.exercise.id,
+                "notes": workout_exercise.notes,
+            }
+        )
+        for set_index, workout_set in enumerate(workout_exercise.sets):
+            set_rows.append(
+                {
+                    "workout_id": workout.id,
+                    "exercise_position": position,
+                    "set_index": set_index,
+                    **workout_set.model_dump(),
+                }
+            )
+    return workout_row, exercise_rows, set_rows
+
+
+async def save_exercise(session: AsyncSession, exercise: Exercise) -> None:
+    """Insert or update an exercise"""
+    await session.merge(models.Exercise(**_exercise_row(exercise)))
+    await session.flush()
+    await change_feed.publish(session, EXERCISE, [exercise.id])
+
+
+async def save_workouts(
+    session: AsyncSession, workouts: Iterable[WorkoutResponse]
+) -> None:
+    """Write whole workouts, replacing any stored versions.
+
+    Rows for every workout are gathered first so each table receives a
+    single bulk INSERT, however many workouts and sets are being saved.
+    """
+    workout_rows = []
+    exercise_rows = []
+    set_rows = []
+    for workout in workouts:
+        workout_row, workout_exercise_rows, workout_set_rows = _workout_rows(workout)
+        workout_rows.append(workout_row)
+        exercise_rows.extend(workout_exercise_rows)
+        set_rows.extend(workout_set_rows)
+    if not workout_rows:
+        return
+
+    workout_ids = [row["id"] for row in workout_rows]
+    await _delete_workout_rows(session, workout_ids)
+    await session.execute(insert(models.Workout), workout_rows)
+    if exercise_rows:
+        await session.execute(insert(models.WorkoutExercise), exercise_rows)
+    if set_rows:
+        await session.execute(insert(models.WorkoutSet), set_rows)
+    await change_feed.publish(session, WORKOUT, workout_ids)
+
+
+async def save_workout(session: AsyncSession, workout: WorkoutResponse) -> None:
+    """Write a whole workout, replacing any stored version"""
+    await save_workouts(session, [workout])
+
+
+async def delete_workouts(session: AsyncSession, workout_ids: list[str]) -> None:
+    """Delete workouts together with their exercise slots and sets"""
+    await _delete_workout_rows(session, workout_ids)
+    await change_feed.publish(session, WORKOUT, workout_ids, deleted=True)
+
+
+async def _delete_workout_rows(session: AsyncSession, workout_ids: list[str]) -> None:
+    await session.execute(
+        delete(models.WorkoutSet).where(models.WorkoutSet.workout_id.in_(workout_ids))
+    )
+    await session.execute(
+        delete(models.WorkoutExercise).where(
+            models.WorkoutExercise.workout_id.in_(workout_ids)
+        )
+    )
+    await session.execute(
+        delete(models.Workout).where(models.Workout.id.in_(workout_ids))
+    )
+
+
+async def delete_workout(session: AsyncSession, workout_id: str) -> None:
+    """Delete a workout together with its exercise slots and sets"""
+    await delete_workouts(session, [workout_id])
+
+
+async def load_exercises(
+    session: AsyncSession, custom_only: bool = False
+) -> list[Exercise]:
+    """All stored exercises, or only the ones users created"""
+    query = select(models.Exercise)
+    if custom_only:
+        query = query.where(models.Exercise.is_custom.is_(True))
+    rows = await session.scalars(query)
+    return [Exercise.model_validate(row, from_attributes=True) for row in rows]
+
+
+async def load_workouts(session: AsyncSession) -> list[WorkoutResponse]:
+    """All stored workouts and templates with their exercises and sets"""
+    rows = await session.scalars(select(models.Workout).options(_WORKOUT_TREE))
+    return [WorkoutResponse.model_validate(row, from_attributes=True) for row in rows]
+
+
+async def load_workouts_by_id(
+    session: AsyncSession, workout_ids: list[str]
+) -> list[WorkoutResponse]:
+    """Stored workouts among the given IDs"""
+    if not workout_ids:
+        return []
+    rows = await session.scalars(
+        select(models.Workout)
+        .where(models.Workout.id.in_(workout_ids))
+        .options(_WORKOUT_TREE)
+    )
+    return [WorkoutResponse.model_validate(row, from_attributes=True) for row in rows]
+
+
+async def load_exercises_by_id(
+    session: AsyncSession, exercise_ids: list[str]
+) -> list[Exercise]:
+    """Stored exercises among the given IDs"""
+    if not exercise_ids:
+        return []
+    rows = await session.scalars(
+        select(models.Exercise).where(models.Exercise.id.in_(exercise_ids))
+    )
+    return [Exercise.model_validate(row, from_attributes=True) for row in rows]
+
+
+async def load_workout(
+    session: AsyncSession, workout_id: str
+) -> WorkoutResponse | None:
+    """One stored workout with its exercises and sets"""
+    row = await session.scalar(
+        select(models.Workout)
+        .where(models.Workout.id == workout_id)
+        .options(_WORKOUT_TREE)
+    )
+    if row is None:
+        return None
+    return WorkoutResponse.model_validate(row, from_attributes=True)
+
+
+async def seed(
+    session: AsyncSession,
+    exercises: Iterable[Exercise],
+    workouts: Iterable[WorkoutResponse],
+) -> bool:
+    """Populate an empty database, returning whether anything was written"""
+    if await session.scalar(select(func.count()).select_from(models.Exercise)):
+        return False
+
+    exercise_rows = [_exercise_row(exercise) for exercise in exercises]
+    if exercise_rows:
+        await session.execute(insert(models.Exercise), exercise_rows)
+    await save_workouts(session, workouts)
+    return True
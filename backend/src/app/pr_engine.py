@@ -0,0 +1,192 @@
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from datetime import datetime
+from itertools import islice
+
+from .schemas import Exercise, WorkoutExerciseSet, WorkoutResponse
+
+# Metrics tracked per exercise, and whether a larger value is better
+ESTIMATED_1RM = "estimated_1rm"
+BEST_TIME = "best_time"
+BEST_DISTANCE = "best_distance"
+MAX_REPS = "max_reps"
+HIGHER_IS_BETTER = {
+    ESTIMATED_1RM: True,
+    BEST_TIME: False,
+    BEST_DISTANCE: True,
+    MAX_REPS: True,
+}
+
+# Categories where a set's time is a performance rather than a duration
+TIMED_CATEGORIES = {"speed", "cardio"}
+
+RecordKey = tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class PersonalRecord:
+    """A new best value for one user, exercise and metric"""
+
+    user_id: str
+    exercise_id: str
+    exercise_name: str
+    metric: str
+    value: float
+    previous: float | None
+    achieved_at: datetime
+
+    def display(self) -> dict:
+        """Record in the ``recent_prs`` shape used by the stats endpoint"""
+        return {
+            "exercise": self.exercise_name,
+            "metric": self.metric,
+            "value": format_value(self.metric, self.value),
+            "date": self.achieved_at.date().isoformat(),
+        }
+
+
+def estimate_1rm(weight: float, reps: int) -> float:
+    """Epley estimate of a one-rep max"""
+    if reps == 1:
+        return weight
+    return weight * (1 + reps / 30)
+
+
+def format_value(metric: str, value: float) -> str:
+    """Human-readable value for a metric"""
+    if metric == ESTIMATED_1RM:
+        return f"{round(value, 1):g} lbs"
+    if metric == BEST_TIME:
+        return f"{round(value, 2):g}s"
+    if metric == MAX_REPS:
+        return f"{value:g} reps"
+    return f"{round(value, 2):g}"
+
+
+def set_metrics(
+    exercise: Exercise, workout_set: WorkoutExerciseSet
+) -> list[tuple[str, float]]:
+    """``(metric, value)`` pairs a completed set can set a record for"""
+    if not workout_set.completed:
+        return []
+
+    metrics = []
+    reps = workout_set.reps or 0
+    weight = workout_set.weight or 0
+    if weight > 0 and reps > 0:
+        metrics.append((ESTIMATED_1RM, estimate_1rm(weight, reps)))
+    elif reps > 0:
+        metrics.append((MAX_REPS, float(reps)))
+    if workout_set.time_seconds and exercise.category.lower() in TIMED_CATEGORIES:
+        metrics.append((BEST_TIME, workout_set.time_seconds))
+    if workout_set.distance:
+        metrics.append((BEST_DISTANCE, workout_set.distance))
+    return metrics
+
+
+class PREngine:
+    """Best value per user, exercise and metric with constant-time updates.
+
+    ``backfill`` loads the records ``SetHistory.personal_records`` finds in
+    one vectorized pass over the history's columns, and ``record_set`` then
+    folds in each newly completed set by comparing it to the stored best, so
+    no check ever rescans history. Records are history:
+    deleting a workout later does not retract a record it set.
+    """
+
+    def __init__(self, recent_limit: int = 10):
+        self._recent_limit = recent_limit
+        self.clear()
+
+    def clear(self) -> None:
+        """Forget every record"""
+        self._best: dict[RecordKey, float] = {}
+        self._recent: dict[str, deque[PersonalRecord]] = {}
+
+    def best(self, user_id: str, exercise_id: str, metric: str) -> float | None:
+        """Current best value, or None if nothing has been logged"""
+        return self._best.get((user_id, exercise_id, metric))
+
+    def is_pr(self, user_id: str, exercise_id: str, metric: str, value: float) -> bool:
+        """Whether a value would beat the current best"""
+        best = self._best.get((user_id, exercise_id, metric))
+        if best is None:
+            return True
+        if HIGHER_IS_BETTER[metric]:
+            return value > best
+        return value < best
+
+    def record_set(
+        self,
+        user_id: str,
+        exercise: Exercise,
+        workout_set: WorkoutExerciseSet,
+        achieved_at: datetime,
+    ) -> list[PersonalRecord]:
+        """Fold in one completed set, returning any records it set"""
+        records = []
+        for metric, value in set_metrics(exercise, workout_set):
+            if not self.is_pr(user_id, exercise.id, metric, value):
+                continue
+            record = PersonalRecord(
+                user_id=user_id,
+                exercise_id=exercise.id,
+                exercise_name=exercise.name,
+                metric=metric,
+                value=value,
+                previous=self._best.get((user_id, exercise.id, metric)),
+                achieved_at=achieved_at,
+            )
+            records.append(self._push(record))
+        return records
+
+    def record_workout(self, workout: WorkoutResponse) -> list[PersonalRecord]:
+        """Fold in every completed set of a workout"""
+        achieved_at = workout.completed_at or workout.started_at
+        records = []
+        for workout_exercise in workout.exercises:
+            for workout_set in workout_exercise.sets:
+                records.extend(
+                    self.record_set(
+                        workout.user_id,
+                        workout_exercise.exercise,
+                        workout_set,
+                        achieved_at,
+                    )
+                )
+        return records
+
+    def backfill(self, records: Iterable[PersonalRecord]) -> None:
+        """Load records found in bulk over a set history, oldest first"""
+        for record in records:
+            self._push(record)
+
+    def recent(self, user_id: str, limit: int = 3) -> list[PersonalRecord]:
+        """Most recent records for a user, newest first"""
+        return list(islice(self._recent.get(user_id, ()), limit))
+
+    def _push(self, record: PersonalRecord) -> PersonalRecord:
+        """Make a record the best and the user's most recent one"""
+        recent = self._recent.get(record.user_id)
+        if recent is None:
+            recent = self._recent[record.user_id] = deque(maxlen=self._recent_limit)
+        elif _same_session(
+            recent[0], record.exercise_id, record.metric, record.achieved_at
+        ):
+            # A later set beat an earlier one from the same session
+            record = replace(record, previous=recent.popleft().previous)
+        self._best[(record.user_id, record.exercise_id, record.metric)] = record.value
+        recent.appendleft(record)
+        return record
+
+
+def _same_session(
+    record: PersonalRecord, exercise_id: str, metric: str, achieved_at: datetime
+) -> bool:
+    """Whether a record came from the same exercise and metric in one session"""
+    return (
+        record.exercise_id == exercise_id
+        and record.metric == metric
+        and record.achieved_at == achieved_at
+    )
@@ -0,0 +1,115 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass
+
+
+@dataclass
+class _Entry:
+    body: bytes
+    expires_at: float
+    tags: tuple[str, ...]
+
+
+class ResponseCache:
+    """LRU cache of serialized response bodies with TTLs and tag invalidation.
+
+    Entries are evicted least-recently-used first once either the entry count
+    or the total body size exceeds its limit. Each entry is filed under tags
+    naming the data it was built from, and mutating routes invalidate those
+    tags so a cached body never outlives the data behind it.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 16 * 1024 * 1024,
+        ttl_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters"""
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._by_tag: dict[str, set[Hashable]] = {}
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: Hashable) -> bytes | None:
+        """Cached body for a key, or None if absent or expired"""
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= self._clock():
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.body
+
+    def set(
+        self,
+        key: Hashable,
+        body: bytes,
+        tags: Iterable[str] = (),
+        ttl_seconds: float | None = None,
+    ) -> None:
+        """Store a body, evicting least-recently-used entries to fit"""
+        if len(body) > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        entry = _Entry(body=body, expires_at=self._clock() + ttl, tags=tuple(tags))
+        self._entries[key] = entry
+        self._bytes += len(body)
+        for tag in entry.tags:
+            self._by_tag.setdefault(tag, set()).add(key)
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def invalidate(self, *tags: str) -> None:
+        """Drop every entry filed under any of the tags"""
+        for tag in tags:
+            for key in self._by_tag.pop(tag, ()):
+                self._remove(key)
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._bytes -= len(entry.body)
+        for tag in entry.tags:
+            keys = self._by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_tag[tag]
@@ -0,0 +1,53 @@
+from functools import lru_cache
+from typing import Any
+
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+
+
+@lru_cache
+def _adapter(response_type: Any) -> TypeAdapter:
+    """Shared serializer for a response type"""
+    return TypeAdapter(response_type)
+
+
+def trusted_response(
+    content: Any,
+    response_type: Any,
+    headers: dict[str, str] | None = None,
+    etag: str | None = None,
+) -> Response:
+    """Serialize trusted models straight to JSON.
+
+    Returning a ``Response`` makes FastAPI skip its ``response_model``
+    validation and ``jsonable_encoder`` pass, while the route's declared
+    ``response_model`` still drives the OpenAPI schema. Only use this for
+    models the app built and validated itself; ``response_type`` must match
+    the route's ``response_model`` so the body agrees with the schema.
+    """
+    return json_response(serialize(content, response_type), headers, etag)
+
+
+def serialize(content: Any, response_type: Any) -> bytes:
+    """JSON body for trusted models, without validating them again"""
+    return _adapter(response_type).dump_json(content)
+
+
+def json_response(
+    body: bytes, headers: dict[str, str] | None = None, etag: str | None = None
+) -> Response:
+    """Response for an already-serialized JSON body"""
+    if etag is not None:
+        headers = {**(headers or {}), "ETag": etag}
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def not_modified(request: Request, etag: str) -> Response | None:
+    """A 304 response if the client's If-None-Match already has ``etag``"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return None
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if "*" in candidates or etag in candidates:
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
@@ -0,0 +1,234 @@
+from bisect import bisect_left, insort
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, fields
+from datetime import date, timedelta
+
+from .schemas import WorkoutResponse
+
+DAY = "day"
+WEEK = "week"
+MONTH = "month"
+
+# Series every user has, beside one per exercise and per muscle group
+ALL = "all"
+
+# Ranges up to these lengths are answered at day and week granularity
+MAX_DAILY_SPAN = timedelta(days=31)
+MAX_WEEKLY_SPAN = timedelta(weeks=26)
+
+SeriesKey = tuple[str, str]
+
+
+def exercise_series(exercise_id: str) -> str:
+    return f"exercise:{exercise_id}"
+
+
+def muscle_series(muscle_group: str) -> str:
+    return f"muscle:{muscle_group.lower()}"
+
+
+def week_start(day: date) -> date:
+    """Monday of the ISO week containing a day"""
+    return day - timedelta(days=day.weekday())
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+@dataclass
+class Bucket:
+    """Training totals over one period"""
+
+    workouts: int = 0
+    sets: int = 0
+    reps: int = 0
+    tonnage: float = 0.0
+    distance: float = 0.0
+    duration_seconds: int = 0
+
+    def add(self, other: "Bucket", sign: int = 1) -> None:
+        for item in fields(self):
+            name = item.name
+            setattr(self, name, getattr(self, name) + sign * getattr(other, name))
+
+    def is_empty(self) -> bool:
+        # Every contribution counts one workout, and float totals may not
+        # cancel exactly, so the workout count decides
+        return self.workouts == 0
+
+
+class _Series:
+    """Buckets keyed by period start, with the starts kept sorted"""
+
+    def __init__(self):
+        self.buckets: dict[date, Bucket] = {}
+        self.starts: list[date] = []
+
+    def add(self, start: date, delta: Bucket, sign: int) -> None:
+        bucket = self.buckets.get(start)
+        if bucket is None:
+            bucket = self.buckets[start] = Bucket()
+            insort(self.starts, start)
+        bucket.add(delta, sign)
+        if bucket.is_empty():
+            del self.buckets[start]
+            del self.starts[bisect_left(self.starts, start)]
+
+    def between(self, first: date, last: date) -> Iterator[tuple[date, Bucket]]:
+        """Buckets starting from ``first`` up to and including ``last``"""
+        for index in range(bisect_left(self.starts, first), len(self.starts)):
+            start = self.starts[index]
+            if start > last:
+                break
+            yield start, self.buckets[start]
+
+
+class ProgressRollups:
+    """Daily and weekly training totals per user, exercise and muscle group.
+
+    Completed workouts are folded into their day's and week's buckets as they
+    are recorded, remembering each contribution so edits and deletes subtract
+    exactly what was added. Range queries read only the buckets in range;
+    monthly series are merged on the fly from the weekly and daily buckets.
+    """
+
+    def __init__(self, workouts: Iterable[WorkoutResponse] = ()):
+        self.clear()
+        for workout in workouts:
+            self.record(workout)
+
+    def clear(self) -> None:
+        """Forget every workout"""
+        self._daily: dict[SeriesKey, _Series] = {}
+        self._weekly: dict[SeriesKey, _Series] = {}
+        self._contributions: dict[str, tuple[str, date, dict[str, Bucket]]] = {}
+
+    def record(self, workout: WorkoutResponse) -> None:
+        """Apply a created or changed workout, replacing its prior contribution"""
+        self.discard(workout.id)
+        if workout.status != "completed":
+            return
+
+        deltas = _contribution(workout)
+        day = (workout.completed_at or workout.started_at).date()
+        self._contributions[workout.id] = (workout.user_id, day, deltas)
+        self._apply(workout.user_id, day, deltas, 1)
+
+    def discard(self, workout_id: str) -> None:
+        """Remove a workout's contribution, if it has one"""
+        contribution = self._contributions.pop(workout_id, None)
+        if contribution is not None:
+            user_id, day, deltas = contribution
+            self._apply(user_id, day, deltas, -1)
+
+    def query(
+        self,
+        user_id: str,
+        start: date,
+        end: date,
+        granularity: str,
+        series: str = ALL,
+    ) -> list[tuple[date, Bucket]]:
+        """Non-empty buckets of one series for days ``start`` to ``end``.
+
+        Weekly buckets cover whole weeks, so the first may begin before
+        ``start``; monthly ones are clipped to the range.
+        """
+        key = (user_id, series)
+        if granularity == DAY:
+            return [
+                (day, _copy(bucket))
+                for day, bucket in self._between(self._daily, key, start, end)
+            ]
+        if granularity == WEEK:
+            return [
+                (week, _copy(bucket))
+                for week, bucket in self._between(
+                    self._weekly, key, week_start(start), end
+                )
+            ]
+        if granularity != MONTH:
+            raise ValueError(f"Unknown granularity: {granularity}")
+
+        months: dict[date, Bucket] = {}
+        for period, bucket in self._month_parts(key, start, end):
+            months.setdefault(month_start(period), Bucket()).add(bucket)
+        return sorted(months.items())
+
+    def _month_parts(
+        self, key: SeriesKey, start: date, end: date
+    ) -> Iterator[tuple[date, Bucket]]:
+        """Buckets covering exactly the days ``start`` to ``end``.
+
+        Weeks inside the range and inside one month are read as a single
+        weekly bucket; only weeks at the range ends or straddling a month
+        boundary fall back to their daily buckets.
+        """
+        for week, bucket in self._between(self._weekly, key, week_start(start), end):
+            last_day = week + timedelta(days=6)
+            if start <= week and last_day <= end and week.month == last_day.month:
+                yield week, bucket
+                continue
+            for day, daily in self._between(self._daily, key, week, last_day):
+                if start <= day <= end:
+                    yield day, daily
+
+    @staticmethod
+    def _between(
+        index: dict[SeriesKey, _Series], key: SeriesKey, first: date, last: date
+    ) -> Iterator[tuple[date, Bucket]]:
+        series = index.get(key)
+        if series is None:
+            return iter(())
+        return series.between(first, last)
+
+    def _apply(
+        self, user_id: str, day: date, deltas: dict[str, Bucket], sign: int
+    ) -> None:
+        for name, delta in deltas.items():
+            key = (user_id, name)
+            self._daily.setdefault(key, _Series()).add(day, delta, sign)
+            self._weekly.setdefault(key, _Series()).add(week_start(day), delta, sign)
+
+
+def choose_granularity(start: date, end: date) -> str:
+    """Finest granularity that keeps a range to a readable number of points"""
+    span = end - start
+    if span <= MAX_DAILY_SPAN:
+        return DAY
+    if span <= MAX_WEEKLY_SPAN:
+        return WEEK
+    return MONTH
+
+
+def _copy(bucket: Bucket) -> Bucket:
+    copy = Bucket()
+    copy.add(bucket)
+    return copy
+
+
+def _contribution(workout: WorkoutResponse) -> dict[str, Bucket]:
+    """Totals a completed workout adds to each of its series"""
+    deltas: dict[str, Bucket] = {
+        ALL: Bucket(workouts=1, duration_seconds=workout.duration_seconds or 0)
+    }
+    for slot in workout.exercises:
+        exercise = slot.exercise
+        names = [exercise_series(exercise.id)]
+        names.extend({muscle_series(group) for group in exercise.muscle_groups})
+        touched = {name: deltas.setdefault(name, Bucket()) for name in names}
+        for bucket in touched.values():
+            bucket.workouts = 1
+        for workout_set in slot.sets:
+            if not workout_set.completed:
+                continue
+            reps = workout_set.reps or 0
+            tonnage = (workout_set.weight or 0) * reps
+            distance = workout_set.distance or 0
+            for bucket in (deltas[ALL], *touched.values()):
+                bucket.sets += 1
+                bucket.reps += reps
+                bucket.tonnage += tonnage
+                bucket.distance += distance
+    return deltas
@@ -1,27 +1,167 @@
+import heapq
 import uuid
-from datetime import datetime
-
-from fastapi import APIRouter, HTTPException, Query
-
-from .mock_data import (
-    MOCK_EXERCISES,
-    MOCK_USER,
-    MOCK_WORKOUTS,
-    WORKOUT_TEMPLATES,
-    get_user_stats,
+from dataclasses import asdict
+from datetime import date, datetime, timedelta
+from itertools import islice
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    WebSocket,
+    WebSocketDisconnect,
 )
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter, ValidationError
+
+from . import persistence
+from .batch import BatchPlanner
+from .change_log import EXERCISE, WORKOUT, Change
+from .config import settings
+from .database import database_enabled, session_scope
+from .export import MEDIA_TYPES, export_workouts
+from .history_import import HistoryImporter
+from .live_session import apply_event, newly_completed
+from .mock_data import MOCK_USER
+from .pagination import decode_cursor, encode_cursor
+from .periodization import PlanParameters
+from .responses import json_response, not_modified, serialize, trusted_response
+from .rollups import ALL, choose_granularity, exercise_series, muscle_series
 from .schemas import (
     APIResponse,
     Exercise,
+    ExerciseCreate,
+    ExerciseSuggestion,
+    ImportResponse,
+    LiveEvent,
+    LocalDatetime,
+    PlanResponse,
+    ProgressPoint,
+    ProgressResponse,
     StatsResponse,
+    SyncResponse,
     User,
+    VolumeResponse,
+    WorkoutBatchRequest,
+    WorkoutBatchResponse,
     WorkoutCreate,
     WorkoutResponse,
     WorkoutSummary,
 )
+from .store import (
+    change_feed,
+    change_log,
+    ensure_loaded,
+    exercise_catalog,
+    live_sessions,
+    plan_engine,
+    pr_engine,
+    progress_rollups,
+    resource_versions,
+    response_cache,
+    set_history,
+    stats_engine,
+    template_repository,
+    workout_repository,
+)
+from .versions import EXERCISES, TEMPLATES, WORKOUTS, stats_key, workout_key
+from .workout_repository import instantiate_template, started_at_key
+
+
+async def load_on_first_request() -> None:
+    """Load the demo data if the app is served without a startup lifespan"""
+    ensure_loaded()
+
+
+async def follow_other_workers() -> None:
+    """Apply writes other worker processes committed since the last request"""
+    if not change_feed.active or not database_enabled():
+        return
+    # One poll at a time, so changes are replayed in sequence order
+    async with change_feed.lock:
+        async with session_scope() as session:
+            changes = await change_feed.poll(session)
+            foreign = [
+                change for change, own in changes if not own and not change.deleted
+            ]
+            workouts = await persistence.load_workouts_by_id(
+                session, [change.id for change in foreign if change.kind == WORKOUT]
+            )
+            exercises = await persistence.load_exercises_by_id(
+                session, [change.id for change in foreign if change.kind == EXERCISE]
+            )
+
+        loaded = {(WORKOUT, workout.id): workout for workout in workouts}
+        loaded.update({(EXERCISE, exercise.id): exercise for exercise in exercises})
+        for change, own in changes:
+            if not own:
+                _apply_remote_change(change, loaded.get((change.kind, change.id)))
+            change_log.replay(change)
+
+
+def _apply_remote_change(
+    change: Change, record: WorkoutResponse | Exercise | None
+) -> None:
+    """Bring in-memory state in line with a change made by another worker"""
+    if change.kind == EXERCISE:
+        if record is not None:
+            exercise_catalog.add(record)
+        resource_versions.bump(EXERCISES)
+        response_cache.invalidate(EXERCISES)
+        return
+
+    if change.deleted or record is None:
+        deleted_workout = workout_repository.delete(change.id)
+        if deleted_workout is None:
+            return
+        stats_engine.discard(change.id)
+        progress_rollups.discard(change.id)
+        set_history.discard_workout(change.id)
+        plan_engine.record_workout(deleted_workout)
+        user_id = deleted_workout.user_id
+    elif record.is_template:
+        template_repository.put(record)
+        resource_versions.bump(TEMPLATES)
+        response_cache.invalidate(TEMPLATES)
+        return
+    else:
+        _store_workout(record)
+        user_id = record.user_id
+    resource_versions.bump(WORKOUTS, workout_key(change.id))
+    response_cache.invalidate(stats_key(user_id))
+
+
+# Create API router; every route first catches up with other workers
+api_router = APIRouter(
+    prefix="/api",
+    tags=["api"],
+    dependencies=[Depends(load_on_first_request), Depends(follow_other_workers)],
+)
+
+# Close code for a live session on a workout that does not exist
+WS_WORKOUT_NOT_FOUND = 4404
+
+_live_events = TypeAdapter(LiveEvent)
+
+
+def _store_workout(workout: WorkoutResponse, detect_records: bool = True) -> None:
+    """Replace a stored workout whose sets may have changed.
 
-# Create API router
-api_router = APIRouter(prefix="/api", tags=["api"])
+    Without ``detect_records`` the caller rebuilds personal records itself.
+    """
+    workout_repository.put(workout)
+    stats_engine.record(workout)
+    progress_rollups.record(workout)
+    # Replace rather than append, so edited sets are not counted twice
+    set_history.discard_workout(workout.id)
+    if workout.status == "completed":
+        if detect_records:
+            pr_engine.record_workout(workout)
+        set_history.append_workout(workout)
+    plan_engine.record_workout(workout)
 
 
 # Mock authentication - returns current user
@@ -34,53 +174,325 @@ async def get_current_user():
 @api_router.get("/users/me/stats", response_model=StatsResponse)
 async def get_user_stats_endpoint():
     """Get current user's workout statistics"""
-    stats = get_user_stats(MOCK_USER.id)
-    return StatsResponse(**stats)
+    cache_key = ("stats", MOCK_USER.id)
+    body = response_cache.get(cache_key)
+    if body is None:
+        stats = stats_engine.get_stats(MOCK_USER.id)
+        recent_prs = [record.display() for record in pr_engine.recent(MOCK_USER.id)]
+        body = serialize(StatsResponse(**stats, recent_prs=recent_prs), StatsResponse)
+        response_cache.set(cache_key, body, tags=(stats_key(MOCK_USER.id),))
+    return json_response(body)
+
+
+@api_router.get("/users/me/volume", response_model=VolumeResponse)
+async def get_user_volume(
+    exercise_id: str | None = Query(None, description="Limit to one exercise"),
+    start: datetime | None = Query(None, description="Sets completed from this time"),
+    end: datetime | None = Query(None, description="Sets completed before this time"),
+):
+    """Get current user's training volume over completed sets"""
+    volume = set_history.volume(MOCK_USER.id, exercise_id, start, end)
+    tonnage = set_history.tonnage(MOCK_USER.id, exercise_id, start, end)
+    return VolumeResponse(**volume, tonnage=tonnage)
+
+
+@api_router.get("/users/me/progress", response_model=ProgressResponse)
+async def get_user_progress(
+    start: date | None = Query(None, description="First day; default 12 weeks ago"),
+    end: date | None = Query(None, description="Last day; default today"),
+    granularity: str = Query(
+        "auto", pattern="^(auto|day|week|month)$", description="Bucket size"
+    ),
+    exercise_id: str | None = Query(None, description="Limit to one exercise"),
+    muscle_group: str | None = Query(None, description="Limit to one muscle group"),
+):
+    """Get current user's volume, tonnage and duration over time"""
+    if exercise_id and muscle_group:
+        raise HTTPException(
+            status_code=400, detail="Filter by exercise or muscle group, not both"
+        )
+    end = end or date.today()
+    start = start or end - timedelta(weeks=12) + timedelta(days=1)
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must not be after end")
+
+    if granularity == "auto":
+        granularity = choose_granularity(start, end)
+    series = ALL
+    if exercise_id:
+        series = exercise_series(exercise_id)
+    elif muscle_group:
+        series = muscle_series(muscle_group)
+
+    buckets = progress_rollups.query(MOCK_USER.id, start, end, granularity, series)
+    points = [
+        ProgressPoint(period_start=period, **asdict(bucket))
+        for period, bucket in buckets
+    ]
+    return trusted_response(
+        ProgressResponse(
+            granularity=granularity,
+            start=start,
+            end=end,
+            series=series,
+            points=points,
+        ),
+        ProgressResponse,
+    )
+
+
+@api_router.get(
+    "/users/me/export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {media: {} for media in MEDIA_TYPES.values()}}},
+)
+async def export_user_history(
+    export_format: str = Query(
+        "ndjson", alias="format", pattern="^(ndjson|csv)$", description="File format"
+    ),
+):
+    """Download current user's full workout history, one set per row.
+
+    The body is streamed a chunk of workouts at a time, oldest first.
+    """
+    filename = f"velocollab-history-{date.today():%Y%m%d}.{export_format}"
+    return StreamingResponse(
+        export_workouts(
+            workout_repository,
+            MOCK_USER.id,
+            export_format,
+            settings.export_chunk_size,
+        ),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@api_router.post("/users/me/import", response_model=ImportResponse)
+async def import_user_history(
+    request: Request,
+    import_format: str = Query(
+        "ndjson", alias="format", pattern="^(ndjson|csv)$", description="File format"
+    ),
+):
+    """Import workout history from an upload in the export's format.
+
+    The body is parsed as it arrives and stored a chunk of workouts at a
+    time, each chunk in its own transaction. Invalid rows are skipped and
+    reported; the rest of the upload is still imported. Uploads need not be
+    in date order, so personal records are rebuilt from the whole history
+    once the import is done.
+    """
+    importer = HistoryImporter(
+        MOCK_USER.id, exercise_catalog, settings.import_chunk_size
+    )
+    result = ImportResponse(
+        rows=0, workouts=0, sets=0, chunks=0, error_count=0, errors=[]
+    )
+    async for chunk in importer.chunks(request.stream(), import_format):
+        result.rows += chunk.rows
+        result.error_count += chunk.error_count
+        result.errors.extend(chunk.errors)
+        if not chunk.workouts:
+            continue
+
+        if database_enabled():
+            async with session_scope() as session:
+                await persistence.save_workouts(session, chunk.workouts)
+        chunk.workouts.sort(key=lambda w: w.completed_at or w.started_at)
+        for workout in chunk.workouts:
+            _store_workout(workout, detect_records=False)
+            change_log.record(WORKOUT, workout.id)
+            result.sets += sum(len(slot.sets) for slot in workout.exercises)
+        resource_versions.bump(WORKOUTS, *(workout_key(w.id) for w in chunk.workouts))
+        result.workouts += len(chunk.workouts)
+        result.chunks += 1
+
+    if result.workouts:
+        pr_engine.clear()
+        pr_engine.backfill(set_history.personal_records())
+        response_cache.invalidate(stats_key(MOCK_USER.id))
+    return result
+
+
+@api_router.get("/users/me/plan", response_model=PlanResponse)
+async def get_user_plan(
+    template_id: str = Query(..., description="Workout template to periodize"),
+    goal_percent: float = Query(
+        10, gt=0, le=50, description="Target gain in estimated 1RM or reps, percent"
+    ),
+    weeks: int = Query(4, ge=1, le=16, description="Plan length in weeks"),
+    sessions_per_week: int = Query(3, ge=1, le=7, description="Sessions per week"),
+    start: date | None = Query(None, description="First day of the plan"),
+):
+    """Get a goal-based periodization plan of suggested workouts.
+
+    Loaded exercises progress from the current estimated 1RM to the goal;
+    unloaded ones progress in reps. Weeks are re-planned as new sets arrive.
+    """
+    template = template_repository.get(template_id)
+    if not template:
+        raise HTTPException(status_code=404, detail="Template not found")
+
+    parameters = PlanParameters(
+        template_id=template_id,
+        goal_percent=goal_percent,
+        weeks=weeks,
+        sessions_per_week=sessions_per_week,
+        start=start or date.today(),
+    )
+    plan = plan_engine.plan(MOCK_USER.id, template, parameters)
+    return trusted_response(
+        PlanResponse(
+            template_id=template_id,
+            goal_percent=goal_percent,
+            weeks=weeks,
+            sessions_per_week=sessions_per_week,
+            start=parameters.start,
+            baselines=plan.baselines,
+            targets=plan.targets,
+            workouts=plan.workouts,
+        ),
+        PlanResponse,
+    )
 
 
 @api_router.get("/exercises", response_model=list[Exercise])
 async def get_exercises(
+    request: Request,
     category: str | None = Query(
         None, description="Filter by category: strength, cardio, plyometric, speed"
     ),
     muscle_group: str | None = Query(None, description="Filter by muscle group"),
+    equipment: str | None = Query(None, description="Filter by equipment"),
     search: str | None = Query(None, description="Search exercise names"),
     include_custom: bool = Query(True, description="Include user's custom exercises"),
 ):
     """Get all exercises with optional filtering"""
-    exercises = MOCK_EXERCISES.copy()
-
-    # Apply filters
-    if category:
-        exercises = [ex for ex in exercises if ex.category.lower() == category.lower()]
-
-    if muscle_group:
-        exercises = [
-            ex
-            for ex in exercises
-            if muscle_group.lower() in [mg.lower() for mg in ex.muscle_groups]
+    etag = resource_versions.etag(EXERCISES)
+    if cached := not_modified(request, etag):
+        return cached
+
+    # Filters are case-insensitive, so normalize them into the cache key
+    cache_key = (
+        "exercises",
+        MOCK_USER.id,
+        category.lower() if category else None,
+        muscle_group.lower() if muscle_group else None,
+        equipment.lower() if equipment else None,
+        search.lower() if search else None,
+        include_custom,
+    )
+    body = response_cache.get(cache_key)
+    if body is None:
+        exercises = exercise_catalog.filter(
+            category=category,
+            muscle_group=muscle_group,
+            equipment=equipment,
+            search=search,
+            include_custom=include_custom,
+        )
+        body = serialize(exercises, list[Exercise])
+        response_cache.set(cache_key, body, tags=(EXERCISES,))
+    return json_response(body, etag=etag)
+
+
+@api_router.post("/exercises", response_model=Exercise)
+async def create_exercise(exercise_data: ExerciseCreate):
+    """Create a custom exercise for the current user"""
+    new_exercise = Exercise(
+        id=f"ex_{uuid.uuid4().hex[:8]}",
+        is_custom=True,
+        created_by=MOCK_USER.id,
+        **exercise_data.model_dump(),
+    )
+    if database_enabled():
+        async with session_scope() as session:
+            await persistence.save_exercise(session, new_exercise)
+    exercise_catalog.add(new_exercise)
+    resource_versions.bump(EXERCISES)
+    change_log.record(EXERCISE, new_exercise.id)
+    response_cache.invalidate(EXERCISES)
+
+    return new_exercise
+
+
+@api_router.get("/exercises/search", response_model=list[Exercise])
+async def search_exercises(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=100, description="Search text"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum results"),
+    include_custom: bool = Query(True, description="Include user's custom exercises"),
+):
+    """Search exercise names, muscle groups and equipment, best match first.
+
+    Exact name matches rank first, then name prefixes, then other matches,
+    then matches that needed typo correction.
+    """
+    etag = resource_versions.etag(EXERCISES)
+    if cached := not_modified(request, etag):
+        return cached
+
+    # Results can include the user's custom exercises, so are cached per user
+    cache_key = (
+        "exercise-search",
+        MOCK_USER.id,
+        " ".join(q.lower().split()),
+        limit,
+        include_custom,
+    )
+    body = response_cache.get(cache_key)
+    if body is None:
+        exercises = exercise_catalog.search(q, limit, include_custom=include_custom)
+        body = serialize(exercises, list[Exercise])
+        response_cache.set(cache_key, body, tags=(EXERCISES,))
+    return json_response(body, etag=etag)
+
+
+@api_router.get("/exercises/autocomplete", response_model=list[ExerciseSuggestion])
+async def autocomplete_exercises(
+    request: Request,
+    prefix: str = Query(..., min_length=1, max_length=100, description="Typed text"),
+    limit: int = Query(10, ge=1, le=50, description="Maximum suggestions"),
+):
+    """IDs and names of exercises with a name word starting with the prefix"""
+    etag = resource_versions.etag(EXERCISES)
+    if cached := not_modified(request, etag):
+        return cached
+
+    cache_key = (
+        "exercise-autocomplete",
+        MOCK_USER.id,
+        " ".join(prefix.lower().split()),
+        limit,
+    )
+    body = response_cache.get(cache_key)
+    if body is None:
+        suggestions = [
+            ExerciseSuggestion(id=exercise.id, name=exercise.name)
+            for exercise in exercise_catalog.autocomplete(prefix, limit)
         ]
-
-    if search:
-        exercises = [ex for ex in exercises if search.lower() in ex.name.lower()]
-
-    if not include_custom:
-        exercises = [ex for ex in exercises if not ex.is_custom]
-
-    return exercises
+        body = serialize(suggestions, list[ExerciseSuggestion])
+        response_cache.set(cache_key, body, tags=(EXERCISES,))
+    return json_response(body, etag=etag)
 
 
 @api_router.get("/exercises/{exercise_id}", response_model=Exercise)
-async def get_exercise(exercise_id: str):
+async def get_exercise(exercise_id: str, request: Request):
     """Get a specific exercise by ID"""
-    exercise = next((ex for ex in MOCK_EXERCISES if ex.id == exercise_id), None)
+    exercise = exercise_catalog.get(exercise_id)
     if not exercise:
         raise HTTPException(status_code=404, detail="Exercise not found")
-    return exercise
+
+    etag = resource_versions.etag(EXERCISES)
+    if cached := not_modified(request, etag):
+        return cached
+    return trusted_response(exercise, Exercise, etag=etag)
 
 
 @api_router.get("/workouts", response_model=list[WorkoutSummary])
 async def get_user_workouts(
+    request: Request,
     status: str | None = Query(
         None, description="Filter by status: planned, in_progress, completed"
     ),
@@ -88,46 +500,77 @@ async def get_user_workouts(
     limit: int = Query(
         50, ge=1, le=100, description="Maximum number of workouts to return"
     ),
+    cursor: str | None = Query(
+        None, description="Opaque cursor from a previous page's X-Next-Cursor"
+    ),
+    started_after: LocalDatetime | None = Query(
+        None, description="Only workouts started at or after this time"
+    ),
+    started_before: LocalDatetime | None = Query(
+        None, description="Only workouts started before this time"
+    ),
 ):
-    """Get user's workouts with optional filtering"""
-    workouts = MOCK_WORKOUTS.copy()
+    """Get user's workouts, newest first, one keyset page at a time"""
+    etag = (
+        resource_versions.etag(WORKOUTS, TEMPLATES)
+        if include_templates
+        else resource_versions.etag(WORKOUTS)
+    )
+    if cached := not_modified(request, etag):
+        return cached
+
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+
+    def walk(repository):
+        return repository.iter_by_started_at(
+            descending=True, start=started_after, end=started_before, after=after
+        )
 
+    workouts = walk(workout_repository)
     if include_templates:
-        workouts.extend(WORKOUT_TEMPLATES)
+        workouts = heapq.merge(
+            workouts, walk(template_repository), key=started_at_key, reverse=True
+        )
 
     # Apply status filter
     if status:
-        workouts = [w for w in workouts if w.status.lower() == status.lower()]
-
-    # Convert to summary format
-    summaries = []
-    for workout in workouts[:limit]:
-        summaries.append(
-            WorkoutSummary(
-                id=workout.id,
-                name=workout.name,
-                started_at=workout.started_at,
-                completed_at=workout.completed_at,
-                duration_seconds=workout.duration_seconds,
-                exercise_count=len(workout.exercises),
-                status=workout.status,
-            )
+        workouts = (w for w in workouts if w.status.lower() == status.lower())
+
+    # Read one past the page to learn whether another page exists
+    page = list(islice(workouts, limit + 1))
+    headers = {}
+    if len(page) > limit:
+        page = page[:limit]
+        headers["X-Next-Cursor"] = encode_cursor(started_at_key(page[-1]))
+
+    # Serve cached summary projections
+    summaries = [
+        (template_repository if workout.is_template else workout_repository).summary(
+            workout
         )
-
-    return summaries
+        for workout in page
+    ]
+    return trusted_response(summaries, list[WorkoutSummary], headers=headers, etag=etag)
 
 
 @api_router.get("/workouts/{workout_id}", response_model=WorkoutResponse)
-async def get_workout(workout_id: str):
+async def get_workout(workout_id: str, request: Request):
     """Get a specific workout by ID with full details"""
     # Check both workouts and templates
-    all_workouts = MOCK_WORKOUTS + WORKOUT_TEMPLATES
-    workout = next((w for w in all_workouts if w.id == workout_id), None)
+    workout = workout_repository.get(workout_id) or template_repository.get(workout_id)
 
     if not workout:
         raise HTTPException(status_code=404, detail="Workout not found")
 
-    return workout
+    etag = resource_versions.etag(workout_key(workout_id))
+    if cached := not_modified(request, etag):
+        return cached
+    return trusted_response(workout, WorkoutResponse, etag=etag)
 
 
 @api_router.post("/workouts", response_model=WorkoutResponse)
@@ -139,11 +582,9 @@ async def create_workout(workout_data: WorkoutCreate):
     # If creating from template, load template data
     exercises = []
     if workout_data.template_id:
-        template = next(
-            (t for t in WORKOUT_TEMPLATES if t.id == workout_data.template_id), None
-        )
+        template = template_repository.get(workout_data.template_id)
         if template:
-            exercises = template.exercises
+            exercises = instantiate_template(template)
 
     # Create new workout
     new_workout = WorkoutResponse(
@@ -156,39 +597,227 @@ async def create_workout(workout_data: WorkoutCreate):
         exercises=exercises,
     )
 
-    # Add to mock data (in real app, this would be saved to database)
-    MOCK_WORKOUTS.append(new_workout)
+    # Commit before touching memory, so a failed write leaves no trace there
+    if database_enabled():
+        async with session_scope() as session:
+            await persistence.save_workout(session, new_workout)
+    workout_repository.put(new_workout)
+    stats_engine.record(new_workout)
+    progress_rollups.record(new_workout)
+    resource_versions.bump(WORKOUTS, workout_key(new_id))
+    change_log.record(WORKOUT, new_id)
+    response_cache.invalidate(stats_key(MOCK_USER.id))
 
     return new_workout
 
 
+@api_router.post("/workouts/batch", response_model=WorkoutBatchResponse)
+async def batch_workouts(
+    batch: WorkoutBatchRequest,
+    response: Response,
+):
+    """Apply create, update, complete and delete operations atomically.
+
+    Every operation is validated before any is applied; if one fails the
+    response is a 422 carrying each operation's result and nothing changes.
+    """
+    planner = BatchPlanner(
+        MOCK_USER.id, workout_repository, template_repository, exercise_catalog
+    )
+    plan = planner.plan(batch.operations)
+    if not plan.ok:
+        response.status_code = 422
+        return WorkoutBatchResponse(success=False, results=plan.results)
+
+    deleted = [
+        workout_id for workout_id in plan.deleted if workout_id in workout_repository
+    ]
+    if database_enabled():
+        async with session_scope() as session:
+            if deleted:
+                await persistence.delete_workouts(session, deleted)
+            await persistence.save_workouts(session, plan.saved)
+
+    for workout_id in deleted:
+        deleted_workout = workout_repository.delete(workout_id)
+        stats_engine.discard(workout_id)
+        progress_rollups.discard(workout_id)
+        set_history.discard_workout(workout_id)
+        plan_engine.record_workout(deleted_workout)
+    for workout in plan.saved:
+        _store_workout(workout)
+    for workout_id, workout in plan.changes.items():
+        if workout is None:
+            change_log.record_deletion(WORKOUT, workout_id)
+        else:
+            change_log.record(WORKOUT, workout_id)
+    resource_versions.bump(WORKOUTS, *map(workout_key, plan.changes))
+    response_cache.invalidate(stats_key(MOCK_USER.id))
+
+    return WorkoutBatchResponse(success=True, results=plan.results)
+
+
 @api_router.put("/workouts/{workout_id}", response_model=WorkoutResponse)
-async def update_workout(workout_id: str, workout_data: WorkoutCreate):
+async def update_workout(
+    workout_id: str,
+    workout_data: WorkoutCreate,
+):
     """Update an existing workout"""
-    workout = next((w for w in MOCK_WORKOUTS if w.id == workout_id), None)
+    workout = workout_repository.get(workout_id)
 
     if not workout:
         raise HTTPException(status_code=404, detail="Workout not found")
 
-    # Update workout fields
-    workout.name = workout_data.name
-    workout.notes = workout_data.notes
+    # Update a copy, so the stored workout only changes once the write commits
+    workout = workout.model_copy(
+        update={"name": workout_data.name, "notes": workout_data.notes}
+    )
+    if database_enabled():
+        async with session_scope() as session:
+            await persistence.save_workout(session, workout)
+    workout_repository.put(workout)
+    stats_engine.record(workout)
+    progress_rollups.record(workout)
+    resource_versions.bump(WORKOUTS, workout_key(workout_id))
+    change_log.record(WORKOUT, workout_id)
+    response_cache.invalidate(stats_key(MOCK_USER.id))
+
+    return workout
+
+
+@api_router.post("/workouts/{workout_id}/complete", response_model=WorkoutResponse)
+async def complete_workout(workout_id: str):
+    """Mark a workout as completed"""
+    workout = workout_repository.get(workout_id)
+
+    if not workout:
+        raise HTTPException(status_code=404, detail="Workout not found")
+
+    if workout.status != "completed":
+        completed_at = datetime.now()
+        workout = workout.model_copy(
+            update={
+                "completed_at": completed_at,
+                "duration_seconds": int(
+                    (completed_at - workout.started_at).total_seconds()
+                ),
+                "status": "completed",
+            }
+        )
+        if database_enabled():
+            async with session_scope() as session:
+                await persistence.save_workout(session, workout)
+        workout_repository.put(workout)
+        stats_engine.record(workout)
+        progress_rollups.record(workout)
+        pr_engine.record_workout(workout)
+        set_history.append_workout(workout)
+        plan_engine.record_workout(workout)
+        resource_versions.bump(WORKOUTS, workout_key(workout_id))
+        change_log.record(WORKOUT, workout_id)
+        response_cache.invalidate(stats_key(MOCK_USER.id))
 
     return workout
 
 
+@api_router.websocket("/workouts/{workout_id}/live")
+async def live_workout(websocket: WebSocket, workout_id: str):
+    """Stream set-level edits to a workout in progress.
+
+    The client receives a snapshot of the workout, then sends ``set`` and
+    ``remove_set`` events. Each event is applied to the stored workout,
+    echoed to the sender with ``ack`` set and relayed to the user's other
+    devices connected to the same workout. A set marked completed is checked
+    for personal records straight away, and any it sets are listed in the
+    message's ``records``.
+    """
+    workout = workout_repository.get(workout_id)
+    if workout is None or workout.user_id != MOCK_USER.id:
+        await websocket.close(code=WS_WORKOUT_NOT_FOUND)
+        return
+
+    await websocket.accept()
+    live_sessions.connect(workout_id, websocket)
+    try:
+        await websocket.send_json(
+            {"type": "snapshot", "workout": workout.model_dump(mode="json")}
+        )
+        while True:
+            try:
+                event = _live_events.validate_json(await websocket.receive_text())
+            except ValidationError as exc:
+                await websocket.send_json(
+                    {
+                        "type": "error",
+                        "detail": exc.errors(include_url=False, include_context=False),
+                    }
+                )
+                continue
+
+            async with live_sessions.lock(workout_id):
+                workout = workout_repository.get(workout_id)
+                if workout is None:
+                    await websocket.close(code=WS_WORKOUT_NOT_FOUND)
+                    return
+                try:
+                    updated = apply_event(workout, event)
+                except ValueError as exc:
+                    await websocket.send_json({"type": "error", "detail": str(exc)})
+                    continue
+
+                if database_enabled():
+                    async with session_scope() as session:
+                        await persistence.save_workout(session, updated)
+                records = []
+                completed = newly_completed(workout, updated, event)
+                if completed is not None:
+                    records = pr_engine.record_set(
+                        updated.user_id,
+                        updated.exercises[event.exercise_index].exercise,
+                        completed,
+                        updated.completed_at or datetime.now(),
+                    )
+                _store_workout(updated)
+                resource_versions.bump(WORKOUTS, workout_key(workout_id))
+                change_log.record(WORKOUT, workout_id)
+                response_cache.invalidate(stats_key(MOCK_USER.id))
+
+            message = {
+                "type": event.type,
+                "exercise_index": event.exercise_index,
+                "set_number": event.set_number,
+                "status": updated.status,
+            }
+            if event.type == "set":
+                sets = updated.exercises[event.exercise_index].sets
+                changed = next(s for s in sets if s.set_number == event.set_number)
+                message["set"] = changed.model_dump(mode="json")
+                message["records"] = [record.display() for record in records]
+            await websocket.send_json({**message, "ack": True})
+            await live_sessions.broadcast(workout_id, message, exclude=websocket)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        live_sessions.disconnect(workout_id, websocket)
+
+
 @api_router.delete("/workouts/{workout_id}", response_model=APIResponse)
 async def delete_workout(workout_id: str):
     """Delete a workout"""
-    workout_index = next(
-        (i for i, w in enumerate(MOCK_WORKOUTS) if w.id == workout_id), None
-    )
-
-    if workout_index is None:
+    if workout_id not in workout_repository:
         raise HTTPException(status_code=404, detail="Workout not found")
 
-    # Remove from mock data
-    deleted_workout = MOCK_WORKOUTS.pop(workout_index)
+    if database_enabled():
+        async with session_scope() as session:
+            await persistence.delete_workout(session, workout_id)
+    deleted_workout = workout_repository.delete(workout_id)
+    stats_engine.discard(workout_id)
+    progress_rollups.discard(workout_id)
+    set_history.discard_workout(workout_id)
+    plan_engine.record_workout(deleted_workout)
+    resource_versions.bump(WORKOUTS, workout_key(workout_id))
+    change_log.record_deletion(WORKOUT, workout_id)
+    response_cache.invalidate(stats_key(MOCK_USER.id))
 
     return APIResponse(
         success=True, message=f"Workout '{deleted_workout.name}' deleted successfully"
@@ -196,20 +825,56 @@ async def delete_workout(workout_id: str):
 
 
 @api_router.get("/workout-templates", response_model=list[WorkoutSummary])
-async def get_workout_templates():
+async def get_workout_templates(request: Request):
     """Get available workout templates"""
-    summaries = []
-    for template in WORKOUT_TEMPLATES:
-        summaries.append(
-            WorkoutSummary(
-                id=template.id,
-                name=template.name,
-                started_at=template.started_at,
-                completed_at=template.completed_at,
-                duration_seconds=template.duration_seconds,
-                exercise_count=len(template.exercises),
-                status=template.status,
-            )
+    etag = resource_versions.etag(TEMPLATES)
+    if cached := not_modified(request, etag):
+        return cached
+
+    body = response_cache.get("templates")
+    if body is None:
+        summaries = [
+            template_repository.summary(template) for template in template_repository
+        ]
+        body = serialize(summaries, list[WorkoutSummary])
+        response_cache.set("templates", body, tags=(TEMPLATES,))
+    return json_response(body, etag=etag)
+
+
+@api_router.get("/sync", response_model=SyncResponse)
+async def sync(
+    since: int = Query(0, ge=0, description="Cursor returned by the previous sync"),
+):
+    """Workouts and exercises changed since a cursor, with deletion tombstones.
+
+    A cursor that predates the compacted change log (or a restart) gets a full
+    snapshot with ``reset`` set instead.
+    """
+    if change_log.needs_reset(since):
+        workouts = [w for w in workout_repository if w.user_id == MOCK_USER.id]
+        exercises = exercise_catalog.all()
+        return trusted_response(
+            SyncResponse(
+                cursor=change_log.head,
+                reset=True,
+                workouts=workouts,
+                exercises=exercises,
+            ),
+            SyncResponse,
         )
 
-    return summaries
+    result = SyncResponse(cursor=change_log.head)
+    for change in change_log.since(since):
+        if change.kind == WORKOUT:
+            workout = workout_repository.get(change.id)
+            if change.deleted or workout is None:
+                result.deleted_workouts.append(change.id)
+            elif workout.user_id == MOCK_USER.id:
+                result.workouts.append(workout)
+        else:
+            exercise = exercise_catalog.get(change.id)
+            if change.deleted or exercise is None:
+                result.deleted_exercises.append(change.id)
+            else:
+                result.exercises.append(exercise)
+    return trusted_response(result, SyncResponse)
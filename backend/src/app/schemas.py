@@ -1,7 +1,18 @@
-from datetime import datetime
-from typing import Any
+from datetime import date, datetime
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, Field
+
+
+def naive_local(value: datetime) -> datetime:
+    """A timestamp as naive local time, the form every stored one takes"""
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)
+    return value
+
+
+# Accepts a UTC offset, which naive stored timestamps cannot be compared with
+LocalDatetime = Annotated[datetime, AfterValidator(naive_local)]
 
 
 class UserBase(BaseModel):
@@ -34,6 +45,10 @@ class ExerciseBase(BaseModel):
     instructions: str | None = None
 
 
+class ExerciseCreate(ExerciseBase):
+    """Custom exercise creation request model"""
+
+
 class Exercise(ExerciseBase):
     """Complete exercise model for API responses"""
 
@@ -45,6 +60,13 @@ class Exercise(ExerciseBase):
         from_attributes = True
 
 
+class ExerciseSuggestion(BaseModel):
+    """Autocomplete entry for the exercise picker"""
+
+    id: str
+    name: str
+
+
 class WorkoutExerciseSet(BaseModel):
     """Individual set within an exercise"""
 
@@ -57,6 +79,10 @@ class WorkoutExerciseSet(BaseModel):
     notes: str | None = None
     completed: bool = False
 
+    class Config:
+        # Shared between templates and the workouts started from them
+        frozen = True
+
 
 class WorkoutExercise(BaseModel):
     """Exercise within a workout with its sets"""
@@ -65,6 +91,11 @@ class WorkoutExercise(BaseModel):
     sets: list[WorkoutExerciseSet] = Field(default_factory=list)
     notes: str | None = None
 
+    class Config:
+        # Shared between templates and the workouts started from them;
+        # edits replace a slot with a copy rather than changing it in place
+        frozen = True
+
 
 class WorkoutBase(BaseModel):
     """Base workout model"""
@@ -84,8 +115,8 @@ class WorkoutResponse(WorkoutBase):
 
     id: str
     user_id: str
-    started_at: datetime
-    completed_at: datetime | None = None
+    started_at: LocalDatetime
+    completed_at: LocalDatetime | None = None
     duration_seconds: int | None = None
     exercises: list[WorkoutExercise] = Field(default_factory=list)
     is_template: bool = False
@@ -120,6 +151,201 @@ class StatsResponse(BaseModel):
     recent_prs: list[dict[str, Any]]
 
 
+class PlanResponse(BaseModel):
+    """Periodized plan of suggested workouts towards a strength goal"""
+
+    template_id: str
+    goal_percent: float
+    weeks: int
+    sessions_per_week: int
+    start: date
+    baselines: dict[str, float] = Field(
+        ..., description="Estimated 1RM, or max reps if unloaded, per exercise"
+    )
+    targets: dict[str, float]
+    workouts: list[WorkoutResponse]
+
+
+class VolumeResponse(BaseModel):
+    """Training volume over completed sets"""
+
+    sets: int
+    reps: int
+    tonnage: float
+
+
+# Upper bound on operations in one batch write request
+MAX_BATCH_OPERATIONS = 500
+
+
+class WorkoutExerciseWrite(BaseModel):
+    """Exercise slot in a write request, referencing the catalog by ID"""
+
+    exercise_id: str
+    sets: list[WorkoutExerciseSet] = Field(default_factory=list)
+    notes: str | None = None
+
+
+class WorkoutCreateOperation(WorkoutCreate):
+    """Batch operation creating a workout"""
+
+    op: Literal["create"]
+    # At most as long as the workouts.id and record_changes.record_id columns
+    id: str | None = Field(
+        None,
+        pattern=r"^[A-Za-z0-9_-]{1,32}$",
+        description="Client-generated ID that later operations can refer to",
+    )
+    started_at: LocalDatetime | None = None
+    exercises: list[WorkoutExerciseWrite] | None = Field(
+        None, description="Exercises and sets, replacing any template's"
+    )
+
+
+class WorkoutUpdateOperation(BaseModel):
+    """Batch operation updating a workout; omitted fields are left unchanged"""
+
+    op: Literal["update"]
+    id: str
+    name: str | None = Field(None, min_length=1, max_length=100)
+    notes: str | None = None
+    exercises: list[WorkoutExerciseWrite] | None = Field(
+        None, description="Replacement exercises and sets"
+    )
+
+
+class WorkoutCompleteOperation(BaseModel):
+    """Batch operation marking a workout completed"""
+
+    op: Literal["complete"]
+    id: str
+    completed_at: LocalDatetime | None = None
+
+
+class WorkoutDeleteOperation(BaseModel):
+    """Batch operation deleting a workout"""
+
+    op: Literal["delete"]
+    id: str
+
+
+WorkoutOperation = Annotated[
+    WorkoutCreateOperation
+    | WorkoutUpdateOperation
+    | WorkoutCompleteOperation
+    | WorkoutDeleteOperation,
+    Field(discriminator="op"),
+]
+
+
+class WorkoutBatchRequest(BaseModel):
+    """Workout writes applied together, in order, all or nothing"""
+
+    operations: list[WorkoutOperation] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_OPERATIONS
+    )
+
+
+class BatchItemResult(BaseModel):
+    """Outcome of one batch operation"""
+
+    index: int
+    op: str
+    id: str | None = None
+    status: int = Field(..., description="HTTP status the operation alone would get")
+    error: str | None = None
+
+
+class WorkoutBatchResponse(BaseModel):
+    """Per-operation results; nothing is applied unless every operation succeeds"""
+
+    success: bool
+    results: list[BatchItemResult]
+
+
+class SetUpdateEvent(BaseModel):
+    """Live-session event creating or editing one set; omitted fields are kept"""
+
+    type: Literal["set"]
+    exercise_index: int = Field(..., ge=0)
+    set_number: int = Field(..., ge=1)
+    reps: int | None = Field(None, ge=0)
+    weight: float | None = Field(None, ge=0)
+    time_seconds: float | None = Field(None, ge=0)
+    distance: float | None = Field(None, ge=0)
+    rest_seconds: int | None = Field(None, ge=0)
+    notes: str | None = None
+    completed: bool | None = None
+
+
+class SetRemoveEvent(BaseModel):
+    """Live-session event removing one set"""
+
+    type: Literal["remove_set"]
+    exercise_index: int = Field(..., ge=0)
+    set_number: int = Field(..., ge=1)
+
+
+LiveEvent = Annotated[SetUpdateEvent | SetRemoveEvent, Field(discriminator="type")]
+
+
+class SyncResponse(BaseModel):
+    """Records changed since a client's last sync"""
+
+    cursor: int = Field(..., description="Pass as ``since`` on the next sync")
+    reset: bool = Field(
+        False, description="Full snapshot; drop local records not included"
+    )
+    workouts: list[WorkoutResponse] = Field(default_factory=list)
+    exercises: list[Exercise] = Field(default_factory=list)
+    deleted_workouts: list[str] = Field(default_factory=list)
+    deleted_exercises: list[str] = Field(default_factory=list)
+
+
+class ImportRowError(BaseModel):
+    """A history import row that was skipped"""
+
+    line: int = Field(..., description="Line of the upload the row starts on")
+    error: str
+
+
+class ImportResponse(BaseModel):
+    """Outcome of a history import"""
+
+    rows: int
+    workouts: int
+    sets: int
+    chunks: int = Field(..., description="Chunks of workouts stored one by one")
+    error_count: int
+    errors: list[ImportRowError] = Field(
+        ..., description="The first skipped rows, up to a fixed limit"
+    )
+
+
+class ProgressPoint(BaseModel):
+    """Training totals for one period of a progress series"""
+
+    period_start: date
+    workouts: int
+    sets: int
+    reps: int
+    tonnage: float
+    distance: float
+    duration_seconds: int = Field(
+        ..., description="Workout time; only tracked for the overall series"
+    )
+
+
+class ProgressResponse(BaseModel):
+    """Training totals over time, one point per non-empty period"""
+
+    granularity: str = Field(..., description="day, week or month")
+    start: date
+    end: date
+    series: str = Field(..., description="all, exercise:<id> or muscle:<group>")
+    points: list[ProgressPoint]
+
+
 class APIResponse(BaseModel):
     """Standard API response wrapper"""
 
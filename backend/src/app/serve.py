@@ -0,0 +1,131 @@
+"""Preforking launcher for serving the API from every core.
+
+Loads the exercise catalog, templates and persisted workouts once, then
+forks worker processes that share those pages copy-on-write and accept
+connections on one listening socket. Workers keep their own in-memory
+state in step through the database's change table, so more than one
+worker needs a SQLite database (opened in WAL mode).
+
+    cd backend
+    DATABASE_URL=sqlite+aiosqlite:///./velocollab.db python -m src.app.serve
+    python -m src.app.serve --workers 1 --port 8000
+"""
+
+import argparse
+import asyncio
+import gc
+import os
+import signal
+import socket
+import sys
+
+import uvicorn
+
+from . import store
+from .config import settings
+from .database import close_database, init_database
+from .main import app, load_state
+
+
+def preload() -> None:
+    """Load every shared structure in the parent, before any worker forks"""
+    if settings.database_url:
+        asyncio.run(_load_database())
+    else:
+        store.ensure_loaded()
+    app.state.preloaded = True
+    # Leave everything loaded so far to the collector's permanent generation,
+    # so collections in the workers do not write to (and unshare) its pages
+    gc.freeze()
+
+
+async def _load_database() -> None:
+    await init_database(settings.database_url)
+    try:
+        await load_state()
+    finally:
+        # Workers open their own pools; connections must not cross a fork
+        await close_database()
+
+
+def bind(host: str, port: int, backlog: int = 2048) -> socket.socket:
+    """Listening socket inherited by every worker"""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def spawn(sock: socket.socket, config: uvicorn.Config) -> int:
+    """Fork a worker serving the preloaded app on ``sock``"""
+    pid = os.fork()
+    if pid:
+        return pid
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    try:
+        uvicorn.Server(config).run(sockets=[sock])
+    finally:
+        os._exit(0)
+
+
+def supervise(sock: socket.socket, config: uvicorn.Config, workers: int) -> None:
+    """Run ``workers`` workers until signalled, replacing any that exit"""
+    children = {spawn(sock, config) for _ in range(workers)}
+    stopping = False
+
+    def stop(signum, _frame) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in children:
+            os.kill(pid, signal.SIGTERM)
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    while children:
+        try:
+            pid, _ = os.wait()
+        except ChildProcessError:
+            break
+        children.discard(pid)
+        if not stopping:
+            children.add(spawn(sock, config))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.workers or os.cpu_count() or 1,
+        help="Worker processes (default: WORKERS, or one per core)",
+    )
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args(argv)
+
+    if args.workers > 1:
+        if not (settings.database_url or "").startswith("sqlite"):
+            parser.error(
+                "several workers share state through a SQLite database; "
+                "set DATABASE_URL=sqlite+aiosqlite:///<path> or use --workers 1"
+            )
+        store.share_with_workers()
+
+    preload()
+    sock = bind(args.host, args.port)
+    config = uvicorn.Config(app, log_level=args.log_level, lifespan="on")
+    print(
+        f"Serving on http://{args.host}:{args.port} with {args.workers} workers",
+        file=sys.stderr,
+    )
+    supervise(sock, config, args.workers)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
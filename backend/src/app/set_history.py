@@ -0,0 +1,428 @@
+from collections.abc import Iterable
+from datetime import datetime
+
+import numpy as np
+
+from .pr_engine import (
+    BEST_DISTANCE,
+    BEST_TIME,
+    ESTIMATED_1RM,
+    MAX_REPS,
+    TIMED_CATEGORIES,
+    PersonalRecord,
+)
+from .schemas import WorkoutResponse
+
+# Nullable numeric columns and their storage types
+_VALUE_COLUMNS = {
+    "reps": np.int32,
+    "weight": np.float64,
+    "time_seconds": np.float64,
+    "distance": np.float64,
+    "rest_seconds": np.int32,
+}
+
+_INITIAL_CAPACITY = 1024
+
+# Tombstoned rows are compacted away once they outnumber live ones and this
+_MIN_COMPACTION_ROWS = 1024
+
+# PR metrics in the order PREngine checks them for one set
+_RECORD_METRICS = (ESTIMATED_1RM, MAX_REPS, BEST_TIME, BEST_DISTANCE)
+
+
+class _Interner:
+    """Maps string IDs to dense integer codes and back"""
+
+    def __init__(self):
+        self.codes: dict[str, int] = {}
+        self.values: list[str] = []
+
+    def code(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class SetHistory:
+    """Completed sets stored as parallel NumPy columns.
+
+    Users, exercises and workouts are interned to integer codes, each nullable
+    value column has a validity mask, and a ``live`` mask tombstones sets from
+    deleted workouts. Columns grow by doubling, so appends are amortized O(1),
+    and analytics run as vectorized reductions over boolean selections.
+
+    Each workout's sets occupy a contiguous run of rows, so discarding one
+    (as every edit does before re-appending it) only touches its own rows.
+    Once tombstones outnumber live rows the columns are compacted, keeping
+    their length proportional to the live history.
+    """
+
+    def __init__(self, workouts: Iterable[WorkoutResponse] = ()):
+        self.clear()
+        for workout in workouts:
+            self.append_workout(workout)
+
+    def clear(self) -> None:
+        """Drop every set"""
+        self._users = _Interner()
+        self._exercises = _Interner()
+        self._workouts = _Interner()
+        self._timed_exercises: set[int] = set()
+        self._exercise_names: dict[int, str] = {}
+        # Rows appended for each workout, as runs of consecutive rows
+        self._rows: dict[str, list[range]] = {}
+        self._size = 0
+        self._dead = 0
+        self._allocate(_INITIAL_CAPACITY)
+
+    def __len__(self) -> int:
+        return self._size - self._dead
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the column arrays"""
+        return sum(column.nbytes for column in self._columns())
+
+    def append_workout(self, workout: WorkoutResponse) -> int:
+        """Append the completed sets of a completed workout, returning the count"""
+        if workout.status != "completed":
+            return 0
+
+        timestamp = np.datetime64(workout.completed_at or workout.started_at, "us")
+        user = self._users.code(workout.user_id)
+        workout_code = self._workouts.code(workout.id)
+        first_row = self._size
+        appended = 0
+        for workout_exercise in workout.exercises:
+            exercise = workout_exercise.exercise
+            exercise_code = self._exercises.code(exercise.id)
+            self._exercise_names[exercise_code] = exercise.name
+            if exercise.category.lower() in TIMED_CATEGORIES:
+                self._timed_exercises.add(exercise_code)
+            for workout_set in workout_exercise.sets:
+                if not workout_set.completed:
+                    continue
+                row = self._next_row()
+                self._timestamp[row] = timestamp
+                self._user[row] = user
+                self._exercise[row] = exercise_code
+                self._workout[row] = workout_code
+                self._live[row] = True
+                for name in _VALUE_COLUMNS:
+                    value = getattr(workout_set, name)
+                    self._valid[name][row] = value is not None
+                    self._values[name][row] = value or 0
+                appended += 1
+        if appended:
+            self._rows.setdefault(workout.id, []).append(range(first_row, self._size))
+        return appended
+
+    def discard_workout(self, workout_id: str) -> None:
+        """Tombstone every set belonging to a workout"""
+        for rows in self._rows.pop(workout_id, ()):
+            self._live[rows.start : rows.stop] = False
+            self._dead += len(rows)
+        if self._dead >= max(_MIN_COMPACTION_ROWS, self._size - self._dead):
+            self._compact()
+
+    def volume(
+        self,
+        user_id: str,
+        exercise_id: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> dict:
+        """Set and rep counts for a user, optionally per exercise and time range"""
+        selected = self._select(user_id, exercise_id, start, end)
+        reps = self._values["reps"][: self._size]
+        reps_valid = self._valid["reps"][: self._size]
+        return {
+            "sets": int(selected.sum()),
+            "reps": int(reps[selected & reps_valid].sum()),
+        }
+
+    def tonnage(
+        self,
+        user_id: str,
+        exercise_id: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> float:
+        """Total weight moved (weight x reps) across matching sets"""
+        selected = self._select(user_id, exercise_id, start, end)
+        selected &= self._valid["weight"][: self._size]
+        selected &= self._valid["reps"][: self._size]
+        weight = self._values["weight"][: self._size][selected]
+        reps = self._values["reps"][: self._size][selected]
+        return float(np.dot(weight, reps))
+
+    def tonnage_by_exercise(self, user_id: str) -> dict[str, float]:
+        """Tonnage per exercise for a user, in one grouped reduction"""
+        selected = self._select(user_id)
+        selected &= self._valid["weight"][: self._size]
+        selected &= self._valid["reps"][: self._size]
+        exercises = self._exercise[: self._size][selected]
+        load = (
+            self._values["weight"][: self._size][selected]
+            * self._values["reps"][: self._size][selected]
+        )
+        totals = np.bincount(
+            exercises, weights=load, minlength=len(self._exercises.values)
+        )
+        return {
+            self._exercises.values[code]: float(total)
+            for code, total in enumerate(totals)
+            if total
+        }
+
+    def best(self, user_id: str, exercise_id: str, metric: str) -> float | None:
+        """Best value of a PR metric over a user's history for one exercise"""
+        selected = self._select(user_id, exercise_id)
+        if metric in (ESTIMATED_1RM, MAX_REPS):
+            _, values = self._strength_values(selected, metric)
+            return _reduce(values, np.max)
+        if metric == BEST_TIME:
+            code = self._exercises.codes.get(exercise_id)
+            if code not in self._timed_exercises:
+                return None
+            time_seconds = self._values["time_seconds"][: self._size]
+            selected &= self._valid["time_seconds"][: self._size] & (time_seconds > 0)
+            return _reduce(time_seconds[selected], np.min)
+        if metric == BEST_DISTANCE:
+            distance = self._values["distance"][: self._size]
+            selected &= self._valid["distance"][: self._size] & (distance > 0)
+            return _reduce(distance[selected], np.max)
+        raise ValueError(f"Unknown metric: {metric}")
+
+    def best_by_exercise(
+        self,
+        user_id: str,
+        metric: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> dict[str, float]:
+        """Best estimated 1RM or max reps per exercise, in one grouped reduction"""
+        if metric not in (ESTIMATED_1RM, MAX_REPS):
+            raise ValueError(f"Unsupported metric: {metric}")
+        selected, values = self._strength_values(
+            self._select(user_id, start=start, end=end), metric
+        )
+        exercises = self._exercise[: self._size][selected]
+        best = np.full(len(self._exercises.values), -np.inf)
+        np.maximum.at(best, exercises, values)
+        return {
+            self._exercises.values[code]: float(value)
+            for code, value in enumerate(best)
+            if value > -np.inf
+        }
+
+    def personal_records(self) -> list[PersonalRecord]:
+        """Every set that beat its user's best for an exercise and metric.
+
+        Candidate values of every metric are sorted by user, exercise and
+        metric, then by time, and replaced by their ranks offset per group,
+        so a single running maximum over the whole array gives each group's
+        best so far. Only the sets that raise it become records, returned
+        oldest first in the order ``PREngine.record_workout`` would find them.
+        """
+        size = self._size
+        rows, metrics, values = [], [], []
+        for code, metric in enumerate(_RECORD_METRICS):
+            selected, metric_values = self._metric_values(self._live[:size], metric)
+            rows.append(np.flatnonzero(selected))
+            metrics.append(np.full(len(rows[-1]), code))
+            values.append(metric_values)
+        rows, metrics, values = map(np.concatenate, (rows, metrics, values))
+        if not len(rows):
+            return []
+
+        timestamps = self._timestamp[rows]
+        groups = (
+            self._user[rows].astype(np.int64) * len(self._exercises.values)
+            + self._exercise[rows]
+        ) * len(_RECORD_METRICS) + metrics
+        order = np.lexsort((rows, timestamps, groups))
+        rows, metrics, values, timestamps, groups = (
+            column[order] for column in (rows, metrics, values, timestamps, groups)
+        )
+        # Lower times are better; negate them so every metric is maximized
+        lower = metrics == _RECORD_METRICS.index(BEST_TIME)
+        scores = np.where(lower, -values, values)
+        distinct, ranks = np.unique(scores, return_inverse=True)
+        starts = np.empty(len(groups), dtype=bool)
+        starts[0] = True
+        starts[1:] = groups[1:] != groups[:-1]
+        offsets = np.cumsum(starts) - 1
+        best = np.maximum.accumulate(ranks + offsets * len(distinct))
+        before = np.empty_like(best)
+        before[0] = -1
+        before[1:] = best[:-1] - offsets[1:] * len(distinct)
+        records = np.flatnonzero(starts | (ranks > before))
+
+        # Chronological, then by row and by metric within a set
+        records = records[
+            np.lexsort((metrics[records], rows[records], timestamps[records]))
+        ]
+        found = []
+        for index in records:
+            previous = None if starts[index] else float(distinct[before[index]])
+            if previous is not None and lower[index]:
+                previous = -previous
+            exercise = int(self._exercise[rows[index]])
+            found.append(
+                PersonalRecord(
+                    user_id=self._users.values[self._user[rows[index]]],
+                    exercise_id=self._exercises.values[exercise],
+                    exercise_name=self._exercise_names[exercise],
+                    metric=_RECORD_METRICS[metrics[index]],
+                    value=float(values[index]),
+                    previous=previous,
+                    achieved_at=timestamps[index].item(),
+                )
+            )
+        return found
+
+    def _metric_values(
+        self, selected: np.ndarray, metric: str
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Narrow a selection to sets carrying a PR metric, with its values"""
+        if metric in (ESTIMATED_1RM, MAX_REPS):
+            return self._strength_values(selected, metric)
+        size = self._size
+        if metric == BEST_TIME:
+            time_seconds = self._values["time_seconds"][:size]
+            timed = np.isin(self._exercise[:size], list(self._timed_exercises))
+            selected = (
+                selected
+                & timed
+                & self._valid["time_seconds"][:size]
+                & (time_seconds > 0)
+            )
+            return selected, time_seconds[selected]
+        distance = self._values["distance"][:size]
+        selected = selected & self._valid["distance"][:size] & (distance > 0)
+        return selected, distance[selected]
+
+    def _strength_values(
+        self, selected: np.ndarray, metric: str
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Narrow a selection to sets carrying a strength metric, with its values.
+
+        Estimated 1RM (Epley) counts weighted sets; max reps counts unweighted
+        ones, matching ``PREngine``.
+        """
+        reps = self._values["reps"][: self._size]
+        weight = self._values["weight"][: self._size]
+        reps_valid = self._valid["reps"][: self._size] & (reps > 0)
+        weighted = self._valid["weight"][: self._size] & (weight > 0)
+        if metric == ESTIMATED_1RM:
+            selected = selected & reps_valid & weighted
+            values = np.where(
+                reps[selected] == 1,
+                weight[selected],
+                weight[selected] * (1 + reps[selected] / 30),
+            )
+            return selected, values
+        selected = selected & reps_valid & ~weighted
+        return selected, reps[selected].astype(np.float64)
+
+    def _select(
+        self,
+        user_id: str,
+        exercise_id: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> np.ndarray:
+        """Boolean mask of live sets matching the given filters"""
+        size = self._size
+        user = self._users.codes.get(user_id)
+        if user is None:
+            return np.zeros(size, dtype=bool)
+
+        selected = self._live[:size] & (self._user[:size] == user)
+        if exercise_id is not None:
+            exercise = self._exercises.codes.get(exercise_id)
+            if exercise is None:
+                return np.zeros(size, dtype=bool)
+            selected &= self._exercise[:size] == exercise
+        if start is not None:
+            selected &= self._timestamp[:size] >= np.datetime64(start, "us")
+        if end is not None:
+            selected &= self._timestamp[:size] < np.datetime64(end, "us")
+        return selected
+
+    def _allocate(self, capacity: int) -> None:
+        self._timestamp = np.zeros(capacity, dtype="datetime64[us]")
+        self._user = np.zeros(capacity, dtype=np.int32)
+        self._exercise = np.zeros(capacity, dtype=np.int32)
+        self._workout = np.zeros(capacity, dtype=np.int32)
+        self._live = np.zeros(capacity, dtype=bool)
+        self._values = {
+            name: np.zeros(capacity, dtype=dtype)
+            for name, dtype in _VALUE_COLUMNS.items()
+        }
+        self._valid = {name: np.zeros(capacity, dtype=bool) for name in _VALUE_COLUMNS}
+
+    def _columns(self) -> list[np.ndarray]:
+        return [
+            self._timestamp,
+            self._user,
+            self._exercise,
+            self._workout,
+            self._live,
+            *self._values.values(),
+            *self._valid.values(),
+        ]
+
+    def _compact(self) -> None:
+        """Drop tombstoned rows, moving live ones down in order"""
+        size = self._size
+        live = self._live[:size].copy()
+        # New position of each live row
+        positions = np.cumsum(live) - 1
+        for column in self._columns():
+            kept = column[:size][live]
+            column[: len(kept)] = kept
+        self._size = size - self._dead
+        self._dead = 0
+        self._rows = {
+            workout_id: [
+                range(
+                    int(positions[rows.start]), int(positions[rows.start]) + len(rows)
+                )
+                for rows in runs
+            ]
+            for workout_id, runs in self._rows.items()
+        }
+
+    def _next_row(self) -> int:
+        """Index of the next free row, growing the columns when full"""
+        if self._size == len(self._live):
+            self._grow()
+        row = self._size
+        self._size += 1
+        return row
+
+    def _grow(self) -> None:
+        size = self._size
+        old = (self._timestamp, self._user, self._exercise, self._workout, self._live)
+        old_values, old_valid = self._values, self._valid
+        self._allocate(max(_INITIAL_CAPACITY, size * 2))
+        for new_column, old_column in zip(
+            (self._timestamp, self._user, self._exercise, self._workout, self._live),
+            old,
+            strict=True,
+        ):
+            new_column[:size] = old_column[:size]
+        for name in _VALUE_COLUMNS:
+            self._values[name][:size] = old_values[name][:size]
+            self._valid[name][:size] = old_valid[name][:size]
+
+
+def _reduce(values: np.ndarray, reducer) -> float | None:
+    if not len(values):
+        return None
+    return float(reducer(values))
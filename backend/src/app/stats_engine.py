@@ -0,0 +1,177 @@
+from bisect import bisect_right, insort
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+
+from .schemas import WorkoutResponse
+
+ONE_DAY = timedelta(days=1)
+
+
+@dataclass(frozen=True)
+class _Contribution:
+    """What a single completed workout adds to its owner's aggregates"""
+
+    user_id: str
+    day: date
+    duration_seconds: int
+    exercise_ids: tuple[str, ...]
+
+
+class _StreakTracker:
+    """Runs of consecutive workout days, updated one day at a time.
+
+    Each run is stored by its first and last day, and a counter of run lengths
+    gives the longest streak without walking the calendar.
+    """
+
+    def __init__(self):
+        self._day_counts: Counter[date] = Counter()
+        self._starts: list[date] = []
+        self._end_by_start: dict[date, date] = {}
+        self._start_by_end: dict[date, date] = {}
+        self._run_lengths: Counter[int] = Counter()
+
+    def add_day(self, day: date) -> None:
+        self._day_counts[day] += 1
+        if self._day_counts[day] > 1:
+            return
+
+        start = self._start_by_end.get(day - ONE_DAY, day)
+        end = self._end_by_start.get(day + ONE_DAY, day)
+        if start != day:
+            self._drop_run(start)
+        if end != day:
+            self._drop_run(day + ONE_DAY)
+        self._add_run(start, end)
+
+    def remove_day(self, day: date) -> None:
+        if self._day_counts[day] > 1:
+            self._day_counts[day] -= 1
+            return
+        del self._day_counts[day]
+
+        start = self._starts[bisect_right(self._starts, day) - 1]
+        end = self._end_by_start[start]
+        self._drop_run(start)
+        if start < day:
+            self._add_run(start, day - ONE_DAY)
+        if day < end:
+            self._add_run(day + ONE_DAY, end)
+
+    def current(self, today: date) -> int:
+        """Length of the run ending today, or yesterday if not trained yet"""
+        for end in (today, today - ONE_DAY):
+            start = self._start_by_end.get(end)
+            if start is not None:
+                return (end - start).days + 1
+        return 0
+
+    def longest(self) -> int:
+        return max(self._run_lengths, default=0)
+
+    def _add_run(self, start: date, end: date) -> None:
+        insort(self._starts, start)
+        self._end_by_start[start] = end
+        self._start_by_end[end] = start
+        self._run_lengths[(end - start).days + 1] += 1
+
+    def _drop_run(self, start: date) -> None:
+        end = self._end_by_start.pop(start)
+        del self._start_by_end[end]
+        del self._starts[bisect_right(self._starts, start) - 1]
+        length = (end - start).days + 1
+        self._run_lengths[length] -= 1
+        if not self._run_lengths[length]:
+            del self._run_lengths[length]
+
+
+@dataclass
+class _UserAggregates:
+    """Running totals for one user's completed workouts"""
+
+    total_workouts: int = 0
+    total_duration_seconds: int = 0
+    exercise_counts: Counter[str] = field(default_factory=Counter)
+    streaks: _StreakTracker = field(default_factory=_StreakTracker)
+
+
+class StatsEngine:
+    """Per-user workout statistics maintained as workouts change.
+
+    Only completed workouts contribute. Each workout's contribution is
+    remembered so that an edit or delete can subtract exactly what was added,
+    which keeps every read proportional to the size of the answer rather than
+    the size of the history.
+    """
+
+    def __init__(self, workouts: Iterable[WorkoutResponse] = ()):
+        self.clear()
+        for workout in workouts:
+            self.record(workout)
+
+    def clear(self) -> None:
+        """Forget every workout"""
+        self._users: dict[str, _UserAggregates] = {}
+        self._contributions: dict[str, _Contribution] = {}
+        self._exercise_names: dict[str, str] = {}
+
+    def record(self, workout: WorkoutResponse) -> None:
+        """Apply a created or changed workout, replacing its prior contribution"""
+        self.discard(workout.id)
+        if workout.status != "completed":
+            return
+
+        for workout_exercise in workout.exercises:
+            exercise = workout_exercise.exercise
+            self._exercise_names[exercise.id] = exercise.name
+
+        contribution = _Contribution(
+            user_id=workout.user_id,
+            day=workout.started_at.date(),
+            duration_seconds=workout.duration_seconds or 0,
+            exercise_ids=tuple(we.exercise.id for we in workout.exercises),
+        )
+        self._contributions[workout.id] = contribution
+
+        aggregates = self._users.setdefault(workout.user_id, _UserAggregates())
+        aggregates.total_workouts += 1
+        aggregates.total_duration_seconds += contribution.duration_seconds
+        aggregates.exercise_counts.update(contribution.exercise_ids)
+        aggregates.streaks.add_day(contribution.day)
+
+    def discard(self, workout_id: str) -> None:
+        """Remove a deleted workout's contribution, if it had one"""
+        contribution = self._contributions.pop(workout_id, None)
+        if contribution is None:
+            return
+
+        aggregates = self._users[contribution.user_id]
+        aggregates.total_workouts -= 1
+        aggregates.total_duration_seconds -= contribution.duration_seconds
+        aggregates.exercise_counts.subtract(contribution.exercise_ids)
+        for exercise_id in set(contribution.exercise_ids):
+            if aggregates.exercise_counts[exercise_id] <= 0:
+                del aggregates.exercise_counts[exercise_id]
+        aggregates.streaks.remove_day(contribution.day)
+
+    def get_stats(
+        self, user_id: str, favorites: int = 3, today: date | None = None
+    ) -> dict:
+        """Current aggregates for a user in ``StatsResponse`` shape"""
+        aggregates = self._users.get(user_id) or _UserAggregates()
+        today = today or date.today()
+
+        return {
+            "total_workouts": aggregates.total_workouts,
+            "current_streak": aggregates.streaks.current(today),
+            "longest_streak": aggregates.streaks.longest(),
+            "total_duration_hours": round(aggregates.total_duration_seconds / 3600, 1),
+            "favorite_exercises": [
+                {"name": self._exercise_names[exercise_id], "count": count}
+                for exercise_id, count in aggregates.exercise_counts.most_common(
+                    favorites
+                )
+            ],
+        }
@@ -0,0 +1,126 @@
+from collections.abc import Iterable
+
+from . import change_feed as change_table
+from . import mock_data
+from .change_feed import ChangeFeed
+from .change_log import ChangeLog
+from .compiled_catalog import CompiledCatalog
+from .config import settings
+from .exercise_index import ExerciseIndex
+from .live_session import LiveSessionHub
+from .periodization import PeriodizationPlanner
+from .pr_engine import PREngine
+from .response_cache import ResponseCache
+from .rollups import ProgressRollups
+from .schemas import Exercise, WorkoutResponse
+from .set_history import SetHistory
+from .stats_engine import StatsEngine
+from .versions import ResourceVersions
+from .workout_repository import WorkoutRepository
+
+# Every structure starts empty; restore() or ensure_loaded() fills them, so
+# importing the app builds no data
+
+# Exercise catalog with inverted indexes for filtered lookups, layered over
+# a compiled catalog file when one is configured
+exercise_catalog = ExerciseIndex(
+    base=(
+        CompiledCatalog(settings.exercise_catalog_path)
+        if settings.exercise_catalog_path
+        else None
+    )
+)
+
+# User workouts and system templates, keyed by ID
+workout_repository = WorkoutRepository()
+template_repository = WorkoutRepository()
+
+# Per-user statistics, kept in step with workout_repository by the routes
+stats_engine = StatsEngine()
+
+# Daily and weekly training totals for progress charts
+progress_rollups = ProgressRollups()
+
+# Personal records, backfilled from existing history then updated per set
+pr_engine = PREngine()
+
+# Columnar history of completed sets for analytics
+set_history = SetHistory()
+
+# Cached goal-based plans, regenerated week by week as history arrives
+plan_engine = PeriodizationPlanner(set_history)
+
+# Version counters behind the ETags of cacheable resources
+resource_versions = ResourceVersions()
+
+# Serialized bodies of repeatable reads, invalidated by the mutating routes
+response_cache = ResponseCache(
+    max_entries=settings.response_cache_max_entries,
+    max_bytes=settings.response_cache_max_bytes,
+    ttl_seconds=settings.response_cache_ttl_seconds,
+)
+
+# Latest change per record, read by delta sync
+change_log = ChangeLog(max_tombstones=settings.change_log_max_tombstones)
+
+# Devices connected to live workout sessions
+live_sessions = LiveSessionHub()
+
+# Writes by other worker processes, followed when several share a database
+change_feed = ChangeFeed()
+
+# Whether restore() has filled the structures above
+_loaded = False
+
+
+def share_with_workers() -> None:
+    """Follow the database's change table, for serving from several processes"""
+    change_table.publishing = True
+    change_feed.active = True
+    change_log.shared = True
+
+
+def ensure_loaded() -> None:
+    """Load the demo data, unless state was already restored"""
+    if not _loaded:
+        restore(
+            # Built-in exercises are served from a compiled base if there is one
+            () if exercise_catalog.base else mock_data.MOCK_EXERCISES,
+            mock_data.MOCK_WORKOUTS + mock_data.WORKOUT_TEMPLATES,
+        )
+
+
+def restore(exercises: Iterable[Exercise], workouts: Iterable[WorkoutResponse]) -> None:
+    """Rebuild every in-memory structure from persisted records"""
+    global _loaded
+    _loaded = True
+    exercise_catalog.clear()
+    # Index the compiled base now, so workers forked later share the indexes
+    exercise_catalog.index_base()
+    for exercise in exercises:
+        # Built-in exercises are already served from a compiled base
+        if exercise.id not in exercise_catalog:
+            exercise_catalog.add(exercise)
+
+    workout_repository.clear()
+    template_repository.clear()
+    for workout in workouts:
+        if workout.is_template:
+            template_repository.put(workout)
+        else:
+            workout_repository.put(workout)
+
+    stats_engine.clear()
+    progress_rollups.clear()
+    for workout in workout_repository:
+        stats_engine.record(workout)
+        progress_rollups.record(workout)
+    set_history.clear()
+    for workout in workout_repository:
+        set_history.append_workout(workout)
+    pr_engine.clear()
+    pr_engine.backfill(set_history.personal_records())
+    plan_engine.clear()
+    resource_versions.reset()
+    response_cache.clear()
+    change_log.reset()
@@ -0,0 +1,55 @@
+import os
+import secrets
+from itertools import count
+
+# Resource keys for collections; per-record keys use the helpers below
+EXERCISES = "exercises"
+WORKOUTS = "workouts"
+TEMPLATES = "templates"
+
+
+def workout_key(workout_id: str) -> str:
+    return f"workout:{workout_id}"
+
+
+def stats_key(user_id: str) -> str:
+    return f"stats:{user_id}"
+
+
+class ResourceVersions:
+    """Version counters for cacheable resources, rendered as strong ETags.
+
+    Every bump draws from one process-wide sequence, so a key that is deleted
+    and recreated never repeats an earlier version. ETags also carry an epoch
+    that changes whenever the counters are reset (including on restart), so a
+    client can never revalidate against a counter from a previous run. Each
+    forked worker draws a new epoch too: workers start from the parent's
+    counters but bump them independently, so their ETags must not collide.
+    """
+
+    def __init__(self):
+        self.reset()
+        os.register_at_fork(after_in_child=self._new_epoch)
+
+    def _new_epoch(self) -> None:
+        self._epoch = secrets.token_hex(4)
+
+    def reset(self) -> None:
+        """Invalidate every outstanding ETag"""
+        self._new_epoch()
+        self._sequence = count(1)
+        self._versions: dict[str, int] = {}
+
+    def bump(self, *keys: str) -> None:
+        """Record that resources changed"""
+        version = next(self._sequence)
+        for key in keys:
+            self._versions[key] = version
+
+    def version(self, key: str) -> int:
+        return self._versions.get(key, 0)
+
+    def etag(self, *keys: str) -> str:
+        """Strong ETag for a representation built from the given resources"""
+        parts = "-".join(str(self.version(key)) for key in keys)
+        return f'"{self._epoch}-{parts}"'
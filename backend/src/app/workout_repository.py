@@ -0,0 +1,151 @@
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+
+from sortedcontainers import SortedList
+
+from .schemas import WorkoutExercise, WorkoutResponse, WorkoutSummary
+
+# Position of a workout in the start-time ordering; IDs break timestamp ties
+WorkoutKey = tuple[datetime, str]
+
+
+def started_at_key(workout: WorkoutResponse) -> WorkoutKey:
+    """Sort key of a workout in the start-time ordering"""
+    return (workout.started_at, workout.id)
+
+
+def build_summary(workout: WorkoutResponse) -> WorkoutSummary:
+    """Project a full workout onto the abbreviated list format"""
+    return WorkoutSummary(
+        id=workout.id,
+        name=workout.name,
+        started_at=workout.started_at,
+        completed_at=workout.completed_at,
+        duration_seconds=workout.duration_seconds,
+        exercise_count=len(workout.exercises),
+        status=workout.status,
+    )
+
+
+def instantiate_template(template: WorkoutResponse) -> list[WorkoutExercise]:
+    """Exercise slots for a new workout started from a template.
+
+    Slots and sets are frozen models, and edits replace the slot they touch
+    with a copy (see ``live_session.apply_event``), so the new workout shares
+    them with the template instead of deep-copying the tree. Only the list is
+    new, so adding or removing slots never reaches the template.
+    """
+    return list(template.exercises)
+
+
+class WorkoutRepository:
+    """Workout storage keyed by ID with a secondary ordering on start time.
+
+    Gets by ID are dictionary operations. A ``SortedList`` of
+    ``(started_at, id)`` keys supports chronological iteration, date-range
+    queries and keyset pagination without sorting the whole history per
+    request; keeping it in step makes puts and deletes O(log n).
+
+    ``WorkoutSummary`` projections are built on first use and kept until the
+    workout is put again or deleted, so callers that modify a workout in place
+    must save it back with ``put``.
+    """
+
+    def __init__(self, workouts: Iterable[WorkoutResponse] = ()):
+        self.clear()
+        for workout in workouts:
+            self.put(workout)
+
+    def clear(self) -> None:
+        """Remove every workout"""
+        self._by_id: dict[str, WorkoutResponse] = {}
+        # Sort key each workout was filed under in the start-time ordering
+        self._keys: dict[str, WorkoutKey] = {}
+        self._by_started_at: SortedList[WorkoutKey] = SortedList()
+        self._summaries: dict[str, WorkoutSummary] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, workout_id: object) -> bool:
+        return workout_id in self._by_id
+
+    def __iter__(self) -> Iterator[WorkoutResponse]:
+        return iter(self._by_id.values())
+
+    def all(self) -> list[WorkoutResponse]:
+        """All workouts in insertion order"""
+        return list(self._by_id.values())
+
+    def get(self, workout_id: str) -> WorkoutResponse | None:
+        """Look up a workout by ID"""
+        return self._by_id.get(workout_id)
+
+    def put(self, workout: WorkoutResponse) -> None:
+        """Store a workout, replacing any existing entry with the same ID"""
+        workout_id = workout.id
+        key = started_at_key(workout)
+        # File the new key first: if it cannot be ordered, nothing has changed
+        self._by_started_at.add(key)
+        if workout_id in self._by_id:
+            self._unlink_started_at(workout_id)
+            self._summaries.pop(workout_id, None)
+
+        self._by_id[workout_id] = workout
+        self._keys[workout_id] = key
+
+    def delete(self, workout_id: str) -> WorkoutResponse | None:
+        """Remove a workout, returning it if it was present"""
+        workout = self._by_id.pop(workout_id, None)
+        if workout is None:
+            return None
+        self._unlink_started_at(workout_id)
+        self._summaries.pop(workout_id, None)
+        return workout
+
+    def summary(self, workout: WorkoutResponse) -> WorkoutSummary:
+        """Cached list projection of a stored workout"""
+        summary = self._summaries.get(workout.id)
+        if summary is None:
+            summary = build_summary(workout)
+            self._summaries[workout.id] = summary
+        return summary
+
+    def by_started_at(self, descending: bool = False) -> list[WorkoutResponse]:
+        """All workouts ordered by start time"""
+        return list(self.iter_by_started_at(descending=descending))
+
+    def started_between(
+        self, start: datetime | None = None, end: datetime | None = None
+    ) -> list[WorkoutResponse]:
+        """Workouts with ``start <= started_at < end``, oldest first"""
+        return list(self.iter_by_started_at(start=start, end=end))
+
+    def iter_by_started_at(
+        self,
+        descending: bool = False,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        after: WorkoutKey | None = None,
+    ) -> Iterator[WorkoutResponse]:
+        """Lazily walk workouts in start-time order.
+
+        ``start``/``end`` bound ``started_at`` as in ``started_between``, and
+        ``after`` resumes strictly past a key in the direction of travel. Only
+        the workouts actually consumed are visited.
+        """
+        keys = self._by_started_at
+        low = 0 if start is None else keys.bisect_left((start,))
+        high = len(keys) if end is None else keys.bisect_left((end,))
+        if after is not None:
+            if descending:
+                high = min(high, keys.bisect_left(after))
+            else:
+                low = max(low, keys.bisect_right(after))
+
+        for _, workout_id in keys.islice(low, max(low, high), reverse=descending):
+            yield self._by_id[workout_id]
+
+    def _unlink_started_at(self, workout_id: str) -> None:
+        """Drop a workout's entry from the start-time ordering"""
+        self._by_started_at.remove(self._keys.pop(workout_id))
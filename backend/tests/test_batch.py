@@ -0,0 +1,171 @@
+# Batch workout write tests
+import os
+import sys
+from datetime import UTC, datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from app import store
+from app.config import settings
+from app.main import app
+from app.mock_data import MOCK_EXERCISES, MOCK_WORKOUTS, WORKOUT_TEMPLATES
+from app.workout_repository import WorkoutRepository
+
+client = TestClient(app)
+
+BENCH_SETS = [
+    {"set_number": 1, "reps": 5, "weight": 185, "completed": True},
+    {"set_number": 2, "reps": 5, "weight": 185, "completed": True},
+]
+
+
+def _replay(workout_id):
+    """An offline session: create, edit sets, then complete"""
+    return [
+        {
+            "op": "create",
+            "id": workout_id,
+            "name": "Offline Push",
+            "started_at": "2024-03-01T07:00:00",
+            "exercises": [{"exercise_id": "ex_001", "sets": BENCH_SETS[:1]}],
+        },
+        {
+            "op": "update",
+            "id": workout_id,
+            "notes": "Felt strong",
+            "exercises": [{"exercise_id": "ex_001", "sets": BENCH_SETS}],
+        },
+        {"op": "complete", "id": workout_id, "completed_at": "2024-03-01T08:00:00"},
+    ]
+
+
+def test_batch_replays_offline_session():
+    """Test one request creates, edits sets of and completes a workout"""
+    volume_before = client.get("/api/users/me/volume").json()["sets"]
+    doomed = client.post("/api/workouts", json={"name": "Doomed"}).json()["id"]
+
+    response = client.post(
+        "/api/workouts/batch",
+        json={"operations": _replay("offline_001") + [{"op": "delete", "id": doomed}]},
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["success"] is True
+    assert [r["status"] for r in body["results"]] == [201, 200, 200, 200]
+    assert all(r["error"] is None for r in body["results"])
+
+    workout = client.get("/api/workouts/offline_001").json()
+    assert workout["status"] == "completed"
+    assert workout["duration_seconds"] == 3600
+    assert workout["notes"] == "Felt strong"
+    assert len(workout["exercises"][0]["sets"]) == 2
+    assert client.get(f"/api/workouts/{doomed}").status_code == 404
+    volume_after = client.get("/api/users/me/volume").json()["sets"]
+    assert volume_after == volume_before + 2
+
+
+def test_batch_is_all_or_nothing():
+    """Test one failing operation rejects the batch and changes nothing"""
+    existing = client.post("/api/workouts", json={"name": "Untouched"}).json()["id"]
+
+    response = client.post(
+        "/api/workouts/batch",
+        json={
+            "operations": [
+                {"op": "update", "id": existing, "name": "Renamed"},
+                {"op": "create", "id": existing, "name": "Duplicate"},
+                {"op": "update", "id": "missing", "name": "Nope"},
+                {
+                    "op": "create",
+                    "name": "Bad exercise",
+                    "exercises": [{"exercise_id": "ex_missing"}],
+                },
+            ]
+        },
+    )
+    assert response.status_code == 422
+    body = response.json()
+    assert body["success"] is False
+    assert [r["status"] for r in body["results"]] == [200, 409, 404, 422]
+    assert client.get(f"/api/workouts/{existing}").json()["name"] == "Untouched"
+
+
+def test_batch_accepts_timestamps_with_utc_offset():
+    """Test offset-aware times are stored as local time, listed and deletable"""
+    response = client.post(
+        "/api/workouts/batch",
+        json={
+            "operations": [
+                {
+                    "op": "create",
+                    "id": "offset_session",
+                    "name": "Travel Workout",
+                    "started_at": "2024-03-01T07:00:00+02:00",
+                },
+                {"op": "complete", "id": "offset_session"},
+            ]
+        },
+    )
+    assert response.status_code == 200
+
+    workout = client.get("/api/workouts/offset_session").json()
+    expected = datetime(2024, 3, 1, 5, tzinfo=UTC).astimezone()
+    assert workout["started_at"] == expected.replace(tzinfo=None).isoformat()
+    assert workout["status"] == "completed"
+    listed = client.get("/api/workouts", params={"limit": 100}).json()
+    assert "offset_session" in [w["id"] for w in listed]
+    assert client.delete("/api/workouts/offset_session").status_code == 200
+
+
+def test_put_leaves_repository_unchanged_when_unorderable():
+    """Test a workout whose start cannot be ordered is not half-stored"""
+    repository = WorkoutRepository(MOCK_WORKOUTS)
+    aware = MOCK_WORKOUTS[0].model_copy(
+        update={"id": "aware", "started_at": datetime.now(UTC)}
+    )
+    with pytest.raises(TypeError):
+        repository.put(aware)
+    assert "aware" not in repository
+    assert len(repository.by_started_at()) == len(MOCK_WORKOUTS)
+
+
+def test_batch_rejects_malformed_requests():
+    """Test unknown operations and empty batches fail validation"""
+    unknown = client.post(
+        "/api/workouts/batch", json={"operations": [{"op": "merge", "id": "x"}]}
+    )
+    assert unknown.status_code == 422
+    empty = client.post("/api/workouts/batch", json={"operations": []})
+    assert empty.status_code == 422
+
+    for length, status in ((64, 422), (33, 422), (32, 200)):
+        create = {"op": "create", "id": "w" * length, "name": "Long ID"}
+        response = client.post("/api/workouts/batch", json={"operations": [create]})
+        assert response.status_code == status, length
+    client.delete(f"/api/workouts/{'w' * 32}")
+
+
+def test_batch_writes_through_to_database(tmp_path, monkeypatch):
+    """Test a batch is persisted and survives a restart"""
+    monkeypatch.setattr(
+        settings, "database_url", f"sqlite+aiosqlite:///{tmp_path / 'test.db'}"
+    )
+    try:
+        with TestClient(app) as db_client:
+            response = db_client.post(
+                "/api/workouts/batch", json={"operations": _replay("offline_db")}
+            )
+            assert response.status_code == 200
+
+        store.restore([], [])
+        with TestClient(app) as db_client:
+            workout = db_client.get("/api/workouts/offline_db").json()
+            assert workout["status"] == "completed"
+            assert len(workout["exercises"][0]["sets"]) == 2
+    finally:
+        monkeypatch.undo()
+        store.restore(MOCK_EXERCISES, MOCK_WORKOUTS + WORKOUT_TEMPLATES)
@@ -0,0 +1,79 @@
+# Benchmark suite tests
+import asyncio
+import os
+import re
+import sys
+
+import httpx
+from fastapi.routing import APIWebSocketRoute
+
+# Add the backend and src directories to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app import store
+from app.main import app
+from app.mock_data import MOCK_EXERCISES, MOCK_WORKOUTS, WORKOUT_TEMPLATES
+from app.routes import api_router
+from benchmarks.run import (
+    LIVE_SCENARIO,
+    build_scenarios,
+    compare,
+    run_live_scenario,
+    summarize,
+)
+from benchmarks.synthetic import Scale, generate_workouts
+
+
+def test_generator_is_deterministic_and_scaled():
+    """Test the same seed yields the same data at the requested size"""
+    scale = Scale(users=3, workouts_per_user=4, sets_per_workout=7)
+    first = generate_workouts(scale, seed=1)
+    second = generate_workouts(scale, seed=1)
+
+    assert [w.model_dump() for w in first] == [w.model_dump() for w in second]
+    assert len(first) == 12
+    assert sum(len(we.sets) for w in first for we in w.exercises) == scale.total_sets
+    assert first[0].user_id == "user_123"
+
+
+def test_summary_and_compare():
+    """Test percentile summaries and p95 regression detection"""
+    summary = summarize([0.001 * n for n in range(1, 101)], elapsed=1.0, errors=0)
+    assert summary["requests"] == 100
+    assert summary["p50_ms"] < summary["p95_ms"] < summary["p99_ms"]
+
+    baseline = {"results": {"GET /": {"p95_ms": 1.0}}}
+    slower = {"results": {"GET /": {"p95_ms": 1.5}}}
+    assert compare(baseline, slower)
+    assert not compare(baseline, slower, threshold=0.6)
+
+
+def test_scenarios_cover_every_api_route():
+    """Test each route in routes.py, the live WebSocket included, is benchmarked"""
+    names = {scenario.name.split("?")[0] for scenario in build_scenarios(["w"])}
+    names.add(LIVE_SCENARIO)
+    for route in api_router.routes:
+        path = re.sub(r"{\w+}", "{id}", route.path)
+        if isinstance(route, APIWebSocketRoute):
+            assert f"WS {path}" in names
+        else:
+            for method in route.methods:
+                assert f"{method} {path}" in names
+
+
+def test_live_scenario_round_trips_set_events():
+    """Test every measured set event on the live session is acknowledged"""
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+            return await run_live_scenario(client, 5)
+
+    try:
+        result = asyncio.run(scenario())
+    finally:
+        store.restore(MOCK_EXERCISES, MOCK_WORKOUTS + WORKOUT_TEMPLATES)
+    assert (result["requests"], result["errors"]) == (5, 0)
@@ -0,0 +1,143 @@
+# Compiled exercise catalog tests
+import os
+import sys
+
+import pytest
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from app import store
+from app.compiled_catalog import CompiledCatalog, main, write_catalog
+from app.exercise_index import ExerciseIndex
+from app.mock_data import MOCK_EXERCISES, MOCK_WORKOUTS, WORKOUT_TEMPLATES
+from app.schemas import Exercise
+
+
+@pytest.fixture
+def compiled(tmp_path):
+    path = str(tmp_path / "exercises.vcx")
+    write_catalog(MOCK_EXERCISES, path)
+    return CompiledCatalog(path)
+
+
+def _ids(exercises):
+    return [exercise.id for exercise in exercises]
+
+
+def _count_decodes(compiled, monkeypatch) -> list[int]:
+    """Ordinals of the entries decoded from now on"""
+    decoded = []
+    entry = compiled.entry
+
+    def counting(ordinal):
+        decoded.append(ordinal)
+        return entry(ordinal)
+
+    monkeypatch.setattr(compiled, "entry", counting)
+    return decoded
+
+
+def test_lookups_decode_only_what_they_touch(compiled, monkeypatch):
+    """Test entries are found by binary search and decoded only when read"""
+    decoded = _count_decodes(compiled, monkeypatch)
+    assert len(compiled) == len(MOCK_EXERCISES)
+
+    exercise = MOCK_EXERCISES[3]
+    assert exercise.id in compiled
+    assert compiled.ordinal(exercise.id) == 3
+    assert decoded == []
+    assert compiled.get(exercise.id) == exercise
+    assert decoded == [3]
+
+    assert "missing" not in compiled
+    assert compiled.get("missing") is None
+    assert _ids(compiled) == _ids(MOCK_EXERCISES)
+
+
+def test_indexing_base_decodes_no_entries(compiled, monkeypatch):
+    """Test the indexes come from the file's postings and results decode alone"""
+    decoded = _count_decodes(compiled, monkeypatch)
+    indexed = ExerciseIndex(base=compiled)
+    indexed.index_base()
+    assert decoded == []
+
+    matches = indexed.filter(search="press")
+    assert matches and sorted(decoded) == [compiled.ordinal(ex.id) for ex in matches]
+
+
+def test_index_over_compiled_base_matches_in_memory(compiled):
+    """Test filters, search and autocomplete answer as the in-memory catalog"""
+    indexed = ExerciseIndex(base=compiled)
+    in_memory = ExerciseIndex(MOCK_EXERCISES)
+    assert len(indexed) == len(in_memory)
+    assert _ids(indexed.all()) == _ids(in_memory.all())
+
+    exercise = MOCK_EXERCISES[0]
+    queries = [
+        {"category": exercise.category},
+        {"muscle_group": exercise.muscle_groups[0]},
+        {"equipment": "barbell"},
+        {"search": "press"},
+        {"include_custom": False},
+    ]
+    for query in queries:
+        assert _ids(indexed.filter(**query)) == _ids(in_memory.filter(**query))
+    assert _ids(indexed.search("benchpress", 10)) == _ids(
+        in_memory.search("benchpress", 10)
+    )
+    assert _ids(indexed.autocomplete("sq", 10)) == _ids(
+        in_memory.autocomplete("sq", 10)
+    )
+
+
+def test_added_and_removed_exercises_layer_over_base(compiled):
+    """Test custom exercises sit on top of the base and base entries can be hidden"""
+    indexed = ExerciseIndex(base=compiled)
+    removed = MOCK_EXERCISES[0]
+    custom = Exercise(
+        id="custom_1",
+        name="Zercher Squat",
+        category="strength",
+        muscle_groups=["quadriceps"],
+        equipment="barbell",
+        is_custom=True,
+        created_by="user_1",
+    )
+    indexed.add(custom)
+    assert indexed.remove(removed.id) == removed
+
+    assert removed.id not in indexed
+    assert indexed.get(removed.id) is None
+    assert indexed.get(custom.id) == custom
+    assert len(indexed) == len(MOCK_EXERCISES)
+    assert _ids(indexed.all())[-1] == custom.id
+    assert removed.id not in _ids(indexed.filter(category=removed.category))
+    assert _ids(indexed.filter(created_by="user_1")) == [custom.id]
+    assert custom.id in _ids(indexed.autocomplete("zer", 10))
+
+    indexed.clear()
+    assert removed.id in indexed
+    assert custom.id not in indexed
+
+
+def test_loading_indexes_base_and_skips_built_ins(compiled, monkeypatch):
+    """Test loading indexes the base up front and adds no built-in over it"""
+    decoded = _count_decodes(compiled, monkeypatch)
+    monkeypatch.setattr(store, "exercise_catalog", ExerciseIndex(base=compiled))
+    monkeypatch.setattr(store, "_loaded", False)
+    try:
+        store.ensure_loaded()
+        assert store.exercise_catalog._base_indexed
+        assert store.exercise_catalog._by_id == {}
+        assert decoded == []
+    finally:
+        monkeypatch.undo()
+        store.restore(MOCK_EXERCISES, MOCK_WORKOUTS + WORKOUT_TEMPLATES)
+
+
+def test_command_writes_catalog(tmp_path):
+    """Test the command line compiles the built-in catalog"""
+    path = str(tmp_path / "exercises.vcx")
+    assert main(["--output", path]) == 0
+    assert _ids(CompiledCatalog(path)) == _ids(MOCK_EXERCISES)
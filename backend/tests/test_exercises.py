@@ -0,0 +1,142 @@
+# Exercise catalog and index tests
+import os
+import sys
+
+from fastapi.testclient import TestClient
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from app.exercise_index import ExerciseIndex
+from app.main import app
+from app.mock_data import MOCK_EXERCISES
+from app.schemas import Exercise
+
+client = TestClient(app)
+
+
+def _linear_filter(category=None, muscle_group=None, search=None, custom=True):
+    """Reference implementation of the original list-scan filtering"""
+    exercises = MOCK_EXERCISES.copy()
+    if category:
+        exercises = [ex for ex in exercises if ex.category.lower() == category.lower()]
+    if muscle_group:
+        exercises = [
+            ex
+            for ex in exercises
+            if muscle_group.lower() in [mg.lower() for mg in ex.muscle_groups]
+        ]
+    if search:
+        exercises = [ex for ex in exercises if search.lower() in ex.name.lower()]
+    if not custom:
+        exercises = [ex for ex in exercises if not ex.is_custom]
+    return exercises
+
+
+def test_index_matches_linear_filtering():
+    """Test index lookups return the same results as list scans"""
+    index = ExerciseIndex(MOCK_EXERCISES)
+    cases = [
+        {},
+        {"category": "Strength"},
+        {"muscle_group": "GLUTES"},
+        {"category": "plyometric", "muscle_group": "calves"},
+        {"search": "squat"},
+        {"search": "h pr"},
+        {"search": "5-10"},
+        {"search": "nothing matches"},
+        {"category": "strength", "custom": False},
+    ]
+    for case in cases:
+        expected = [ex.id for ex in _linear_filter(**case)]
+        actual = index.filter(
+            category=case.get("category"),
+            muscle_group=case.get("muscle_group"),
+            search=case.get("search"),
+            include_custom=case.get("custom", True),
+        )
+        assert [ex.id for ex in actual] == expected, case
+
+
+def test_index_add_and_remove():
+    """Test added exercises are indexed and removed ones disappear"""
+    index = ExerciseIndex(MOCK_EXERCISES)
+    custom = Exercise(
+        id="ex_custom",
+        name="Sled Push",
+        category="strength",
+        muscle_groups=["quadriceps"],
+        equipment="sled",
+        is_custom=True,
+        created_by="user_456",
+    )
+    index.add(custom)
+
+    assert [ex.id for ex in index.filter(equipment="SLED")] == ["ex_custom"]
+    assert [ex.id for ex in index.filter(created_by="user_456")] == ["ex_custom"]
+    assert index.filter(search="sled", include_custom=False) == []
+
+    index.remove("ex_custom")
+    assert index.get("ex_custom") is None
+    assert index.filter(equipment="sled") == []
+    assert len(index) == len(MOCK_EXERCISES)
+
+
+def test_create_custom_exercise():
+    """Test custom exercises are searchable once created"""
+    response = client.post(
+        "/api/exercises",
+        json={"name": "Landmine Rotation", "category": "strength"},
+    )
+    assert response.status_code == 200
+    created = response.json()
+    assert created["is_custom"] is True
+
+    response = client.get("/api/exercises", params={"search": "landmine"})
+    assert [ex["id"] for ex in response.json()] == [created["id"]]
+
+    response = client.get(f"/api/exercises/{created['id']}")
+    assert response.status_code == 200
+
+
+def _names(response):
+    return [item["name"] for item in response.json()]
+
+
+def test_search_ranks_exact_then_prefix_then_fuzzy():
+    """Test ranked search orders exact, prefix and typo matches"""
+    index = ExerciseIndex(MOCK_EXERCISES)
+    assert [ex.name for ex in index.search("bench press", 5)][0] == "Bench Press"
+    assert [ex.name for ex in index.search("pull", 5)] == ["Pull-ups"]
+    assert [ex.name for ex in index.search("bnech", 5)] == ["Bench Press"]
+    assert [ex.name for ex in index.search("deadlfit", 5)] == ["Deadlift"]
+
+    squats = [ex.name for ex in index.search("squat", 10)]
+    assert squats[:2] == ["Back Squat", "Bulgarian Split Squat"]
+    assert "Dragon Squats" in squats
+    # Muscle groups and equipment are searchable, below name matches
+    assert "Back Squat" in [ex.name for ex in index.search("barbell", 10)]
+    assert index.search("zzzz", 5) == []
+
+
+def test_search_and_autocomplete_endpoints():
+    """Test search and autocomplete routes, including new custom exercises"""
+    response = client.get("/api/exercises/search", params={"q": "sqaut"})
+    assert response.status_code == 200
+    assert "Back Squat" in _names(response)
+
+    response = client.get("/api/exercises/autocomplete", params={"prefix": "b"})
+    assert set(response.json()[0]) == {"id", "name"}
+    assert _names(response)[:2] == ["Back Squat", "Bench Press"]
+    inner = client.get("/api/exercises/autocomplete", params={"prefix": "press"})
+    assert _names(inner) == ["Bench Press", "Overhead Press"]
+
+    client.post(
+        "/api/exercises", json={"name": "Zercher Carry", "category": "strength"}
+    )
+    response = client.get("/api/exercises/autocomplete", params={"prefix": "zerc"})
+    assert _names(response) == ["Zercher Carry"]
+    response = client.get("/api/exercises/search", params={"q": "zercher cary"})
+    assert _names(response) == ["Zercher Carry"]
+
+    assert client.get("/api/exercises/search").status_code == 422
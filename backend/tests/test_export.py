@@ -0,0 +1,92 @@
+# History export tests
+import asyncio
+import csv
+import io
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from app.export import CSV, FIELDS, NDJSON, export_workouts, workout_chunks
+from app.main import app
+from app.mock_data import MOCK_WORKOUTS
+from app.workout_repository import WorkoutRepository
+
+client = TestClient(app)
+
+
+def _history(count):
+    """Copies of a completed mock workout on consecutive days"""
+    source = next(w for w in MOCK_WORKOUTS if w.status == "completed")
+    first = datetime(2024, 1, 1, 7)
+    return [
+        source.model_copy(
+            update={"id": f"w{index:03}", "started_at": first + timedelta(days=index)}
+        )
+        for index in range(count)
+    ]
+
+
+async def _collect(stream):
+    return [piece async for piece in stream]
+
+
+def test_chunks_cover_history_once_in_order():
+    """Test chunks are bounded and resume cleanly across concurrent edits"""
+    workouts = _history(25)
+    repository = WorkoutRepository(workouts)
+    repository.put(workouts[0].model_copy(update={"id": "other", "user_id": "x"}))
+
+    chunks = workout_chunks(repository, workouts[0].user_id, chunk_size=10)
+    first = next(chunks)
+    assert [w.id for w in first] == [f"w{index:03}" for index in range(10)]
+    # Changes behind the export position do not shift the remaining chunks
+    repository.delete("w003")
+    repository.put(workouts[0].model_copy(update={"id": "w000b"}))
+    rest = [w.id for chunk in chunks for w in chunk]
+    assert rest == [f"w{index:03}" for index in range(10, 25)]
+
+
+def test_export_encodes_one_row_per_set():
+    """Test both formats stream a row for every set, chunk by chunk"""
+    workouts = _history(5)
+    repository = WorkoutRepository(workouts)
+    sets = sum(len(slot.sets) for slot in workouts[0].exercises)
+
+    pieces = asyncio.run(
+        _collect(export_workouts(repository, workouts[0].user_id, NDJSON, 2))
+    )
+    assert len(pieces) == 3
+    rows = [json.loads(line) for piece in pieces for line in piece.splitlines()]
+    assert len(rows) == 5 * sets
+    assert tuple(rows[0]) == FIELDS
+    assert rows[-1]["workout_id"] == "w004"
+
+    pieces = asyncio.run(
+        _collect(export_workouts(repository, workouts[0].user_id, CSV, 2))
+    )
+    reader = csv.DictReader(io.StringIO(b"".join(pieces).decode()))
+    assert len(list(reader)) == 5 * sets
+
+
+def test_export_endpoint():
+    """Test the export route streams a downloadable file"""
+    response = client.get("/api/users/me/export", params={"format": "csv"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert "attachment" in response.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert rows and rows[0]["workout_id"]
+
+    ndjson = client.get("/api/users/me/export")
+    assert ndjson.headers["content-type"] == "application/x-ndjson"
+    assert len(ndjson.text.splitlines()) == len(rows)
+
+    assert (
+        client.get("/api/users/me/export", params={"format": "xml"}).status_code == 422
+    )
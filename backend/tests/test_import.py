@@ -0,0 +1,214 @@
+# History import tests
+import asyncio
+import json
+import os
+import sys
+from datetime import UTC, datetime
+
+from fastapi.testclient import TestClient
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from app import store
+from app.config import settings
+from app.history_import import MAX_REPORTED_ERRORS, HistoryImporter
+from app.main import app
+from app.mock_data import MOCK_EXERCISES, MOCK_USER, MOCK_WORKOUTS, WORKOUT_TEMPLATES
+from app.pr_engine import ESTIMATED_1RM, estimate_1rm
+from app.store import (
+    exercise_catalog,
+    pr_engine,
+    template_repository,
+    workout_repository,
+)
+
+client = TestClient(app)
+
+# The importer is also driven directly, outside any request
+store.ensure_loaded()
+
+
+def _row(workout_id, set_number, **fields):
+    return {
+        "workout_id": workout_id,
+        "workout_name": "Imported",
+        "started_at": "2021-05-04T07:00:00",
+        "completed_at": "2021-05-04T08:00:00",
+        "exercise_position": 0,
+        "exercise_id": "ex_001",
+        "set_number": set_number,
+        "reps": 5,
+        "weight": 100,
+        "completed": True,
+        **fields,
+    }
+
+
+async def _pieces(body, size=7):
+    """An upload arriving in small pieces that split lines and characters"""
+    for start in range(0, len(body), size):
+        yield body[start : start + size]
+
+
+def _chunks(body, import_format="ndjson", chunk_size=2):
+    importer = HistoryImporter("user_123", exercise_catalog, chunk_size)
+
+    async def collect():
+        return [chunk async for chunk in importer.chunks(_pieces(body), import_format)]
+
+    return asyncio.run(collect())
+
+
+def test_rows_group_into_workouts_in_bounded_chunks():
+    """Test consecutive rows form workouts and chunks hold at most chunk_size"""
+    rows = [_row(f"src{w}", s) for w in range(5) for s in (1, 2, 3)]
+    # The second workout's last two sets form another slot, one matched by name
+    bench = exercise_catalog.get("ex_001").name.upper()
+    rows[4]["exercise_position"] = 1
+    rows[5].update(exercise_position=1, exercise_id="", exercise_name=bench)
+    body = "\n".join(json.dumps(row) for row in rows).encode()
+
+    chunks = _chunks(body)
+    assert [len(chunk.workouts) for chunk in chunks] == [2, 2, 1]
+    assert sum(chunk.rows for chunk in chunks) == 15
+    second = chunks[0].workouts[1]
+    assert [len(slot.sets) for slot in second.exercises] == [1, 2]
+    assert second.exercises[1].exercise.id == "ex_001"
+    assert second.status == "completed" and second.duration_seconds == 3600
+    assert not any(chunk.errors for chunk in chunks)
+
+
+def test_invalid_rows_are_reported_and_skipped():
+    """Test bad rows carry their line and the rest of the workout survives"""
+    lines = [
+        json.dumps(_row("a", 1)),
+        "{not json",
+        json.dumps(_row("a", 2, reps=-1)),
+        json.dumps(_row("a", 3, exercise_id="missing")),
+        "[1, 2]",
+        "",
+        json.dumps(_row("a", 4)),
+    ]
+    [chunk] = _chunks("\n".join(lines).encode())
+    assert [len(slot.sets) for slot in chunk.workouts[0].exercises] == [2]
+    assert [error.line for error in chunk.errors] == [2, 3, 4, 5]
+    assert "Invalid JSON" in chunk.errors[0].error
+    assert chunk.errors[1].error.startswith("reps:")
+    assert "missing" in chunk.errors[2].error
+
+    many = "\n".join(["{}"] * (MAX_REPORTED_ERRORS + 5)).encode()
+    [chunk] = _chunks(many)
+    assert chunk.error_count == MAX_REPORTED_ERRORS + 5
+    assert len(chunk.errors) == MAX_REPORTED_ERRORS
+
+
+def test_csv_import_handles_quoted_newlines():
+    """Test CSV rows are keyed by the header and quotes may span lines"""
+    body = (
+        b"workout_id,started_at,exercise_id,set_number,reps,notes\r\n"
+        b'w1,2021-05-04T07:00:00,ex_001,1,5,"felt\nstrong"\r\n'
+        b"w1,2021-05-04T07:00:00,ex_001,2,5,\r\n"
+        b"w1,too,few\r\n"
+    )
+    [chunk] = _chunks(body, "csv")
+    [workout] = chunk.workouts
+    assert workout.status == "planned"
+    assert workout.exercises[0].sets[0].notes == "felt\nstrong"
+    assert chunk.errors[0].line == 5
+
+
+def test_export_round_trips_through_import():
+    """Test an export re-imports as new workouts with the same sets"""
+    exported = client.get("/api/users/me/export", params={"format": "csv"})
+    before = client.get("/api/workouts", params={"limit": 100}).json()
+
+    response = client.post(
+        "/api/users/me/import", params={"format": "csv"}, content=exported.content
+    )
+    assert response.status_code == 200
+    result = response.json()
+    assert result["error_count"] == 0
+    assert result["rows"] == result["sets"] == len(exported.text.splitlines()) - 1
+    assert result["workouts"] > 0 and result["chunks"] == 1
+
+    after = client.get("/api/workouts", params={"limit": 100}).json()
+    assert len(after) == len(before) + result["workouts"]
+    assert (
+        client.post("/api/users/me/import", content=b"nope").json()["error_count"] == 1
+    )
+
+
+def test_import_accepts_timestamps_with_utc_offset():
+    """Test rows stamped in UTC are stored as local time beside naive ones"""
+    row = _row(
+        "utc",
+        1,
+        started_at="2021-05-06T07:00:00Z",
+        completed_at="2021-05-06T08:00:00+00:00",
+    )
+    response = client.post("/api/users/me/import", content=json.dumps(row).encode())
+    assert response.status_code == 200
+    assert (response.json()["workouts"], response.json()["error_count"]) == (1, 0)
+
+    started = datetime(2021, 5, 6, 7, tzinfo=UTC).astimezone()
+    [workout] = [
+        w
+        for w in client.get("/api/workouts", params={"limit": 100}).json()
+        if w["started_at"] == started.replace(tzinfo=None).isoformat()
+    ]
+    assert workout["duration_seconds"] == 3600
+    assert client.delete(f"/api/workouts/{workout['id']}").status_code == 200
+
+
+def test_out_of_order_import_detects_records_by_date(monkeypatch):
+    """Test a newest-first upload yields the records a restore rebuilds"""
+    monkeypatch.setattr(settings, "import_chunk_size", 2)
+    rows = [
+        _row(
+            month,
+            1,
+            started_at=f"2021-{month}-01T07:00:00",
+            completed_at=f"2021-{month}-01T08:00:00",
+            reps=1,
+            weight=weight,
+        )
+        for month, weight in (("06", 2000), ("05", 2200), ("04", 1800))
+    ]
+    body = "\n".join(json.dumps(row) for row in rows).encode()
+    assert client.post("/api/users/me/import", content=body).json()["workouts"] == 3
+
+    user_id = MOCK_USER.id
+    best = pr_engine.best(user_id, "ex_001", ESTIMATED_1RM)
+    assert best == estimate_1rm(2200, 1)
+    recent = pr_engine.recent(user_id, 10)
+    assert estimate_1rm(2000, 1) not in [record.value for record in recent]
+
+    store.restore(
+        exercise_catalog.all(), list(workout_repository) + list(template_repository)
+    )
+    assert pr_engine.best(user_id, "ex_001", ESTIMATED_1RM) == best
+    assert pr_engine.recent(user_id, 10) == recent
+
+
+def test_import_writes_chunks_through_to_database(tmp_path, monkeypatch):
+    """Test every imported chunk is persisted and survives a restart"""
+    monkeypatch.setattr(
+        settings, "database_url", f"sqlite+aiosqlite:///{tmp_path / 'test.db'}"
+    )
+    monkeypatch.setattr(settings, "import_chunk_size", 2)
+    body = "\n".join(json.dumps(_row(f"db{w}", 1)) for w in range(5)).encode()
+    try:
+        with TestClient(app) as db_client:
+            result = db_client.post("/api/users/me/import", content=body).json()
+            assert (result["workouts"], result["chunks"]) == (5, 3)
+
+        store.restore([], [])
+        with TestClient(app) as db_client:
+            workouts = db_client.get(
+                "/api/workouts", params={"start": "2021-05-04", "end": "2021-05-05"}
+            ).json()
+            assert len([w for w in workouts if w["name"] == "Imported"]) == 5
+    finally:
+        monkeypatch.undo()
+        store.restore(MOCK_EXERCISES, MOCK_WORKOUTS + WORKOUT_TEMPLATES)
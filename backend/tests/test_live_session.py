@@ -0,0 +1,136 @@
+# Live workout session tests
+import os
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from app.live_session import apply_event
+from app.main import app
+from app.mock_data import WORKOUT_TEMPLATES
+from app.pr_engine import ESTIMATED_1RM, estimate_1rm
+from app.schemas import SetRemoveEvent, SetUpdateEvent
+from app.store import pr_engine
+
+client = TestClient(app)
+
+
+def _new_workout():
+    """A planned workout copied from the upper-body template"""
+    return client.post(
+        "/api/workouts", json={"name": "Live", "template_id": "template_001"}
+    ).json()
+
+
+def test_apply_event_copies_only_touched_slot():
+    """Test set events edit one slot and share the rest"""
+    template = WORKOUT_TEMPLATES[0].model_copy(update={"status": "planned"})
+    event = SetUpdateEvent(
+        type="set", exercise_index=0, set_number=1, reps=8, completed=True
+    )
+    updated = apply_event(template, event)
+
+    first = updated.exercises[0].sets[0]
+    assert (first.reps, first.completed) == (8, True)
+    assert first.weight == template.exercises[0].sets[0].weight
+    assert updated.exercises[1] is template.exercises[1]
+    assert updated.status == "in_progress"
+    assert template.exercises[0].sets[0].completed is False
+
+    added = apply_event(
+        updated, SetUpdateEvent(type="set", exercise_index=0, set_number=9, reps=1)
+    )
+    assert [s.set_number for s in added.exercises[0].sets][-1] == 9
+    removed = apply_event(
+        added, SetRemoveEvent(type="remove_set", exercise_index=0, set_number=9)
+    )
+    assert removed.exercises[0].sets == updated.exercises[0].sets
+
+    with pytest.raises(ValueError):
+        apply_event(
+            template, SetUpdateEvent(type="set", exercise_index=99, set_number=1)
+        )
+
+
+def test_live_session_applies_and_fans_out():
+    """Test a set logged on one device reaches the workout and other devices"""
+    workout = _new_workout()
+    url = f"/api/workouts/{workout['id']}/live"
+
+    with client.websocket_connect(url) as phone, client.websocket_connect(url) as watch:
+        assert phone.receive_json()["type"] == "snapshot"
+        assert watch.receive_json()["workout"]["id"] == workout["id"]
+
+        phone.send_json(
+            {
+                "type": "set",
+                "exercise_index": 0,
+                "set_number": 1,
+                "reps": 7,
+                "weight": 140,
+                "completed": True,
+            }
+        )
+        ack = phone.receive_json()
+        relayed = watch.receive_json()
+        assert ack.pop("ack") is True
+        assert ack == relayed
+        assert relayed["set"]["reps"] == 7
+        assert relayed["status"] == "in_progress"
+
+        phone.send_json({"type": "set", "exercise_index": 0})
+        assert phone.receive_json()["type"] == "error"
+        phone.send_json({"type": "remove_set", "exercise_index": 99, "set_number": 1})
+        assert phone.receive_json()["type"] == "error"
+        # Nulls are validated on existing sets just as on new ones
+        phone.send_json(
+            {"type": "set", "exercise_index": 0, "set_number": 1, "completed": None}
+        )
+        assert phone.receive_json()["type"] == "error"
+
+    stored = client.get(f"/api/workouts/{workout['id']}").json()
+    first = stored["exercises"][0]["sets"][0]
+    assert (first["reps"], first["weight"], first["completed"]) == (7, 140, True)
+    assert stored["status"] == "in_progress"
+
+
+def test_live_session_reports_records_as_sets_complete():
+    """Test completing a set mid-session detects and announces a record"""
+    workout = _new_workout()
+    url = f"/api/workouts/{workout['id']}/live"
+    exercise_id = workout["exercises"][0]["exercise"]["id"]
+
+    with client.websocket_connect(url) as phone, client.websocket_connect(url) as watch:
+        phone.receive_json()
+        watch.receive_json()
+
+        heavy = {"type": "set", "exercise_index": 0, "reps": 3, "weight": 900}
+        phone.send_json({**heavy, "set_number": 1})
+        assert phone.receive_json()["records"] == []
+        watch.receive_json()
+
+        phone.send_json({**heavy, "set_number": 1, "completed": True})
+        ack = phone.receive_json()
+        assert [record["metric"] for record in ack["records"]] == [ESTIMATED_1RM]
+        assert watch.receive_json()["records"] == ack["records"]
+
+        # Editing an already completed set does not announce it again
+        phone.send_json({**heavy, "set_number": 1, "notes": "Spotted"})
+        assert phone.receive_json()["records"] == []
+        watch.receive_json()
+
+    assert pr_engine.best("user_123", exercise_id, ESTIMATED_1RM) == estimate_1rm(
+        900, 3
+    )
+
+
+def test_live_session_unknown_workout():
+    """Test connecting to a missing workout is refused"""
+    with pytest.raises(WebSocketDisconnect) as exc:
+        with client.websocket_connect("/api/workouts/missing/live") as websocket:
+            websocket.receive_json()
+    assert exc.value.code == 4404
@@ -39,3 +39,24 @@ def test_api_status():
     assert data["api"] == "VeloCollab"
     assert data["version"] == "1.0.0"
     assert "environment" in data
+
+
+def test_metrics_records_route_templates():
+    """Test metrics endpoint exposes per-route latency histograms"""
+    client.get("/api/workouts/workout_001")
+    client.get("/api/workouts/does-not-exist")
+    client.get("/no-such-path")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert (
+        "velocollab_http_request_duration_seconds_count"
+        '{method="GET",route="/api/workouts/{workout_id}",status="200"}'
+    ) in body
+    assert 'route="/api/workouts/{workout_id}",status="404"' in body
+    assert 'route="<unmatched>",status="404"' in body
+    assert "workout_001" not in body
+    assert "velocollab_http_response_size_bytes_bucket" in body
+    assert 'velocollab_http_requests_in_flight{method="GET"} 1' in body
@@ -0,0 +1,128 @@
+# Periodization planner tests
+import os
+import sys
+from datetime import date, datetime, timedelta
+
+from fastapi.testclient import TestClient
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from app.main import app
+from app.mock_data import MOCK_EXERCISES, MOCK_WORKOUTS, WORKOUT_TEMPLATES
+from app.periodization import PeriodizationPlanner, PlanParameters
+from app.pr_engine import ESTIMATED_1RM
+from app.schemas import WorkoutExercise, WorkoutExerciseSet, WorkoutResponse
+from app.set_history import SetHistory
+
+client = TestClient(app)
+
+TEMPLATE = WORKOUT_TEMPLATES[0]
+BENCH = next(ex for ex in MOCK_EXERCISES if ex.id == "ex_001")
+
+
+def _parameters(**overrides):
+    fields = {
+        "template_id": TEMPLATE.id,
+        "goal_percent": 10.0,
+        "weeks": 4,
+        "sessions_per_week": 2,
+        "start": date.today(),
+    }
+    fields.update(overrides)
+    return PlanParameters(**fields)
+
+
+def _bench_session(when, weight):
+    return WorkoutResponse(
+        id=f"bench_{when:%Y%m%d}",
+        user_id="user_123",
+        name="Heavy bench",
+        started_at=when,
+        completed_at=when,
+        status="completed",
+        exercises=[
+            WorkoutExercise(
+                exercise=BENCH,
+                sets=[
+                    WorkoutExerciseSet(
+                        set_number=1, reps=1, weight=weight, completed=True
+                    )
+                ],
+            )
+        ],
+    )
+
+
+def test_best_by_exercise_matches_single_lookups():
+    """Test the grouped reduction agrees with per-exercise bests"""
+    history = SetHistory(MOCK_WORKOUTS)
+    grouped = history.best_by_exercise("user_123", ESTIMATED_1RM)
+    assert grouped
+    for exercise_id, value in grouped.items():
+        assert value == history.best("user_123", exercise_id, ESTIMATED_1RM)
+
+
+def test_plan_progresses_to_goal():
+    """Test loads rise towards the goal while reps step down"""
+    planner = PeriodizationPlanner(SetHistory(MOCK_WORKOUTS))
+    plan = planner.plan("user_123", TEMPLATE, _parameters())
+
+    assert len(plan.weeks) == 4
+    assert all(len(week) == 2 for week in plan.weeks)
+    assert plan.targets["ex_001"] == plan.baselines["ex_001"] * 1.1
+
+    bench = [week[0].exercises[1].sets[0] for week in plan.weeks]
+    weights = [s.weight for s in bench]
+    assert weights == sorted(weights) and weights[0] < weights[-1]
+    assert [s.reps for s in bench][-1] < bench[0].reps
+    # The final week's load is the goal max inverted through Epley
+    final = bench[-1]
+    assert abs(final.weight * (1 + final.reps / 30) - plan.targets["ex_001"]) < 3
+    assert plan.weeks[1][1].started_at.date() == date.today() + timedelta(days=10)
+    # The template itself is untouched
+    assert TEMPLATE.exercises[1].sets[0].weight == 0
+
+
+def test_new_sets_regenerate_only_affected_weeks():
+    """Test a completed workout re-plans from its week on, keeping earlier weeks"""
+    history = SetHistory(MOCK_WORKOUTS)
+    planner = PeriodizationPlanner(history)
+    start = date.today() - timedelta(days=14)
+    plan = planner.plan("user_123", TEMPLATE, _parameters(start=start))
+    assert planner.plan("user_123", TEMPLATE, _parameters(start=start)) is plan
+    before = [list(week) for week in plan.weeks]
+
+    workout = _bench_session(datetime.now(), plan.targets["ex_001"] * 1.2)
+    history.append_workout(workout)
+    planner.record_workout(workout)
+    assert plan.stale_from == 2
+
+    planner.plan("user_123", TEMPLATE, _parameters(start=start))
+    assert plan.stale_from is None
+    assert plan.weeks[0] == before[0] and plan.weeks[0][0] is before[0][0]
+    assert plan.weeks[1][0] is before[1][0]
+    new_bench = plan.weeks[2][0].exercises[1].sets[0].weight
+    assert new_bench > before[2][0].exercises[1].sets[0].weight
+    # Exercises the new sets did not touch are re-planned the same way
+    assert plan.weeks[2][0].exercises[0] == before[2][0].exercises[0]
+
+
+def test_plan_endpoint():
+    """Test the plan route validates input and returns suggested workouts"""
+    response = client.get(
+        "/api/users/me/plan",
+        params={"template_id": "template_001", "weeks": 6, "sessions_per_week": 3},
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert len(body["workouts"]) == 18
+    assert body["workouts"][0]["is_template"] is True
+    assert set(body["targets"]) == set(body["baselines"])
+
+    missing = client.get("/api/users/me/plan", params={"template_id": "nope"})
+    assert missing.status_code == 404
+    too_ambitious = client.get(
+        "/api/users/me/plan", params={"template_id": "template_001", "goal_percent": 90}
+    )
+    assert too_ambitious.status_code == 422
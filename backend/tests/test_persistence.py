@@ -0,0 +1,127 @@
+# Database persistence tests
+import asyncio
+import os
+import sys
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from app import database, persistence, store
+from app.config import settings
+from app.main import app
+from app.mock_data import MOCK_EXERCISES, MOCK_WORKOUTS, WORKOUT_TEMPLATES
+
+
+def _database_url(tmp_path):
+    return f"sqlite+aiosqlite:///{tmp_path / 'test.db'}"
+
+
+def test_workout_round_trip_without_n_plus_one(tmp_path):
+    """Test workouts load back intact in a fixed number of queries"""
+
+    async def scenario():
+        await database.init_database(_database_url(tmp_path))
+        try:
+            async with database.session_scope() as session:
+                await persistence.seed(
+                    session, MOCK_EXERCISES, MOCK_WORKOUTS + WORKOUT_TEMPLATES
+                )
+
+            statements = []
+            event.listen(
+                database._engine.sync_engine,
+                "before_cursor_execute",
+                lambda *args: statements.append(args[2]),
+            )
+            async with database.session_scope() as session:
+                workouts = await persistence.load_workouts(session)
+                single = await persistence.load_workout(session, "workout_001")
+            return workouts, single, statements
+        finally:
+            await database.close_database()
+
+    workouts, single, statements = asyncio.run(scenario())
+
+    expected = {w.id: w for w in MOCK_WORKOUTS + WORKOUT_TEMPLATES}
+    assert {w.id: w for w in workouts} == expected
+    assert single == expected["workout_001"]
+    # Two loads of three queries each, independent of exercise and set counts
+    assert len(statements) == 6
+
+
+def test_seed_only_populates_empty_database(tmp_path):
+    """Test seeding is skipped once data exists"""
+
+    async def scenario():
+        await database.init_database(_database_url(tmp_path))
+        try:
+            async with database.session_scope() as session:
+                first = await persistence.seed(session, MOCK_EXERCISES, [])
+            async with database.session_scope() as session:
+                second = await persistence.seed(session, MOCK_EXERCISES, [])
+            return first, second
+        finally:
+            await database.close_database()
+
+    assert asyncio.run(scenario()) == (True, False)
+
+
+def test_api_writes_through_to_database(tmp_path, monkeypatch):
+    """Test workouts written via the API survive a restart"""
+    monkeypatch.setattr(settings, "database_url", _database_url(tmp_path))
+    try:
+        with TestClient(app) as client:
+            created = client.post(
+                "/api/workouts",
+                json={"name": "Persisted", "template_id": "template_001"},
+            ).json()
+            client.post(f"/api/workouts/{created['id']}/complete")
+            deleted = client.delete("/api/workouts/workout_001")
+            assert deleted.status_code == 200
+
+        # Drop in-memory state, then start again from the database
+        store.restore([], [])
+        with TestClient(app) as client:
+            response = client.get(f"/api/workouts/{created['id']}")
+            assert response.status_code == 200
+            assert response.json()["status"] == "completed"
+            assert response.json()["exercises"] == created["exercises"]
+            assert client.get("/api/workouts/workout_001").status_code == 404
+    finally:
+        monkeypatch.undo()
+        store.restore(MOCK_EXERCISES, MOCK_WORKOUTS + WORKOUT_TEMPLATES)
+
+
+def test_failed_commit_leaves_memory_unchanged(tmp_path, monkeypatch):
+    """Test a write whose transaction fails changes nothing in memory"""
+
+    async def fail(*args):
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(settings, "database_url", _database_url(tmp_path))
+    try:
+        with TestClient(app, raise_server_exceptions=False) as client:
+            before = client.get("/api/workouts/workout_005").json()
+            listed = client.get("/api/workouts", params={"limit": 100}).json()
+            monkeypatch.setattr(persistence, "save_workout", fail)
+            monkeypatch.setattr(persistence, "save_workouts", fail)
+
+            writes = [
+                client.post("/api/workouts", json={"name": "Lost"}),
+                client.put("/api/workouts/workout_005", json={"name": "Renamed"}),
+                client.post("/api/workouts/workout_005/complete"),
+                client.post(
+                    "/api/workouts/batch",
+                    json={"operations": [{"op": "create", "name": "Lost"}]},
+                ),
+            ]
+            assert [response.status_code for response in writes] == [500] * 4
+            assert client.get("/api/workouts/workout_005").json() == before
+            after = client.get("/api/workouts", params={"limit": 100}).json()
+            assert after == listed
+    finally:
+        monkeypatch.undo()
+        store.restore(MOCK_EXERCISES, MOCK_WORKOUTS + WORKOUT_TEMPLATES)
@@ -0,0 +1,100 @@
+# Personal record engine tests
+import os
+import sys
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+
+# Add the backend and src directories to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.main import app
+from app.mock_data import MOCK_EXERCISES, MOCK_WORKOUTS
+from app.pr_engine import (
+    BEST_TIME,
+    ESTIMATED_1RM,
+    PREngine,
+    estimate_1rm,
+)
+from app.schemas import WorkoutExerciseSet
+from app.set_history import SetHistory
+from benchmarks.synthetic import Scale, generate_workouts
+
+client = TestClient(app)
+
+BENCH = next(ex for ex in MOCK_EXERCISES if ex.id == "ex_001")
+DASH = next(ex for ex in MOCK_EXERCISES if ex.id == "ex_015")
+NOW = datetime(2024, 1, 10, 12)
+
+
+def test_estimate_1rm():
+    """Test the Epley estimate from the requirements example"""
+    assert round(estimate_1rm(200, 8), 1) == 253.3
+    assert estimate_1rm(225, 1) == 225
+
+
+def test_strength_and_speed_records():
+    """Test higher-is-better and lower-is-better metrics"""
+    engine = PREngine()
+    first = WorkoutExerciseSet(set_number=1, reps=5, weight=185, completed=True)
+    assert [r.metric for r in engine.record_set("u", BENCH, first, NOW)] == [
+        ESTIMATED_1RM
+    ]
+
+    weaker = WorkoutExerciseSet(set_number=2, reps=5, weight=175, completed=True)
+    assert engine.record_set("u", BENCH, weaker, NOW + timedelta(days=1)) == []
+
+    assert engine.record_set("u", DASH, _sprint(4.8), NOW)
+    assert engine.is_pr("u", DASH.id, BEST_TIME, 4.7)
+    assert not engine.is_pr("u", DASH.id, BEST_TIME, 4.9)
+    assert engine.best("u", DASH.id, BEST_TIME) == 4.8
+
+
+def test_incomplete_sets_are_ignored():
+    """Test only completed sets can set records"""
+    engine = PREngine()
+    planned = WorkoutExerciseSet(set_number=1, reps=5, weight=500)
+    assert engine.record_set("u", BENCH, planned, NOW) == []
+    assert engine.best("u", BENCH.id, ESTIMATED_1RM) is None
+
+
+def test_same_session_records_collapse():
+    """Test successive bests within one session show as one recent record"""
+    engine = PREngine()
+    for time_seconds in (4.8, 4.7, 4.6):
+        engine.record_set("u", DASH, _sprint(time_seconds), NOW)
+
+    recent = engine.recent("u", limit=10)
+    assert len(recent) == 1
+    assert recent[0].value == 4.6
+    assert recent[0].previous is None
+
+
+def test_backfill_matches_incremental():
+    """Test the vectorized backfill finds the records per-set replay would"""
+    workouts = MOCK_WORKOUTS + generate_workouts(
+        Scale(users=3, workouts_per_user=40, sets_per_workout=12), seed=3
+    )
+    batch = PREngine()
+    batch.backfill(SetHistory(workouts).personal_records())
+
+    incremental = PREngine()
+    completed = [w for w in workouts if w.status == "completed"]
+    for workout in sorted(completed, key=lambda w: w.completed_at or w.started_at):
+        incremental.record_workout(workout)
+
+    assert batch._best == incremental._best
+    for user_id in incremental._recent:
+        assert batch.recent(user_id, limit=10) == incremental.recent(user_id, limit=10)
+
+
+def test_stats_endpoint_reports_detected_records():
+    """Test recent PRs come from detected records"""
+    recent_prs = client.get("/api/users/me/stats").json()["recent_prs"]
+    assert recent_prs
+    assert {"exercise", "metric", "value", "date"} <= set(recent_prs[0])
+
+
+def _sprint(time_seconds):
+    return WorkoutExerciseSet(set_number=1, time_seconds=time_seconds, completed=True)
@@ -0,0 +1,114 @@
+# Response cache tests
+import os
+import sys
+
+from fastapi.testclient import TestClient
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from app.main import app
+from app.response_cache import ResponseCache
+from app.store import response_cache
+
+client = TestClient(app)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ttl_expiry():
+    """Test entries expire after their TTL"""
+    clock = FakeClock()
+    cache = ResponseCache(ttl_seconds=10, clock=clock)
+    cache.set("a", b"1")
+    cache.set("b", b"2", ttl_seconds=30)
+
+    clock.now = 9
+    assert cache.get("a") == b"1"
+    clock.now = 10
+    assert cache.get("a") is None
+    assert cache.get("b") == b"2"
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 1
+
+
+def test_lru_eviction_by_count_and_size():
+    """Test least-recently-used entries go first when a limit is hit"""
+    cache = ResponseCache(max_entries=2, max_bytes=10)
+    cache.set("a", b"aaa")
+    cache.set("b", b"bbb")
+    cache.get("a")
+    cache.set("c", b"ccc")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"aaa"
+
+    cache.set("d", b"dddddddd")
+    assert len(cache) == 1
+    assert cache.size_bytes == 8
+    assert cache.stats()["evictions"] == 3
+
+    cache.set("huge", b"x" * 11)
+    assert cache.get("huge") is None
+
+
+def test_tag_invalidation():
+    """Test invalidating a tag drops only the entries filed under it"""
+    cache = ResponseCache()
+    cache.set("a", b"1", tags=("exercises",))
+    cache.set("b", b"2", tags=("exercises", "stats:u"))
+    cache.set("c", b"3", tags=("stats:u",))
+
+    cache.invalidate("exercises")
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+    assert cache.get("c") == b"3"
+    assert cache.size_bytes == 1
+
+
+def test_cached_routes_see_writes():
+    """Test cached list and stats bodies are never served stale after a write"""
+    params = {"search": "cached lift"}
+    assert client.get("/api/exercises", params=params).json() == []
+    hits = response_cache.hits
+    assert client.get("/api/exercises", params=params).json() == []
+    assert response_cache.hits == hits + 1
+
+    created = client.post(
+        "/api/exercises", json={"name": "Cached Lift", "category": "strength"}
+    )
+    assert created.status_code == 200
+    names = [ex["name"] for ex in client.get("/api/exercises", params=params).json()]
+    assert names == ["Cached Lift"]
+
+    before = client.get("/api/users/me/stats").json()["total_workouts"]
+    workout = client.post("/api/workouts", json={"name": "Cache Check"}).json()
+    client.post(f"/api/workouts/{workout['id']}/complete")
+    after = client.get("/api/users/me/stats").json()["total_workouts"]
+    assert after == before + 1
+
+
+def test_metrics_report_cache():
+    """Test the cache counters are exported on /metrics"""
+    client.get("/api/workout-templates")
+    client.get("/api/workout-templates")
+    body = client.get("/metrics").text
+    assert "velocollab_response_cache_hits_total" in body
+    assert "velocollab_response_cache_entries" in body
+
+
+def test_exercise_lookups_are_cached_per_user():
+    """Test cached lists that can include custom exercises are keyed by user"""
+    response_cache.clear()
+    client.get("/api/exercises", params={"category": "strength"})
+    client.get("/api/exercises/search", params={"q": "squat"})
+    client.get("/api/exercises/autocomplete", params={"prefix": "sq"})
+
+    keys = list(response_cache._entries)
+    assert len(keys) == 3
+    assert all(key[1] == "user_123" for key in keys)
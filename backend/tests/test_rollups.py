@@ -0,0 +1,135 @@
+# Progress rollup tests
+import os
+import sys
+from datetime import date, datetime, timedelta
+
+from fastapi.testclient import TestClient
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from app.main import app
+from app.mock_data import MOCK_EXERCISES
+from app.rollups import (
+    ALL,
+    DAY,
+    MONTH,
+    WEEK,
+    Bucket,
+    ProgressRollups,
+    exercise_series,
+    muscle_series,
+)
+from app.schemas import WorkoutExercise, WorkoutExerciseSet, WorkoutResponse
+
+client = TestClient(app)
+
+BENCH = next(ex for ex in MOCK_EXERCISES if ex.id == "ex_001")
+
+
+def _workout(workout_id, day, reps=5, weight=100.0, status="completed"):
+    when = datetime.combine(day, datetime.min.time()) + timedelta(hours=7)
+    return WorkoutResponse(
+        id=workout_id,
+        user_id="user_123",
+        name="Bench",
+        started_at=when,
+        completed_at=when if status == "completed" else None,
+        duration_seconds=1800,
+        status=status,
+        exercises=[
+            WorkoutExercise(
+                exercise=BENCH,
+                sets=[
+                    WorkoutExerciseSet(
+                        set_number=number, reps=reps, weight=weight, completed=True
+                    )
+                    for number in (1, 2)
+                ],
+            )
+        ],
+    )
+
+
+def _total(points):
+    total = Bucket()
+    for _, bucket in points:
+        total.add(bucket)
+    return total
+
+
+def test_record_and_discard_keep_buckets_exact():
+    """Test edits replace a workout's contribution and deletes remove it"""
+    day = date(2024, 3, 13)
+    rollups = ProgressRollups(
+        [_workout("w1", day), _workout("w2", day, status="planned")]
+    )
+
+    [(period, bucket)] = rollups.query("user_123", day, day, DAY)
+    assert period == day
+    assert (bucket.workouts, bucket.sets, bucket.reps) == (1, 2, 10)
+    assert bucket.tonnage == 1000
+    assert bucket.duration_seconds == 1800
+    chest = rollups.query("user_123", day, day, DAY, muscle_series("Chest"))
+    assert chest[0][1].tonnage == 1000
+
+    rollups.record(_workout("w1", day, reps=3))
+    assert rollups.query("user_123", day, day, DAY)[0][1].reps == 6
+    rollups.discard("w1")
+    assert rollups.query("user_123", day, day, DAY) == []
+    assert rollups.query("user_123", day, day, WEEK, exercise_series("ex_001")) == []
+
+
+def test_coarser_granularities_sum_daily_buckets():
+    """Test weekly and monthly series add up to the daily ones over a range"""
+    first = date(2024, 1, 1)
+    rollups = ProgressRollups(
+        _workout(f"w{index}", first + timedelta(days=3 * index), weight=index)
+        for index in range(40)
+    )
+    start, end = date(2024, 1, 10), date(2024, 3, 20)
+
+    daily = rollups.query("user_123", start, end, DAY)
+    monthly = rollups.query("user_123", start, end, MONTH)
+    assert [period for period, _ in monthly] == [
+        date(2024, 1, 1),
+        date(2024, 2, 1),
+        date(2024, 3, 1),
+    ]
+    assert _total(monthly) == _total(daily)
+    february = [p for p in daily if p[0].month == 2]
+    assert monthly[1][1] == _total(february)
+
+    weekly = rollups.query("user_123", date(2024, 1, 8), end, WEEK)
+    assert weekly[0][0] == date(2024, 1, 8)
+    assert _total(weekly) == _total(
+        rollups.query("user_123", date(2024, 1, 8), date(2024, 3, 24), DAY)
+    )
+
+
+def test_progress_endpoint():
+    """Test the progress route picks a granularity and validates filters"""
+    response = client.get("/api/users/me/progress")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["granularity"] == "week" and body["series"] == ALL
+    assert sum(point["workouts"] for point in body["points"]) >= 2
+
+    today = date.today()
+    daily = client.get(
+        "/api/users/me/progress",
+        params={"start": str(today - timedelta(days=10)), "exercise_id": "ex_001"},
+    ).json()
+    assert daily["granularity"] == "day"
+    assert daily["series"] == "exercise:ex_001"
+
+    both = client.get(
+        "/api/users/me/progress",
+        params={"exercise_id": "ex_001", "muscle_group": "chest"},
+    )
+    assert both.status_code == 400
+    backwards = client.get(
+        "/api/users/me/progress",
+        params={"start": str(today), "end": str(today - timedelta(days=1))},
+    )
+    assert backwards.status_code == 400
@@ -0,0 +1,120 @@
+# Columnar set history tests
+import os
+import sys
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from app.main import app
+from app.mock_data import MOCK_WORKOUTS
+from app.pr_engine import (
+    BEST_DISTANCE,
+    BEST_TIME,
+    ESTIMATED_1RM,
+    MAX_REPS,
+    PREngine,
+)
+from app.set_history import SetHistory
+
+client = TestClient(app)
+
+COMPLETED = [w for w in MOCK_WORKOUTS if w.status == "completed"]
+
+
+def _completed_sets(exercise_id=None):
+    """Reference list of (exercise, set) pairs from the Pydantic models"""
+    return [
+        (we.exercise, s)
+        for w in COMPLETED
+        for we in w.exercises
+        for s in we.sets
+        if s.completed and exercise_id in (None, we.exercise.id)
+    ]
+
+
+def test_volume_and_tonnage_match_reference():
+    """Test vectorized totals agree with a loop over the models"""
+    history = SetHistory(MOCK_WORKOUTS)
+    sets = _completed_sets()
+
+    volume = history.volume("user_123")
+    assert volume["sets"] == len(sets)
+    assert volume["reps"] == sum(s.reps or 0 for _, s in sets)
+    assert history.tonnage("user_123") == sum(
+        s.weight * s.reps for _, s in sets if s.weight is not None and s.reps
+    )
+
+    by_exercise = history.tonnage_by_exercise("user_123")
+    bench = _completed_sets("ex_001")
+    assert by_exercise["ex_001"] == sum(s.weight * s.reps for _, s in bench)
+    assert history.volume("nobody") == {"sets": 0, "reps": 0}
+
+
+def test_best_values_match_pr_engine():
+    """Test best-value queries agree with incremental PR detection"""
+    history = SetHistory(MOCK_WORKOUTS)
+    engine = PREngine()
+    for workout in MOCK_WORKOUTS:
+        engine.record_workout(workout)
+
+    for exercise, _ in _completed_sets():
+        for metric in (ESTIMATED_1RM, MAX_REPS, BEST_TIME, BEST_DISTANCE):
+            expected = engine.best("user_123", exercise.id, metric)
+            actual = history.best("user_123", exercise.id, metric)
+            assert actual == expected, (exercise.id, metric)
+
+
+def test_time_range_and_discard():
+    """Test time filtering and tombstoning a deleted workout"""
+    history = SetHistory(MOCK_WORKOUTS)
+    cutoff = datetime.now() - timedelta(days=2)
+    recent = [w for w in COMPLETED if (w.completed_at or w.started_at) >= cutoff]
+    recent_sets = sum(
+        1 for w in recent for we in w.exercises for s in we.sets if s.completed
+    )
+    assert history.volume("user_123", start=cutoff)["sets"] == recent_sets
+
+    total = len(history)
+    history.discard_workout(recent[0].id)
+    assert len(history) == total - recent_sets
+
+
+def test_growth_keeps_values():
+    """Test columns survive growing past their initial capacity"""
+    history = SetHistory()
+    workout = COMPLETED[0]
+    per_workout = history.append_workout(workout)
+    for index in range(1, 600):
+        history.append_workout(workout.model_copy(update={"id": f"copy_{index}"}))
+
+    assert len(history) == per_workout * 600
+    assert history.tonnage("user_123") == 600 * SetHistory([workout]).tonnage(
+        "user_123"
+    )
+
+
+def test_repeated_updates_keep_columns_bounded():
+    """Test re-appending edited workouts compacts away their old rows"""
+    history = SetHistory(COMPLETED)
+    expected = history.volume("user_123")
+    live = len(history)
+    for _ in range(2000):
+        for workout in COMPLETED:
+            history.discard_workout(workout.id)
+            history.append_workout(workout)
+
+    assert len(history) == live
+    assert history._size <= live + 1024
+    assert len(history._live) <= 4096
+    assert history.volume("user_123") == expected
+
+
+def test_volume_endpoint():
+    """Test the volume endpoint reports the current user's history"""
+    response = client.get("/api/users/me/volume", params={"exercise_id": "ex_001"})
+    assert response.status_code == 200
+    assert response.json()["sets"] == len(_completed_sets("ex_001"))
+    assert response.json()["tonnage"] > 0
@@ -0,0 +1,77 @@
+# Cold start tests
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+SRC = os.path.join(os.path.dirname(__file__), "..", "src")
+
+# Seconds from a fresh interpreter to the first API response, importing the
+# app included; raise it with STARTUP_BUDGET_SECONDS on a slow machine
+STARTUP_BUDGET_SECONDS = float(os.environ.get("STARTUP_BUDGET_SECONDS", 2.0))
+
+COLD_START = """
+import json, time
+
+start = time.perf_counter()
+from app import mock_data, store
+from app.main import app
+
+imported = time.perf_counter() - start
+built = [name for name in mock_data._BUILDERS if name in vars(mock_data)]
+empty = len(store.workout_repository) == 0 and len(store.exercise_catalog) == 0
+
+from fastapi.testclient import TestClient
+
+with TestClient(app) as client:
+    status = client.get("/api/exercises").status_code
+print(json.dumps({
+    "imported": imported,
+    "served": time.perf_counter() - start,
+    "built": built,
+    "empty": empty,
+    "status": status,
+}))
+"""
+
+
+def _cold_start() -> dict:
+    """Time one cold start in a fresh interpreter without a database"""
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if key not in ("DATABASE_URL", "EXERCISE_CATALOG_PATH")
+    }
+    result = subprocess.run(
+        [sys.executable, "-c", COLD_START],
+        cwd=SRC,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+@pytest.fixture(scope="module")
+def cold_starts() -> list[dict]:
+    # Several runs, so one slow run on a busy machine does not fail the budget
+    return [_cold_start() for _ in range(3)]
+
+
+def test_import_builds_no_data(cold_starts):
+    """Test importing the app leaves demo data to the first use"""
+    for run in cold_starts:
+        assert run["built"] == []
+        assert run["empty"]
+        assert run["status"] == 200
+
+
+def test_cold_start_within_budget(cold_starts):
+    """Test a fresh process serves its first request within the budget"""
+    served = min(run["served"] for run in cold_starts)
+    assert (
+        served < STARTUP_BUDGET_SECONDS
+    ), f"cold start took {served:.2f}s, budget {STARTUP_BUDGET_SECONDS}s"
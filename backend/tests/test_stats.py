@@ -0,0 +1,112 @@
+# Statistics engine tests
+import os
+import random
+import sys
+from datetime import date, datetime, timedelta
+
+from fastapi.testclient import TestClient
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from app.main import app
+from app.mock_data import MOCK_EXERCISES, MOCK_WORKOUTS
+from app.schemas import WorkoutExercise, WorkoutResponse
+from app.stats_engine import StatsEngine
+
+client = TestClient(app)
+
+TODAY = date(2024, 3, 1)
+
+
+def _completed(workout_id, days_ago, exercise_ids=(), duration=3600):
+    """Build a completed workout for the test user"""
+    by_id = {ex.id: ex for ex in MOCK_EXERCISES}
+    return WorkoutResponse(
+        id=workout_id,
+        user_id="user_test",
+        name=workout_id,
+        started_at=datetime.combine(
+            TODAY - timedelta(days=days_ago), datetime.min.time()
+        ),
+        duration_seconds=duration,
+        status="completed",
+        exercises=[WorkoutExercise(exercise=by_id[ex_id]) for ex_id in exercise_ids],
+    )
+
+
+def _brute_force_streaks(days):
+    """Reference streak computation over a set of training days"""
+    longest = run = 0
+    previous = None
+    for day in sorted(days):
+        run = run + 1 if previous == day - timedelta(days=1) else 1
+        longest = max(longest, run)
+        previous = day
+    current = 0
+    day = TODAY if TODAY in days else TODAY - timedelta(days=1)
+    while day in days:
+        current += 1
+        day -= timedelta(days=1)
+    return current, longest
+
+
+def test_totals_and_favorites():
+    """Test totals and favorite counts follow record and discard"""
+    engine = StatsEngine()
+    engine.record(_completed("w1", 2, ["ex_001", "ex_003"], duration=1800))
+    engine.record(_completed("w2", 1, ["ex_001"], duration=1800))
+
+    stats = engine.get_stats("user_test", today=TODAY)
+    assert stats["total_workouts"] == 2
+    assert stats["total_duration_hours"] == 1.0
+    assert stats["favorite_exercises"][0] == {"name": "Bench Press", "count": 2}
+
+    engine.discard("w2")
+    stats = engine.get_stats("user_test", today=TODAY)
+    assert stats["total_workouts"] == 1
+    assert stats["favorite_exercises"][0]["count"] == 1
+
+
+def test_streaks_match_brute_force():
+    """Test incremental streaks agree with a full recompute"""
+    rng = random.Random(7)
+    engine = StatsEngine()
+    live: dict[str, int] = {}
+
+    for step in range(400):
+        if live and rng.random() < 0.4:
+            workout_id = rng.choice(sorted(live))
+            engine.discard(workout_id)
+            del live[workout_id]
+        else:
+            workout_id = f"w{step}"
+            live[workout_id] = rng.randrange(30)
+            engine.record(_completed(workout_id, live[workout_id]))
+
+        days = {TODAY - timedelta(days=d) for d in live.values()}
+        stats = engine.get_stats("user_test", today=TODAY)
+        expected = _brute_force_streaks(days)
+        assert (stats["current_streak"], stats["longest_streak"]) == expected
+
+
+def test_planned_workouts_do_not_count():
+    """Test only completed workouts contribute"""
+    engine = StatsEngine(MOCK_WORKOUTS)
+    completed = [w for w in MOCK_WORKOUTS if w.status == "completed"]
+    assert engine.get_stats("user_123")["total_workouts"] == len(completed)
+
+
+def test_stats_endpoint_tracks_completion():
+    """Test completing a workout through the API updates stats"""
+    before = client.get("/api/users/me/stats").json()["total_workouts"]
+
+    created = client.post("/api/workouts", json={"name": "Stats"}).json()
+    assert client.get("/api/users/me/stats").json()["total_workouts"] == before
+
+    response = client.post(f"/api/workouts/{created['id']}/complete")
+    assert response.json()["status"] == "completed"
+    assert client.get("/api/users/me/stats").json()["total_workouts"] == before + 1
+
+    client.delete(f"/api/workouts/{created['id']}")
+    assert client.get("/api/users/me/stats").json()["total_workouts"] == before
@@ -0,0 +1,79 @@
+# Change log and delta sync tests
+import os
+import sys
+
+from fastapi.testclient import TestClient
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from app.change_log import EXERCISE, WORKOUT, ChangeLog
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_change_log_keeps_latest_change_per_record():
+    """Test repeated changes to one record collapse to a single entry"""
+    log = ChangeLog()
+    start = log.head
+    log.record(WORKOUT, "a")
+    middle = log.record(WORKOUT, "b")
+    log.record(WORKOUT, "a")
+    log.record_deletion(WORKOUT, "b")
+
+    assert len(log) == 2
+    assert [(c.id, c.deleted) for c in log.since(start)] == [
+        ("a", False),
+        ("b", True),
+    ]
+    assert [c.id for c in log.since(middle + 1)] == ["b"]
+    assert log.since(log.head) == []
+
+
+def test_change_log_compacts_tombstones():
+    """Test old tombstones are dropped and the floor rises past them"""
+    log = ChangeLog(max_tombstones=4)
+    start = log.head
+    log.record(EXERCISE, "kept")
+    for index in range(5):
+        log.record_deletion(WORKOUT, f"w{index}")
+
+    assert len(log) == 3
+    assert log.needs_reset(start)
+    assert not log.needs_reset(log.floor)
+    assert [c.id for c in log.since(log.floor)] == ["w3", "w4"]
+    assert log.needs_reset(log.head + 1)
+
+
+def test_sync_returns_only_changes():
+    """Test a device receives a snapshot, then just the deltas"""
+    snapshot = client.get("/api/sync").json()
+    assert snapshot["reset"] is True
+    assert snapshot["workouts"]
+    assert snapshot["exercises"]
+    cursor = snapshot["cursor"]
+
+    assert client.get("/api/sync", params={"since": cursor}).json() == {
+        "cursor": cursor,
+        "reset": False,
+        "workouts": [],
+        "exercises": [],
+        "deleted_workouts": [],
+        "deleted_exercises": [],
+    }
+
+    kept = client.post("/api/workouts", json={"name": "Synced"}).json()["id"]
+    client.put(f"/api/workouts/{kept}", json={"name": "Synced again"})
+    dropped = client.post("/api/workouts", json={"name": "Dropped"}).json()["id"]
+    client.delete(f"/api/workouts/{dropped}")
+    exercise = client.post(
+        "/api/exercises", json={"name": "Synced Lift", "category": "strength"}
+    ).json()
+
+    delta = client.get("/api/sync", params={"since": cursor}).json()
+    assert delta["reset"] is False
+    assert [w["name"] for w in delta["workouts"]] == ["Synced again"]
+    assert delta["deleted_workouts"] == [dropped]
+    assert [e["id"] for e in delta["exercises"]] == [exercise["id"]]
+    assert delta["cursor"] > cursor
@@ -0,0 +1,140 @@
+# Multi-worker shared state tests
+import asyncio
+import os
+import sys
+
+from fastapi.testclient import TestClient
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from app import change_feed, database, persistence, store
+from app.change_log import WORKOUT, Change, ChangeLog
+from app.config import settings
+from app.main import app
+from app.mock_data import MOCK_EXERCISES, MOCK_WORKOUTS, WORKOUT_TEMPLATES
+from app.versions import WORKOUTS, ResourceVersions
+
+
+def _database_url(tmp_path):
+    return f"sqlite+aiosqlite:///{tmp_path / 'test.db'}"
+
+
+def test_change_table_keeps_latest_change_per_record(tmp_path, monkeypatch):
+    """Test each write renumbers its records and a feed reads past its cursor"""
+    monkeypatch.setattr(change_feed, "publishing", True)
+
+    async def scenario():
+        await database.init_database(_database_url(tmp_path))
+        try:
+            feed = change_feed.ChangeFeed()
+            async with database.session_scope() as session:
+                await persistence.seed(session, MOCK_EXERCISES, MOCK_WORKOUTS[:2])
+                await feed.start(session)
+            async with database.session_scope() as session:
+                await persistence.save_workout(session, MOCK_WORKOUTS[0])
+                await persistence.delete_workout(session, MOCK_WORKOUTS[1].id)
+                await persistence.save_workout(session, MOCK_WORKOUTS[0])
+            async with database.session_scope() as session:
+                first = await feed.poll(session)
+                second = await feed.poll(session)
+            return first, second
+        finally:
+            await database.close_database()
+
+    first, second = asyncio.run(scenario())
+    changes = [(change.id, change.deleted, own) for change, own in first]
+    assert changes == [
+        (MOCK_WORKOUTS[1].id, True, True),
+        (MOCK_WORKOUTS[0].id, False, True),
+    ]
+    assert first[0][0].seq < first[1][0].seq
+    assert second == []
+
+
+def test_single_process_writes_skip_change_table(tmp_path):
+    """Test nothing is numbered into the change table unless workers share it"""
+
+    async def scenario():
+        await database.init_database(_database_url(tmp_path))
+        try:
+            async with database.session_scope() as session:
+                await persistence.seed(session, MOCK_EXERCISES, MOCK_WORKOUTS[:2])
+                await persistence.delete_workout(session, MOCK_WORKOUTS[1].id)
+            async with database.session_scope() as session:
+                return await change_feed.head(session)
+        finally:
+            await database.close_database()
+
+    assert asyncio.run(scenario()) == 0
+
+
+def test_shared_change_log_takes_sequences_from_replay():
+    """Test local records are ignored once sequences come from the database"""
+    log = ChangeLog()
+    log.shared = True
+    log.reset(100)
+    assert log.record(WORKOUT, "a") == 100
+    assert log.since(100) == []
+
+    log.replay(Change(WORKOUT, "a", 105))
+    log.replay(Change(WORKOUT, "b", 107, deleted=True))
+    assert [change.id for change in log.since(100)] == ["a", "b"]
+    assert log.head == 107 and not log.needs_reset(100)
+
+
+def test_workers_pick_up_each_others_writes(tmp_path, monkeypatch):
+    """Test writes committed by another worker are applied before each request"""
+    monkeypatch.setattr(settings, "database_url", _database_url(tmp_path))
+    monkeypatch.setattr(change_feed, "publishing", True)
+    monkeypatch.setattr(store.change_feed, "active", True)
+    monkeypatch.setattr(store.change_log, "shared", True)
+    remote = MOCK_WORKOUTS[0].model_copy(update={"id": "remote", "name": "Remote"})
+
+    async def other_worker():
+        monkeypatch.setattr(change_feed, "origin", "other-worker")
+        try:
+            async with database.session_scope() as session:
+                await persistence.save_workout(session, remote)
+                await persistence.delete_workout(session, "workout_002")
+        finally:
+            monkeypatch.setattr(change_feed, "origin", change_feed._new_origin())
+
+    try:
+        with TestClient(app) as client:
+            cursor = client.get("/api/sync").json()["cursor"]
+            local = client.post("/api/workouts", json={"name": "Local"}).json()
+            client.portal.call(other_worker)
+
+            assert client.get("/api/workouts/remote").json()["name"] == "Remote"
+            assert client.get("/api/workouts/workout_002").status_code == 404
+            delta = client.get("/api/sync", params={"since": cursor}).json()
+            assert not delta["reset"]
+            assert [w["id"] for w in delta["workouts"]] == [local["id"], "remote"]
+            assert delta["deleted_workouts"] == ["workout_002"]
+            again = client.get("/api/sync", params={"since": delta["cursor"]}).json()
+            assert again["workouts"] == [] and again["deleted_workouts"] == []
+    finally:
+        monkeypatch.undo()
+        store.restore(MOCK_EXERCISES, MOCK_WORKOUTS + WORKOUT_TEMPLATES)
+
+
+def test_forked_workers_draw_their_own_etag_epoch():
+    """Test workers bumping the same counters never hand out the same ETag"""
+    versions = ResourceVersions()
+    versions.bump(WORKOUTS)
+    read, write = os.pipe()
+    pid = os.fork()
+    if not pid:
+        os.close(read)
+        versions.bump(WORKOUTS)
+        os.write(write, versions.etag(WORKOUTS).encode())
+        os._exit(0)
+    os.close(write)
+    with os.fdopen(read) as pipe:
+        child = pipe.read()
+    os.waitpid(pid, 0)
+
+    versions.bump(WORKOUTS)
+    assert child.endswith('-2"') and versions.etag(WORKOUTS).endswith('-2"')
+    assert child != versions.etag(WORKOUTS)
@@ -0,0 +1,265 @@
+# Workout repository and workout route tests
+import os
+import sys
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.testclient import TestClient
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from app.main import app
+from app.mock_data import MOCK_WORKOUTS, WORKOUT_TEMPLATES
+from app.pagination import encode_cursor
+from app.schemas import WorkoutResponse
+from app.store import template_repository, workout_repository
+from app.workout_repository import WorkoutRepository, instantiate_template
+
+client = TestClient(app)
+
+
+def test_repository_get_put_delete():
+    """Test ID lookups, replacement and deletion"""
+    repository = WorkoutRepository(MOCK_WORKOUTS)
+    first = MOCK_WORKOUTS[0]
+
+    assert repository.get(first.id) is first
+    assert len(repository) == len(MOCK_WORKOUTS)
+
+    replacement = first.model_copy(update={"name": "Renamed"})
+    repository.put(replacement)
+    assert repository.get(first.id) is replacement
+    assert len(repository) == len(MOCK_WORKOUTS)
+
+    assert repository.delete(first.id) is replacement
+    assert repository.delete(first.id) is None
+    assert first.id not in repository
+    assert first.id not in [w.id for w in repository.by_started_at()]
+
+
+def test_repository_started_at_ordering():
+    """Test chronological ordering and date-range queries"""
+    repository = WorkoutRepository(MOCK_WORKOUTS)
+    expected = sorted(MOCK_WORKOUTS, key=lambda w: w.started_at)
+    assert repository.by_started_at() == expected
+    assert repository.by_started_at(descending=True) == expected[::-1]
+
+    cutoff = datetime.now() - timedelta(days=4)
+    recent = repository.started_between(start=cutoff)
+    assert recent == [w for w in expected if w.started_at >= cutoff]
+    older = repository.started_between(end=cutoff)
+    assert older == [w for w in expected if w.started_at < cutoff]
+
+
+def test_workout_lifecycle():
+    """Test creating, fetching, updating and deleting a workout"""
+    response = client.post(
+        "/api/workouts", json={"name": "Lifecycle", "template_id": "template_001"}
+    )
+    assert response.status_code == 200
+    created = response.json()
+    assert len(created["exercises"]) > 0
+
+    response = client.get(f"/api/workouts/{created['id']}")
+    assert response.status_code == 200
+
+    response = client.put(
+        f"/api/workouts/{created['id']}", json={"name": "Lifecycle Updated"}
+    )
+    assert response.json()["name"] == "Lifecycle Updated"
+
+    response = client.delete(f"/api/workouts/{created['id']}")
+    assert response.json()["success"] is True
+
+    response = client.get(f"/api/workouts/{created['id']}")
+    assert response.status_code == 404
+
+
+def test_template_instances_share_structure_copy_on_write():
+    """Test workouts share template slots until a set is edited"""
+    template = WORKOUT_TEMPLATES[0]
+    slots = instantiate_template(template)
+    assert slots is not template.exercises
+    assert all(a is b for a, b in zip(slots, template.exercises, strict=True))
+    with pytest.raises(ValueError):
+        slots[0].sets[0].reps = 99
+
+    created = client.post(
+        "/api/workouts", json={"name": "Shared", "template_id": template.id}
+    ).json()
+    stored = workout_repository.get(created["id"])
+    assert stored.exercises[1] is template_repository.get(template.id).exercises[1]
+
+    before = template.exercises[0].sets[0]
+    with client.websocket_connect(f"/api/workouts/{created['id']}/live") as ws:
+        ws.receive_json()
+        ws.send_json({"type": "set", "exercise_index": 0, "set_number": 1, "reps": 1})
+        ws.receive_json()
+    assert template.exercises[0].sets[0] is before
+    assert client.get(f"/api/workouts/{template.id}").json() == jsonable_encoder(
+        template
+    )
+
+
+def test_get_template_by_id():
+    """Test templates are reachable through the workout detail route"""
+    response = client.get("/api/workouts/template_002")
+    assert response.status_code == 200
+    assert response.json()["is_template"] is True
+
+
+def test_workouts_cursor_pagination():
+    """Test walking every page yields each workout once, newest first"""
+    expected = client.get("/api/workouts", params={"limit": 100}).json()
+    assert [w["started_at"] for w in expected] == sorted(
+        (w["started_at"] for w in expected), reverse=True
+    )
+
+    seen = []
+    params = {"limit": 2}
+    while True:
+        response = client.get("/api/workouts", params=params)
+        seen.extend(w["id"] for w in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        params["cursor"] = cursor
+
+    assert seen == [w["id"] for w in expected]
+
+
+def test_workouts_date_range_and_templates():
+    """Test date bounds and merging templates into the ordering"""
+    cutoff = (datetime.now() - timedelta(days=4)).isoformat()
+    response = client.get("/api/workouts", params={"started_before": cutoff})
+    assert response.json()
+    assert all(w["started_at"] < cutoff for w in response.json())
+
+    response = client.get(
+        "/api/workouts", params={"include_templates": True, "status": "template"}
+    )
+    assert {w["id"] for w in response.json()} == {"template_001", "template_002"}
+
+
+def test_workouts_bounds_and_cursor_with_utc_offset():
+    """Test offset-aware bounds and cursors are compared as local time"""
+    now = datetime.now()
+    cutoff = now - timedelta(days=4)
+    response = client.get(
+        "/api/workouts",
+        params={"started_before": cutoff.astimezone(UTC).isoformat()},
+    )
+    assert response.status_code == 200
+    naive = client.get("/api/workouts", params={"started_before": cutoff.isoformat()})
+    assert response.json() == naive.json()
+
+    response = client.get(
+        "/api/workouts", params={"started_after": "2000-01-01T00:00:00Z"}
+    )
+    assert response.status_code == 200
+    assert response.json()
+
+    cursor = encode_cursor((now.astimezone(UTC), "workout_zzz"))
+    response = client.get("/api/workouts", params={"cursor": cursor})
+    assert response.status_code == 200
+    assert response.json()
+
+
+def test_workouts_invalid_cursor():
+    """Test a malformed cursor is rejected"""
+    response = client.get("/api/workouts", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+def test_summary_cache_invalidated_on_put():
+    """Test cached summaries are reused until the workout is saved again"""
+    repository = WorkoutRepository(MOCK_WORKOUTS)
+    workout = MOCK_WORKOUTS[0]
+
+    summary = repository.summary(workout)
+    assert summary.exercise_count == len(workout.exercises)
+    assert repository.summary(workout) is summary
+
+    renamed = workout.model_copy(update={"name": "Renamed"})
+    repository.put(renamed)
+    assert repository.summary(renamed).name == "Renamed"
+
+
+def test_list_reflects_update():
+    """Test list endpoints serve fresh summaries after an update"""
+    created = client.post("/api/workouts", json={"name": "Before"}).json()
+    client.get("/api/workouts")
+    client.put(f"/api/workouts/{created['id']}", json={"name": "After"})
+
+    names = {w["id"]: w["name"] for w in client.get("/api/workouts").json()}
+    assert names[created["id"]] == "After"
+    client.delete(f"/api/workouts/{created['id']}")
+
+
+def test_trusted_response_matches_standard_serialization():
+    """Test the fast JSON path returns what response_model would produce"""
+    workout = MOCK_WORKOUTS[0]
+    response = client.get(f"/api/workouts/{workout.id}")
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == jsonable_encoder(
+        WorkoutResponse.model_validate(workout.model_dump())
+    )
+
+
+def test_trusted_routes_keep_openapi_schema():
+    """Test fast routes still document their response models"""
+    paths = app.openapi()["paths"]
+    schema = paths["/api/workouts/{workout_id}"]["get"]["responses"]["200"]
+    assert schema["content"]["application/json"]["schema"] == {
+        "$ref": "#/components/schemas/WorkoutResponse"
+    }
+    schema = paths["/api/workouts"]["get"]["responses"]["200"]
+    items = schema["content"]["application/json"]["schema"]["items"]
+    assert items == {"$ref": "#/components/schemas/WorkoutSummary"}
+
+
+def test_workout_etag_revalidation():
+    """Test If-None-Match returns 304 until the workout changes"""
+    created = client.post("/api/workouts", json={"name": "Tagged"}).json()
+    url = f"/api/workouts/{created['id']}"
+
+    response = client.get(url)
+    etag = response.headers["ETag"]
+    assert etag.startswith('"')
+
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+    list_etag = client.get("/api/workouts").headers["ETag"]
+    client.put(url, json={"name": "Retagged"})
+
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()["name"] == "Retagged"
+    response = client.get("/api/workouts", headers={"If-None-Match": list_etag})
+    assert response.status_code == 200
+
+    client.delete(url)
+
+
+def test_catalog_and_template_etags():
+    """Test catalog ETags change on exercise creation, templates stay stable"""
+    etag = client.get("/api/exercises").headers["ETag"]
+    filtered = client.get("/api/exercises", params={"category": "strength"})
+    assert filtered.headers["ETag"] == etag
+    response = client.get("/api/exercises", headers={"If-None-Match": f"W/{etag}"})
+    assert response.status_code == 304
+
+    client.post("/api/exercises", json={"name": "Etag Curl", "category": "strength"})
+    response = client.get("/api/exercises", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+    etag = client.get("/api/workout-templates").headers["ETag"]
+    client.post("/api/workouts", json={"name": "Unrelated"})
+    response = client.get("/api/workout-templates", headers={"If-None-Match": etag})
+    assert response.status_code == 304
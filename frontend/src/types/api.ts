@@ -78,6 +78,7 @@ export interface UserStats {
   }>;
   recent_prs: Array<{
     exercise: string;
+    metric: string;
     value: string;
     date: string;
   }>;